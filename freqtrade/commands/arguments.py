@@ -58,6 +58,8 @@ ARGS_BACKTEST = [
     "backtest_cache",
     "freqai_backtest_live_models",
     "backtest_notes",
+    "analyze_workers",
+    "strategy_workers",
 ]
 
 ARGS_HYPEROPT = [
@@ -80,6 +82,7 @@ ARGS_HYPEROPT = [
     "hyperopt_ignore_missing_space",
     "analyze_per_epoch",
     "early_stop",
+    "analyze_workers",
 ]
 
 ARGS_EDGE = [*ARGS_COMMON_OPTIMIZE]
@@ -251,10 +254,30 @@ ARGS_STRATEGY_UPDATER = ["strategy_list", "strategy_path", "recursive_strategy_s
 ARGS_LOOKAHEAD_ANALYSIS = [
     a
     for a in ARGS_BACKTEST
-    if a not in ("position_stacking", "backtest_cache", "backtest_breakdown", "backtest_notes")
-] + ["minimum_trade_amount", "targeted_trade_amount", "lookahead_analysis_exportfilename"]
+    if a
+    not in (
+        "position_stacking",
+        "backtest_cache",
+        "backtest_breakdown",
+        "backtest_notes",
+        "analyze_workers",
+        "strategy_workers",
+    )
+] + [
+    "minimum_trade_amount",
+    "targeted_trade_amount",
+    "lookahead_analysis_exportfilename",
+    "analysis_jobs",
+]
 
-ARGS_RECURSIVE_ANALYSIS = ["timeframe", "timerange", "dataformat_ohlcv", "pairs", "startup_candle"]
+ARGS_RECURSIVE_ANALYSIS = [
+    "timeframe",
+    "timerange",
+    "dataformat_ohlcv",
+    "pairs",
+    "startup_candle",
+    "analysis_jobs",
+]
 
 # Command level configs - keep at the bottom of the above definitions
 NO_CONF_REQURIED = [
@@ -209,6 +209,13 @@ AVAILABLE_CLI_OPTIONS = {
         help="Add notes to the backtest results.",
         metavar="TEXT",
     ),
+    "strategy_workers": Arg(
+        "--strategy-workers",
+        help="Number of processes used to backtest the strategies of `--strategy-list` "
+        "concurrently (default: 1).",
+        type=check_int_positive,
+        metavar="INT",
+    ),
     "exportfilename": Arg(
         "--export-filename",
         "--backtest-filename",
@@ -290,6 +297,13 @@ AVAILABLE_CLI_OPTIONS = {
         action="store_true",
         default=False,
     ),
+    "analyze_workers": Arg(
+        "--analyze-workers",
+        help="Number of threads used to populate indicators and signals for multiple pairs "
+        "concurrently. Only use with strategies which are thread-safe (default: 1).",
+        type=check_int_positive,
+        metavar="INT",
+    ),
     "print_all": Arg(
         "--print-all",
         help="Print all results, not only the best ones.",
@@ -789,6 +803,15 @@ AVAILABLE_CLI_OPTIONS = {
         help="Specify startup candles to be checked (`199`, `499`, `999`, `1999`).",
         nargs="+",
     ),
+    "analysis_jobs": Arg(
+        "-j",
+        "--job-workers",
+        help="The number of concurrently running partial backtests (worker processes). "
+        "If -1, all CPUs are used, for -2, all CPUs but one are used, etc. "
+        "If 1 (default) is given, no parallel computing code is used at all.",
+        type=int,
+        metavar="JOBS",
+    ),
     "show_sensitive": Arg(
         "--show-sensitive",
         help="Show secrets in the output.",
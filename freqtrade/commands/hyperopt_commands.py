@@ -30,8 +30,10 @@ def start_hyperopt_list(args: dict[str, Any]) -> None:
         config["user_data_dir"] / "hyperopt_results", config.get("hyperoptexportfilename")
     )
 
-    # Previous evaluations
-    epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, config)
+    # Previous evaluations - table output only requires the index metrics
+    epochs, total_epochs = HyperoptTools.load_filtered_results(
+        results_file, config, metrics_only=True
+    )
 
     if not export_csv:
         try:
@@ -49,11 +51,13 @@ def start_hyperopt_list(args: dict[str, Any]) -> None:
 
     if epochs and not no_details:
         sorted_epochs = sorted(epochs, key=itemgetter("loss"))
-        results = sorted_epochs[0]
+        results = HyperoptTools.load_epochs(results_file, sorted_epochs[:1])[0]
         HyperoptTools.show_epoch_details(results, total_epochs, print_json, no_header)
 
     if epochs and export_csv:
-        HyperoptTools.export_csv_file(config, epochs, export_csv)
+        HyperoptTools.export_csv_file(
+            config, HyperoptTools.load_epochs(results_file, epochs), export_csv
+        )
 
 
 def start_hyperopt_show(args: dict[str, Any]) -> None:
@@ -76,7 +80,9 @@ def start_hyperopt_show(args: dict[str, Any]) -> None:
     n = config.get("hyperopt_show_index", -1)
 
     # Previous evaluations
-    epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, config)
+    epochs, total_epochs = HyperoptTools.load_filtered_results(
+        results_file, config, metrics_only=True
+    )
 
     filtered_epochs = len(epochs)
 
@@ -94,17 +100,25 @@ def start_hyperopt_show(args: dict[str, Any]) -> None:
         n -= 1
 
     if epochs:
-        val = epochs[n]
+        val = HyperoptTools.load_epochs(results_file, [epochs[n]])[0]
 
         metrics = val["results_metrics"]
         if "strategy_name" in metrics:
             strategy_name = metrics["strategy_name"]
-            show_backtest_result(
-                strategy_name,
-                metrics,
-                metrics["stake_currency"],
-                config.get("backtest_breakdown", []),
-            )
+            if "trades" in metrics:
+                show_backtest_result(
+                    strategy_name,
+                    metrics,
+                    metrics["stake_currency"],
+                    config.get("backtest_breakdown", []),
+                )
+            else:
+                # Only key metrics are stored for epochs which were not the best at the time.
+                logger.warning(
+                    "Detailed backtest results are not available for this epoch. "
+                    "They are only stored for epochs which were the best at the time, "
+                    "or for all epochs when hyperopt runs with `--print-all`."
+                )
 
             HyperoptTools.try_export_params(config, strategy_name, val)
 
@@ -218,6 +218,23 @@ CONF_SCHEMA = {
             "type": "array",
             "items": {"type": "string", "enum": BACKTEST_BREAKDOWNS},
         },
+        "analyze_workers": {
+            "description": (
+                "Number of threads used to analyze pairs concurrently in backtesting and hyperopt."
+            ),
+            "type": "integer",
+            "minimum": 1,
+            "default": 1,
+        },
+        "strategy_workers": {
+            "description": (
+                "Number of processes used to backtest the strategies of the strategy list "
+                "concurrently."
+            ),
+            "type": "integer",
+            "minimum": 1,
+            "default": 1,
+        },
         "bot_name": {
             "description": "Name of the trading bot. Passed via API to a client.",
             "type": "string",
@@ -679,6 +696,23 @@ CONF_SCHEMA = {
                     "type": "string",
                     "enum": ["error", "info"],
                 },
+                "backtest_workers": {
+                    "description": (
+                        "Number of worker processes for concurrent backtest jobs (webserver mode)."
+                    ),
+                    "type": "integer",
+                    "minimum": 1,
+                    "default": 2,
+                },
+                "backtest_memory_mb": {
+                    "description": (
+                        "Memory (in MB) available to keep loaded backtest data for reuse, "
+                        "per process (webserver mode)."
+                    ),
+                    "type": "number",
+                    "minimum": 0,
+                    "default": 2048,
+                },
             },
             "required": ["enabled", "listen_ip_address", "listen_port", "username", "password"],
         },
@@ -727,6 +761,14 @@ CONF_SCHEMA = {
                     "description": "Enable systemd notify.",
                     "type": "boolean",
                 },
+                "wakeup_on_candle_close": {
+                    "description": (
+                        "Start a new bot iteration as soon as a candle closes (requires "
+                        "websocket support)."
+                    ),
+                    "type": "boolean",
+                    "default": False,
+                },
             },
         },
         "dataformat_ohlcv": {
@@ -893,6 +935,21 @@ CONF_SCHEMA = {
                     "type": "boolean",
                     "default": True,
                 },
+                "ws_ingest_all": {
+                    "description": (
+                        "Stream candles for all whitelisted and informative pairs via WebSocket."
+                    ),
+                    "type": "boolean",
+                    "default": False,
+                },
+                "ws_reconcile_interval": {
+                    "description": (
+                        "Interval in minutes to reconcile WebSocket candles with the REST API."
+                    ),
+                    "type": "integer",
+                    "minimum": 1,
+                    "default": 60,
+                },
                 "unknown_fee_rate": {
                     "description": "Fee rate for unknown markets.",
                     "type": "number",
@@ -310,6 +310,8 @@ class Configuration:
             ("disableparamexport", "Parameter --disableparamexport detected: {} ..."),
             ("freqai_backtest_live_models", "Parameter --freqai-backtest-live-models detected ..."),
             ("backtest_notes", "Parameter --notes detected: {} ..."),
+            ("analyze_workers", "Parameter --analyze-workers detected: {} ..."),
+            ("strategy_workers", "Parameter --strategy-workers detected: {} ..."),
         ]
         self._args_to_config_loop(config, configurations)
 
@@ -423,6 +425,7 @@ class Configuration:
             ("minimum_trade_amount", "Minimum Trade amount: {}"),
             ("lookahead_analysis_exportfilename", "Path to store lookahead-analysis-results: {}"),
             ("startup_candle", "Startup candle to be used on recursive analysis: {}"),
+            ("analysis_jobs", "Parameter -j/--job-workers detected: {}"),
         ]
         self._args_to_config_loop(config, configurations)
 
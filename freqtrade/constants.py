@@ -97,6 +97,7 @@ TRADING_MODES = ["spot", "margin", "futures"]
 MARGIN_MODES = ["cross", "isolated", ""]
 
 LAST_BT_RESULT_FN = ".last_result.json"
+BT_RESULT_INDEX_FN = ".backtest_index.json"
 FTHYPT_FILEVERSION = "fthypt_fileversion"
 
 USERPATH_HYPEROPTS = "hyperopts"
@@ -109,6 +110,8 @@ WEBHOOK_FORMAT_OPTIONS = ["form", "json", "raw"]
 FULL_DATAFRAME_THRESHOLD = 100
 CUSTOM_TAG_MAX_LENGTH = 255
 DL_DATA_TIMEFRAMES = ["1m", "5m"]
+# Number of pair / timeframe combinations download-data downloads concurrently
+DL_DATA_CONCURRENCY = 8
 
 ENV_VAR_PREFIX = "FREQTRADE__"
 
@@ -12,8 +12,9 @@ from typing import Any, Literal
 
 import numpy as np
 import pandas as pd
+import rapidjson
 
-from freqtrade.constants import LAST_BT_RESULT_FN
+from freqtrade.constants import BT_RESULT_INDEX_FN, LAST_BT_RESULT_FN
 from freqtrade.exceptions import ConfigurationError, OperationalException
 from freqtrade.ft_types import BacktestHistoryEntryType, BacktestResultType
 from freqtrade.misc import file_dump_json, json_load
@@ -155,11 +156,10 @@ def load_backtest_metadata(filename: Path | str) -> dict[str, Any]:
         raise OperationalException("Unexpected error while loading backtest metadata.") from e
 
 
-def load_backtest_stats(filename: Path | str) -> BacktestResultType:
+def _get_backtest_stats_filename(filename: Path | str) -> Path:
     """
-    Load backtest statistics file.
-    :param filename: pathlib.Path object, or string pointing to the file.
-    :return: a dictionary containing the resulting file.
+    Resolve the backtest result file - using the latest result if a directory is given.
+    :raises: ValueError if the file does not exist.
     """
     if isinstance(filename, str):
         filename = Path(filename)
@@ -167,6 +167,49 @@ def load_backtest_stats(filename: Path | str) -> BacktestResultType:
         filename = filename / get_latest_backtest_filename(filename)
     if not filename.is_file():
         raise ValueError(f"File {filename} does not exist.")
+    return filename
+
+
+def _load_backtest_trades(filename: Path, strategy: str) -> pd.DataFrame:
+    """
+    Load the trades of one strategy, stored as parquet within the backtest zip file.
+    :param filename: Path to the backtest zip file
+    :param strategy: Strategy to load trades for
+    :return: Dataframe with one row per trade
+    """
+    data = load_file_from_zip(filename, f"{filename.stem}_{strategy}_trades.parquet")
+    df = pd.read_parquet(BytesIO(data))
+    if "orders" in df.columns:
+        df["orders"] = df["orders"].map(
+            lambda orders: (
+                rapidjson.loads(orders, number_mode=rapidjson.NM_NATIVE)
+                if isinstance(orders, str)
+                else orders
+            )
+        )
+    return df
+
+
+def _trades_df_to_list(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """
+    Convert a trades dataframe to the list of dicts format used in the backtest statistics.
+    Dates are converted to strings and missing values to None - matching the json format.
+    """
+    df = df.copy()
+    for col in df.select_dtypes(include=["datetime", "datetimetz"]).columns:
+        df[col] = df[col].astype(str)
+    return df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+
+def load_backtest_stats(filename: Path | str, include_trades: bool = True) -> BacktestResultType:
+    """
+    Load backtest statistics file.
+    :param filename: pathlib.Path object, or string pointing to the file.
+    :param include_trades: Load trades stored separately within the zip file.
+        If False, strategies with separately stored trades won't contain the "trades" key.
+    :return: a dictionary containing the resulting file.
+    """
+    filename = _get_backtest_stats_filename(filename)
     logger.info(f"Loading backtest result from {filename}")
 
     if filename.suffix == ".zip":
@@ -175,6 +218,12 @@ def load_backtest_stats(filename: Path | str) -> BacktestResultType:
                 load_file_from_zip(filename, filename.with_suffix(".json").name).decode("utf-8")
             )
         )
+        if include_trades and isinstance(data, dict):
+            for strategy, strat_stats in data.get("strategy", {}).items():
+                if "trades" not in strat_stats:
+                    strat_stats["trades"] = _trades_df_to_list(
+                        _load_backtest_trades(filename, strategy)
+                    )
     else:
         with filename.open() as file:
             data = json_load(file)
@@ -206,7 +255,12 @@ def load_and_merge_backtest_result(strategy_name: str, filename: Path, results:
 
 def _get_backtest_files(dirname: Path) -> list[Path]:
     # Get both json and zip files separately and combine the results
-    json_files = dirname.glob("backtest-result-*-[0-9][0-9]*.json")
+    # Metadata files (*.meta.json) belong to a result file, and are not results on their own.
+    json_files = (
+        f
+        for f in dirname.glob("backtest-result-*-[0-9][0-9]*.json")
+        if not f.name.endswith(".meta.json")
+    )
     zip_files = dirname.glob("backtest-result-*-[0-9][0-9]*.zip")
     return list(reversed(sorted(list(json_files) + list(zip_files))))
 
@@ -238,15 +292,77 @@ def get_backtest_result(filename: Path) -> list[BacktestHistoryEntryType]:
     return _extract_backtest_result(filename)
 
 
+def _get_metadata_mtime(filename: Path) -> int | None:
+    try:
+        return get_backtest_metadata_filename(filename).stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _load_backtest_index(dirname: Path) -> dict[str, Any]:
+    """
+    Load the backtest result index of a directory.
+    Returns an empty index if the file does not exist or can't be read.
+    """
+    try:
+        with (dirname / BT_RESULT_INDEX_FN).open() as fp:
+            index = json_load(fp)
+        return index if isinstance(index, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception:
+        logger.warning(f"Could not read backtest result index in {dirname}, rebuilding.")
+        return {}
+
+
+def _store_backtest_index(dirname: Path, index: dict[str, Any]) -> None:
+    try:
+        file_dump_json(dirname / BT_RESULT_INDEX_FN, index, log=False)
+    except OSError as e:
+        logger.debug(f"Could not write backtest result index: {e}")
+
+
+def _update_backtest_index(filename: Path) -> None:
+    """
+    Refresh (or remove) the index entry for one backtest result file.
+    """
+    dirname = filename.parent
+    index = _load_backtest_index(dirname)
+    if not index:
+        # No index yet - it'll be built on the next listing.
+        return
+    if filename.is_file():
+        index[filename.name] = {
+            "mtime": _get_metadata_mtime(filename),
+            "results": _extract_backtest_result(filename),
+        }
+    else:
+        index.pop(filename.name, None)
+    _store_backtest_index(dirname, index)
+
+
 def get_backtest_resultlist(dirname: Path) -> list[BacktestHistoryEntryType]:
     """
-    Get list of backtest results read from metadata files
+    Get list of backtest results.
+    Uses the directory index ('.backtest_index.json'), only reading metadata files
+    which are new or have changed since the index was last written.
     """
-    return [
-        result
-        for filename in _get_backtest_files(dirname)
-        for result in _extract_backtest_result(filename)
-    ]
+    index = _load_backtest_index(dirname)
+    new_index: dict[str, Any] = {}
+    changed = False
+    results: list[BacktestHistoryEntryType] = []
+    for filename in _get_backtest_files(dirname):
+        mtime = _get_metadata_mtime(filename)
+        entry = index.get(filename.name)
+        if not entry or entry.get("mtime") != mtime:
+            entry = {"mtime": mtime, "results": _extract_backtest_result(filename)}
+            changed = True
+        new_index[filename.name] = entry
+        results.extend(entry["results"])
+
+    if changed or new_index.keys() != index.keys():
+        _store_backtest_index(dirname, new_index)
+    return results
 
 
 def delete_backtest_result(file_abs: Path):
@@ -259,6 +375,7 @@ def delete_backtest_result(file_abs: Path):
     for file in file_abs.parent.glob(f"{file_abs.stem}*"):
         logger.info(f"Deleting file: {file}")
         file.unlink()
+    _update_backtest_index(file_abs)
 
 
 def update_backtest_metadata(filename: Path, strategy: str, content: dict[str, Any]):
@@ -274,6 +391,7 @@ def update_backtest_metadata(filename: Path, strategy: str, content: dict[str, A
     metadata[strategy].update(content)
     # Write data again.
     file_dump_json(get_backtest_metadata_filename(filename), metadata)
+    _update_backtest_index(filename)
 
 
 def get_backtest_market_change(filename: Path, include_ts: bool = True) -> pd.DataFrame:
@@ -371,7 +489,7 @@ def load_backtest_data(filename: Path | str, strategy: str | None = None) -> pd.
     :return: a dataframe with the analysis results
     :raise: ValueError if loading goes wrong.
     """
-    data = load_backtest_stats(filename)
+    data = load_backtest_stats(filename, include_trades=False)
     if not isinstance(data, list):
         # new, nested format
         if "strategy" not in data:
@@ -392,8 +510,12 @@ def load_backtest_data(filename: Path | str, strategy: str | None = None) -> pd.
                 f"Available strategies are '{','.join(data['strategy'].keys())}'"
             )
 
-        data = data["strategy"][strategy]["trades"]
-        df = pd.DataFrame(data)
+        strat_stats = data["strategy"][strategy]
+        if "trades" in strat_stats:
+            df = pd.DataFrame(strat_stats["trades"])
+        else:
+            # Trades stored separately as parquet
+            df = _load_backtest_trades(_get_backtest_stats_filename(filename), strategy)
         if not df.empty:
             df = _load_backtest_data_df_compatibility(df)
 
@@ -17,6 +17,7 @@ from freqtrade.data.converter.trade_converter import (
     trades_dict_to_list,
     trades_list_to_df,
     trades_to_ohlcv,
+    trades_to_ohlcv_multi,
 )
 
 
@@ -37,4 +38,5 @@ __all__ = [
     "trades_dict_to_list",
     "trades_list_to_df",
     "trades_to_ohlcv",
+    "trades_to_ohlcv_multi",
 ]
@@ -36,22 +36,35 @@ def ohlcv_to_dataframe(
     """
     logger.debug(f"Converting candle (OHLCV) data to dataframe for pair {pair}.")
     cols = DEFAULT_DATAFRAME_COLUMNS
-    df = DataFrame(ohlcv, columns=cols)
-
-    df["date"] = to_datetime(df["date"], unit="ms", utc=True)
-
-    # Some exchanges return int values for Volume and even for OHLC.
-    # Convert them since TA-LIB indicators used in the strategy assume floats
-    # and fail with exception...
-    df = df.astype(
-        dtype={
-            "open": "float",
-            "high": "float",
-            "low": "float",
-            "close": "float",
-            "volume": "float",
-        }
-    )
+    values = None
+    if isinstance(ohlcv, list):
+        try:
+            # Some exchanges return int values for Volume and even for OHLC.
+            # Convert them since TA-LIB indicators used in the strategy assume floats
+            # and fail with exception...
+            values = np.array(ohlcv, dtype=np.float64)
+        except (TypeError, ValueError):
+            pass
+
+    if values is not None and values.ndim == 2 and values.shape[1] == len(cols):
+        df = DataFrame(
+            {
+                "date": to_datetime(values[:, 0].astype(np.int64), unit="ms", utc=True),
+                **{col: values[:, i] for i, col in enumerate(cols[1:], start=1)},
+            }
+        )
+    else:
+        df = DataFrame(ohlcv, columns=cols)
+        df["date"] = to_datetime(df["date"], unit="ms", utc=True)
+        df = df.astype(
+            dtype={
+                "open": "float",
+                "high": "float",
+                "low": "float",
+                "close": "float",
+                "volume": "float",
+            }
+        )
     return clean_ohlcv_dataframe(
         df, timeframe, pair, fill_missing=fill_missing, drop_incomplete=drop_incomplete
     )
@@ -73,27 +86,56 @@ def clean_ohlcv_dataframe(
     :param drop_incomplete: Drop the last candle of the dataframe, assuming it's incomplete
     :return: DataFrame
     """
-    # group by index and aggregate results to eliminate duplicate ticks
-    data = data.groupby(by="date", as_index=False, sort=True).agg(
-        {
-            "open": "first",
-            "high": "max",
-            "low": "min",
-            "close": "last",
-            "volume": "max",
-        }
-    )
+    sorted_unique, gap_free = _check_ohlcv_order(data, timeframe)
+    if sorted_unique:
+        # Fast path - grouping would not change the data
+        data = data.loc[:, DEFAULT_DATAFRAME_COLUMNS].reset_index(drop=True)
+    else:
+        # group by index and aggregate results to eliminate duplicate ticks
+        data = data.groupby(by="date", as_index=False, sort=True).agg(
+            {
+                "open": "first",
+                "high": "max",
+                "low": "min",
+                "close": "last",
+                "volume": "max",
+            }
+        )
     # eliminate partial candle
     if drop_incomplete:
         data.drop(data.tail(1).index, inplace=True)
         logger.debug("Dropping last candle")
 
-    if fill_missing:
+    if fill_missing and not (gap_free and len(data) > 0):
         return ohlcv_fill_up_missing_data(data, timeframe, pair)
     else:
         return data
 
 
+def _check_ohlcv_order(data: DataFrame, timeframe: str) -> tuple[bool, bool]:
+    """
+    Check if the candles are sorted by date without duplicates - and if they're also
+    complete (no missing candles, aligned like resampling would align them).
+    :return: Tuple of (sorted_unique, gap_free)
+    """
+    from freqtrade.exchange import timeframe_to_seconds
+
+    if len(data) == 0 or not pd.api.types.is_datetime64_any_dtype(data["date"]):
+        return False, False
+    dates = data["date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+    diffs = np.diff(dates)
+    if not (diffs > 0).all():
+        return False, False
+
+    tf_ns = timeframe_to_seconds(timeframe) * 1_000_000_000
+    # Weekly / monthly candles are resampled to calendar periods
+    if tf_ns > 10000 * 60 * 1_000_000_000:
+        return True, False
+    # Resampling bins start at midnight of the first day
+    aligned = (dates[0] % (86400 * 1_000_000_000)) % tf_ns == 0
+    return True, bool(aligned and (diffs == tf_ns).all())
+
+
 def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str) -> DataFrame:
     """
     Fills up missing data with 0 volume rows,
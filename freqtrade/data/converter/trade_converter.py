@@ -3,6 +3,7 @@ Functions to convert data from one format to another
 """
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import pandas as pd
@@ -89,41 +90,111 @@ def trades_to_ohlcv(trades: DataFrame, timeframe: str) -> DataFrame:
     return df_new.loc[:, DEFAULT_DATAFRAME_COLUMNS]
 
 
-def convert_trades_to_ohlcv(
-    pairs: list[str],
+def trades_to_ohlcv_multi(trades: DataFrame, timeframes: list[str]) -> dict[str, DataFrame]:
+    """
+    Converts trades to OHLCV for multiple timeframes in one go.
+    Open, high, low and close of larger timeframes are derived from the candles of a smaller
+    timeframe which evenly divides them, so the trades are only resampled once for these.
+    Volume is always summed from the trades, so results are identical to trades_to_ohlcv().
+    :param trades: Trades dataframe (as returned by trades_list_to_df()), sorted by date
+    :param timeframes: Timeframes to resample data to
+    :return: Dict of timeframe -> OHLCV Dataframe.
+    :raises: ValueError if no trades are provided
+    """
+    from freqtrade.exchange import timeframe_to_resample_freq, timeframe_to_seconds
+
+    if trades.empty:
+        raise ValueError("Trade-list empty.")
+    df = trades.set_index("date", drop=True)
+    # Candles which can serve as source for larger timeframes - aligned to the start of the day
+    sources: list[tuple[int, DataFrame]] = []
+    result = {}
+    for timeframe in sorted(set(timeframes), key=timeframe_to_seconds):
+        resample_interval = timeframe_to_resample_freq(timeframe)
+        timeframe_secs = timeframe_to_seconds(timeframe)
+        source = next((c for secs, c in reversed(sources) if timeframe_secs % secs == 0), None)
+        if source is not None:
+            df_new = source.resample(resample_interval).agg(
+                {"open": "first", "high": "max", "low": "min", "close": "last"}
+            )
+        else:
+            df_new = df["price"].resample(resample_interval).ohlc()
+        df_new["volume"] = df["amount"].resample(resample_interval).sum()
+        df_new["date"] = df_new.index
+        # Drop 0 volume rows
+        df_new = df_new.dropna()
+        if resample_interval == f"{timeframe_secs}s" and 86400 % timeframe_secs == 0:
+            sources.append((timeframe_secs, df_new))
+        result[timeframe] = df_new.loc[:, DEFAULT_DATAFRAME_COLUMNS]
+    return result
+
+
+def _convert_pair_trades_to_ohlcv(
+    pair: str,
     timeframes: list[str],
     datadir: Path,
-    timerange: TimeRange,
     erase: bool,
     data_format_ohlcv: str,
     data_format_trades: str,
     candle_type: CandleType,
 ) -> None:
     """
-    Convert stored trades data to ohlcv data
+    Convert stored trades data of one pair to ohlcv data for all timeframes.
     """
     from freqtrade.data.history import get_datahandler
 
     data_handler_trades = get_datahandler(datadir, data_format=data_format_trades)
     data_handler_ohlcv = get_datahandler(datadir, data_format=data_format_ohlcv)
+    trading_mode = TradingMode.FUTURES if candle_type != CandleType.SPOT else TradingMode.SPOT
+
+    trades = data_handler_trades.trades_load(pair, trading_mode)
+    if erase:
+        for timeframe in timeframes:
+            if data_handler_ohlcv.ohlcv_purge(pair, timeframe, candle_type=candle_type):
+                logger.info(f"Deleting existing data for pair {pair}, interval {timeframe}.")
+    try:
+        ohlcvs = trades_to_ohlcv_multi(trades, timeframes)
+    except ValueError:
+        logger.warning(f"Could not convert {pair} to OHLCV.")
+        return
+    for timeframe, ohlcv in ohlcvs.items():
+        # Store ohlcv
+        data_handler_ohlcv.ohlcv_store(pair, timeframe, data=ohlcv, candle_type=candle_type)
+
 
+def convert_trades_to_ohlcv(
+    pairs: list[str],
+    timeframes: list[str],
+    datadir: Path,
+    timerange: TimeRange,
+    erase: bool,
+    data_format_ohlcv: str,
+    data_format_trades: str,
+    candle_type: CandleType,
+) -> None:
+    """
+    Convert stored trades data to ohlcv data.
+    Pairs are converted in parallel, using one process per pair.
+    """
     logger.info(
         f"About to convert pairs: '{', '.join(pairs)}', "
         f"intervals: '{', '.join(timeframes)}' to {datadir}"
     )
-    trading_mode = TradingMode.FUTURES if candle_type != CandleType.SPOT else TradingMode.SPOT
-    for pair in pairs:
-        trades = data_handler_trades.trades_load(pair, trading_mode)
-        for timeframe in timeframes:
-            if erase:
-                if data_handler_ohlcv.ohlcv_purge(pair, timeframe, candle_type=candle_type):
-                    logger.info(f"Deleting existing data for pair {pair}, interval {timeframe}.")
+    args = (timeframes, datadir, erase, data_format_ohlcv, data_format_trades, candle_type)
+    if len(pairs) <= 1:
+        for pair in pairs:
+            _convert_pair_trades_to_ohlcv(pair, *args)
+        return
+
+    with ProcessPoolExecutor() as executor:
+        futures = {
+            pair: executor.submit(_convert_pair_trades_to_ohlcv, pair, *args) for pair in pairs
+        }
+        for pair, future in futures.items():
             try:
-                ohlcv = trades_to_ohlcv(trades, timeframe)
-                # Store ohlcv
-                data_handler_ohlcv.ohlcv_store(pair, timeframe, data=ohlcv, candle_type=candle_type)
-            except ValueError:
-                logger.warning(f"Could not convert {pair} to OHLCV.")
+                future.result()
+            except Exception:
+                logger.exception(f"Could not convert {pair} to OHLCV.")
 
 
 def convert_trades_format(config: Config, convert_from: str, convert_to: str, erase: bool):
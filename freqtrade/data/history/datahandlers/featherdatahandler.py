@@ -1,4 +1,6 @@
 import logging
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 
 from pandas import DataFrame, read_feather, to_datetime
 
@@ -102,6 +104,24 @@ class FeatherDataHandler(IDataHandler):
         self.create_dir_if_needed(filename)
         data.reset_index(drop=True).to_feather(filename, compression_level=9, compression="lz4")
 
+    @contextmanager
+    def trades_writer(
+        self, pair: str, trading_mode: TradingMode
+    ) -> Iterator[Callable[[DataFrame], None]]:
+        """
+        Store trades data in batches, writing each batch to disk as it arrives.
+        See IDataHandler.trades_writer() for details.
+        :param pair: Pair - used for filename
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        """
+        from pyarrow import ipc
+
+        def open_writer(filename, schema):
+            return ipc.new_file(filename, schema, options=ipc.IpcWriteOptions(compression="lz4"))
+
+        with self._arrow_trades_writer(pair, trading_mode, open_writer) as write:
+            yield write
+
     def trades_append(self, pair: str, data: DataFrame):
         """
         Append data to existing files
@@ -7,15 +7,17 @@ It's subclasses handle and storing data from disk.
 import logging
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
 
-from pandas import DataFrame, to_datetime
+from pandas import DataFrame, concat, to_datetime
 
 from freqtrade import misc
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DEFAULT_TRADES_COLUMNS, ListPairsWithTimeframes
+from freqtrade.constants import DEFAULT_TRADES_COLUMNS, TRADES_DTYPES, ListPairsWithTimeframes
 from freqtrade.data.converter import (
     clean_ohlcv_dataframe,
     trades_convert_types,
@@ -268,6 +270,63 @@ class IDataHandler(ABC):
         # Filter on expected columns (will remove the actual date column).
         self._trades_store(pair, data[DEFAULT_TRADES_COLUMNS], trading_mode)
 
+    @contextmanager
+    def trades_writer(
+        self, pair: str, trading_mode: TradingMode
+    ) -> Iterator[Callable[[DataFrame], None]]:
+        """
+        Store trades data in batches.
+        Yields a callable accepting DataFrames (column sequence as in DEFAULT_TRADES_COLUMNS),
+        which must be passed in chronological order.
+        Replaces existing data for this pair once the context exits without an exception -
+        existing data is kept untouched otherwise.
+        Handlers not supporting incremental writes collect all batches and store them at the end.
+        :param pair: Pair - used for filename
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        """
+        batches: list[DataFrame] = []
+        yield lambda data: batches.append(data[DEFAULT_TRADES_COLUMNS])
+        data = concat(batches) if batches else DataFrame(columns=DEFAULT_TRADES_COLUMNS)
+        self._trades_store(pair, data, trading_mode)
+
+    @contextmanager
+    def _arrow_trades_writer(
+        self, pair: str, trading_mode: TradingMode, open_writer: Callable
+    ) -> Iterator[Callable[[DataFrame], None]]:
+        """
+        trades_writer() implementation for pyarrow based formats.
+        Writes batches to a temporary file, which replaces the target file on success.
+        :param open_writer: Callable receiving (filename, schema), returning a pyarrow writer
+        """
+        import pyarrow as pa
+
+        schema = pa.schema(
+            [
+                ("timestamp", pa.int64()),
+                ("id", pa.string()),
+                ("type", pa.string()),
+                ("side", pa.string()),
+                ("price", pa.float64()),
+                ("amount", pa.float64()),
+                ("cost", pa.float64()),
+            ]
+        )
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        self.create_dir_if_needed(filename)
+        tmp_file = filename.with_name(f"{filename.name}.tmp")
+
+        def write(data: DataFrame) -> None:
+            data = data[DEFAULT_TRADES_COLUMNS].astype(TRADES_DTYPES)
+            writer.write_table(pa.Table.from_pandas(data, schema=schema, preserve_index=False))
+
+        try:
+            with open_writer(tmp_file, schema) as writer:
+                yield write
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+        tmp_file.replace(filename)
+
     def trades_purge(self, pair: str, trading_mode: TradingMode) -> bool:
         """
         Remove data for this pair
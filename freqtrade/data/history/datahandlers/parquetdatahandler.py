@@ -1,4 +1,6 @@
 import logging
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 
 from pandas import DataFrame, read_parquet, to_datetime
 
@@ -100,6 +102,24 @@ class ParquetDataHandler(IDataHandler):
         self.create_dir_if_needed(filename)
         data.reset_index(drop=True).to_parquet(filename)
 
+    @contextmanager
+    def trades_writer(
+        self, pair: str, trading_mode: TradingMode
+    ) -> Iterator[Callable[[DataFrame], None]]:
+        """
+        Store trades data in batches, writing each batch to disk as it arrives.
+        See IDataHandler.trades_writer() for details.
+        :param pair: Pair - used for filename
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        """
+        from pyarrow import parquet as pq
+
+        def open_writer(filename, schema):
+            return pq.ParquetWriter(filename, schema)
+
+        with self._arrow_trades_writer(pair, trading_mode, open_writer) as write:
+            yield write
+
     def trades_append(self, pair: str, data: DataFrame):
         """
         Append data to existing files
@@ -1,15 +1,27 @@
+import asyncio
 import logging
 import operator
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
 
 from pandas import DataFrame, concat
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DATETIME_PRINT_FORMAT, DL_DATA_TIMEFRAMES, DOCS_LINK, Config
+from freqtrade.constants import (
+    DATETIME_PRINT_FORMAT,
+    DL_DATA_CONCURRENCY,
+    DL_DATA_TIMEFRAMES,
+    DOCS_LINK,
+    Config,
+)
 from freqtrade.data.converter import (
     clean_ohlcv_dataframe,
     convert_trades_to_ohlcv,
+    trades_convert_types,
     trades_df_remove_duplicates,
     trades_list_to_df,
 )
@@ -214,6 +226,94 @@ def _load_cached_data_for_updating(
     return data, start_ms, end_ms
 
 
+def _prepare_pair_history(
+    pair: str,
+    *,
+    datadir: Path,
+    timeframe: str,
+    new_pairs_days: int,
+    data_handler: IDataHandler,
+    timerange: TimeRange | None,
+    candle_type: CandleType,
+    erase: bool,
+    prepend: bool,
+) -> tuple[DataFrame, int, int | None]:
+    """
+    Erase / load the locally available data and determine the range to download.
+    :return: Tuple of (existing data, since_ms, until_ms)
+    """
+    if erase:
+        if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
+            logger.info(f"Deleting existing data for pair {pair}, {timeframe}, {candle_type}.")
+
+    data, since_ms, until_ms = _load_cached_data_for_updating(
+        pair,
+        timeframe,
+        timerange,
+        data_handler=data_handler,
+        candle_type=candle_type,
+        prepend=prepend,
+    )
+
+    logger.info(
+        f'Download history data for "{pair}", {timeframe}, '
+        f"{candle_type} and store in {datadir}. "
+        f"From {format_ms_time(since_ms) if since_ms else 'start'} to "
+        f"{format_ms_time(until_ms) if until_ms else 'now'}"
+    )
+
+    logger.debug(
+        "Current Start: %s",
+        f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+    logger.debug(
+        "Current End: %s",
+        f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+    # Default since_ms to 30 days if nothing is given
+    if not since_ms:
+        since_ms = int((datetime.now() - timedelta(days=new_pairs_days)).timestamp()) * 1000
+    return data, since_ms, until_ms
+
+
+def _store_pair_history(
+    pair: str,
+    *,
+    timeframe: str,
+    data_handler: IDataHandler,
+    candle_type: CandleType,
+    data: DataFrame,
+    new_dataframe: DataFrame,
+) -> None:
+    """
+    Merge newly downloaded candles with the existing data and store the result.
+    """
+    logger.info(f"Downloaded data for {pair} with length {len(new_dataframe)}.")
+    if data.empty:
+        data = new_dataframe
+    else:
+        # Run cleaning again to ensure there were no duplicate candles
+        # Especially between existing and new data.
+        data = clean_ohlcv_dataframe(
+            concat([data, new_dataframe], axis=0),
+            timeframe,
+            pair,
+            fill_missing=False,
+            drop_incomplete=False,
+        )
+
+    logger.debug(
+        "New Start: %s",
+        f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+    logger.debug(
+        "New End: %s",
+        f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    )
+
+    data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
+
+
 def _download_pair_history(
     pair: str,
     *,
@@ -243,72 +343,101 @@ def _download_pair_history(
     data_handler = get_datahandler(datadir, data_handler=data_handler)
 
     try:
-        if erase:
-            if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
-                logger.info(f"Deleting existing data for pair {pair}, {timeframe}, {candle_type}.")
-
-        data, since_ms, until_ms = _load_cached_data_for_updating(
+        data, since_ms, until_ms = _prepare_pair_history(
             pair,
-            timeframe,
-            timerange,
+            datadir=datadir,
+            timeframe=timeframe,
+            new_pairs_days=new_pairs_days,
             data_handler=data_handler,
+            timerange=timerange,
             candle_type=candle_type,
+            erase=erase,
             prepend=prepend,
         )
 
-        logger.info(
-            f'Download history data for "{pair}", {timeframe}, '
-            f"{candle_type} and store in {datadir}. "
-            f"From {format_ms_time(since_ms) if since_ms else 'start'} to "
-            f"{format_ms_time(until_ms) if until_ms else 'now'}"
+        new_dataframe = exchange.get_historic_ohlcv(
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=since_ms,
+            is_new_pair=data.empty,
+            candle_type=candle_type,
+            until_ms=until_ms if until_ms else None,
+        )
+        _store_pair_history(
+            pair,
+            timeframe=timeframe,
+            data_handler=data_handler,
+            candle_type=candle_type,
+            data=data,
+            new_dataframe=new_dataframe,
         )
+        return True
 
-        logger.debug(
-            "Current Start: %s",
-            f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+    except Exception:
+        logger.exception(
+            f'Failed to download history data for pair: "{pair}", timeframe: {timeframe}.'
         )
-        logger.debug(
-            "Current End: %s",
-            f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+        return False
+
+
+async def _async_download_pair_history(
+    pair: str,
+    *,
+    datadir: Path,
+    exchange: Exchange,
+    executor: ThreadPoolExecutor,
+    timeframe: str,
+    new_pairs_days: int,
+    data_handler: IDataHandler,
+    timerange: TimeRange | None,
+    candle_type: CandleType,
+    erase: bool,
+    prepend: bool,
+) -> bool:
+    """
+    Coroutine variant of _download_pair_history(), used to download multiple pairs concurrently.
+    Loading and storing data is done in the executor, so it overlaps with running downloads.
+    :param executor: Executor used for disk operations
+    :return: bool with success state
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        data, since_ms, until_ms = await loop.run_in_executor(
+            executor,
+            partial(
+                _prepare_pair_history,
+                pair,
+                datadir=datadir,
+                timeframe=timeframe,
+                new_pairs_days=new_pairs_days,
+                data_handler=data_handler,
+                timerange=timerange,
+                candle_type=candle_type,
+                erase=erase,
+                prepend=prepend,
+            ),
         )
 
-        # Default since_ms to 30 days if nothing is given
-        new_dataframe = exchange.get_historic_ohlcv(
+        new_dataframe = await exchange.get_historic_ohlcv_async(
             pair=pair,
             timeframe=timeframe,
-            since_ms=(
-                since_ms
-                if since_ms
-                else int((datetime.now() - timedelta(days=new_pairs_days)).timestamp()) * 1000
-            ),
+            since_ms=since_ms,
             is_new_pair=data.empty,
             candle_type=candle_type,
             until_ms=until_ms if until_ms else None,
         )
-        logger.info(f"Downloaded data for {pair} with length {len(new_dataframe)}.")
-        if data.empty:
-            data = new_dataframe
-        else:
-            # Run cleaning again to ensure there were no duplicate candles
-            # Especially between existing and new data.
-            data = clean_ohlcv_dataframe(
-                concat([data, new_dataframe], axis=0),
-                timeframe,
+        await loop.run_in_executor(
+            executor,
+            partial(
+                _store_pair_history,
                 pair,
-                fill_missing=False,
-                drop_incomplete=False,
-            )
-
-        logger.debug(
-            "New Start: %s",
-            f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
-        )
-        logger.debug(
-            "New End: %s",
-            f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}" if not data.empty else "None",
+                timeframe=timeframe,
+                data_handler=data_handler,
+                candle_type=candle_type,
+                data=data,
+                new_dataframe=new_dataframe,
+            ),
         )
-
-        data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
         return True
 
     except Exception:
@@ -334,6 +463,8 @@ def refresh_backtest_ohlcv_data(
     """
     Refresh stored ohlcv data for backtesting and hyperopt operations.
     Used by freqtrade download-data subcommand.
+    Up to DL_DATA_CONCURRENCY pair / timeframe / candle type combinations are downloaded
+    concurrently - requests are limited by the exchange's rate limit.
     :return: List of pairs that are not available.
     """
     progress_tracker = retrieve_progress_tracker(progress_tracker)
@@ -341,65 +472,67 @@ def refresh_backtest_ohlcv_data(
     pairs_not_available = []
     data_handler = get_datahandler(datadir, data_format)
     candle_type = CandleType.get_default(trading_mode)
+
+    dl_jobs: list[tuple[str, str, CandleType]] = []
+    for pair in pairs:
+        if pair not in exchange.markets:
+            pairs_not_available.append(f"{pair}: Pair not available on exchange.")
+            logger.info(f"Skipping pair {pair}...")
+            continue
+        for timeframe in timeframes:
+            logger.debug(f"Downloading pair {pair}, {candle_type}, interval {timeframe}.")
+            dl_jobs.append((pair, str(timeframe), candle_type))
+        if trading_mode == "futures":
+            # Predefined candletype (and timeframe) depending on exchange
+            # Downloads what is necessary to backtest based on futures data.
+            tf_mark = exchange.get_option("mark_ohlcv_timeframe")
+            tf_funding_rate = exchange.get_option("funding_fee_timeframe")
+
+            fr_candle_type = CandleType.from_string(exchange.get_option("mark_ohlcv_price"))
+            # All exchanges need FundingRate for futures trading.
+            # The timeframe is aligned to the mark-price timeframe.
+            combs = ((CandleType.FUNDING_RATE, tf_funding_rate), (fr_candle_type, tf_mark))
+            for candle_type_f, tf in combs:
+                logger.debug(f"Downloading pair {pair}, {candle_type_f}, interval {tf}.")
+                dl_jobs.append((pair, str(tf), candle_type_f))
+
+    open_jobs = Counter(job[0] for job in dl_jobs)
+
     with progress_tracker as progress:
-        tf_length = len(timeframes) if trading_mode != "futures" else len(timeframes) + 2
-        timeframe_task = progress.add_task("Timeframe", total=tf_length)
-        pair_task = progress.add_task("Downloading data...", total=len(pairs))
+        pair_task = progress.add_task("Downloading data...", total=len(open_jobs))
+        job_task = progress.add_task("Pairs / Timeframes", total=len(dl_jobs))
 
-        for pair in pairs:
-            progress.update(pair_task, description=f"Downloading {pair}")
-            progress.update(timeframe_task, completed=0)
+        async def download_all(executor: ThreadPoolExecutor) -> None:
+            semaphore = asyncio.Semaphore(DL_DATA_CONCURRENCY)
 
-            if pair not in exchange.markets:
-                pairs_not_available.append(f"{pair}: Pair not available on exchange.")
-                logger.info(f"Skipping pair {pair}...")
-                continue
-            for timeframe in timeframes:
-                progress.update(timeframe_task, description=f"Timeframe {timeframe}")
-                logger.debug(f"Downloading pair {pair}, {candle_type}, interval {timeframe}.")
-                _download_pair_history(
-                    pair=pair,
-                    datadir=datadir,
-                    exchange=exchange,
-                    timerange=timerange,
-                    data_handler=data_handler,
-                    timeframe=str(timeframe),
-                    new_pairs_days=new_pairs_days,
-                    candle_type=candle_type,
-                    erase=erase,
-                    prepend=prepend,
-                )
-                progress.update(timeframe_task, advance=1)
-            if trading_mode == "futures":
-                # Predefined candletype (and timeframe) depending on exchange
-                # Downloads what is necessary to backtest based on futures data.
-                tf_mark = exchange.get_option("mark_ohlcv_timeframe")
-                tf_funding_rate = exchange.get_option("funding_fee_timeframe")
-
-                fr_candle_type = CandleType.from_string(exchange.get_option("mark_ohlcv_price"))
-                # All exchanges need FundingRate for futures trading.
-                # The timeframe is aligned to the mark-price timeframe.
-                combs = ((CandleType.FUNDING_RATE, tf_funding_rate), (fr_candle_type, tf_mark))
-                for candle_type_f, tf in combs:
-                    logger.debug(f"Downloading pair {pair}, {candle_type_f}, interval {tf}.")
-                    _download_pair_history(
+            async def download_job(pair: str, timeframe: str, candle_type_j: CandleType) -> None:
+                async with semaphore:
+                    await _async_download_pair_history(
                         pair=pair,
                         datadir=datadir,
                         exchange=exchange,
+                        executor=executor,
                         timerange=timerange,
                         data_handler=data_handler,
-                        timeframe=str(tf),
+                        timeframe=timeframe,
                         new_pairs_days=new_pairs_days,
-                        candle_type=candle_type_f,
+                        candle_type=candle_type_j,
                         erase=erase,
                         prepend=prepend,
                     )
-                    progress.update(
-                        timeframe_task, advance=1, description=f"Timeframe {candle_type_f}, {tf}"
-                    )
+                progress.update(
+                    job_task, advance=1, description=f"{pair}, {timeframe}, {candle_type_j}"
+                )
+                open_jobs[pair] -= 1
+                if open_jobs[pair] == 0:
+                    progress.update(pair_task, advance=1)
 
-            progress.update(pair_task, advance=1)
-            progress.update(timeframe_task, description="Timeframe")
+            await asyncio.gather(*(download_job(*job) for job in dl_jobs))
+
+        if dl_jobs:
+            # Single worker, so disk operations don't compete with each other
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                exchange.run_async(download_all(executor))
 
     return pairs_not_available
 
@@ -462,30 +595,64 @@ def _download_trades_history(
     )
     logger.info(f"Current Amount of trades: {len(trades)}")
 
-    new_trades = exchange.get_historic_trades(
-        pair=pair,
-        since=since,
-        until=until,
-        from_id=from_id,
-    )
-    new_trades_df = trades_list_to_df(new_trades[1])
-    trades = concat([trades, new_trades_df], axis=0)
-    # Remove duplicates to make sure we're not storing data we don't need
-    trades = trades_df_remove_duplicates(trades)
-    data_handler.trades_store(pair, trades, trading_mode)
+    with data_handler.trades_writer(pair, trading_mode) as store:
+        writer = _TradesBatchWriter(store)
+        writer(trades)
+        # Exchanges supporting it pass bulk data (e.g. archives) to the writer directly.
+        new_trades = exchange.get_historic_trades(
+            pair=pair,
+            since=since,
+            until=until,
+            from_id=from_id,
+            sink=writer,
+        )
+        writer(trades_list_to_df(new_trades[1]))
 
-    logger.debug(
-        "New Start: %s",
-        "None" if trades.empty else f"{trades.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}",
-    )
-    logger.debug(
-        "New End: %s",
-        "None" if trades.empty else f"{trades.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}",
-    )
-    logger.info(f"New Amount of trades: {len(trades)}")
+    logger.debug("New Start: %s", writer.first_date or "None")
+    logger.debug("New End: %s", writer.last_date or "None")
+    logger.info(f"New Amount of trades: {writer.count}")
     return True
 
 
+class _TradesBatchWriter:
+    """
+    Passes chronological batches of trades to a datahandler trades_writer,
+    removing duplicates (which are expected where batches overlap) in the process.
+    """
+
+    def __init__(self, store: Callable[[DataFrame], None]) -> None:
+        self._store = store
+        self._last_ts: int | None = None
+        self._last_ids: set[str] = set()
+        self.count = 0
+        self.first_date: str | None = None
+        self.last_date: str | None = None
+
+    def __call__(self, trades: DataFrame) -> None:
+        if "date" not in trades.columns:
+            trades = trades_convert_types(trades)
+        trades = trades_df_remove_duplicates(trades)
+        if self._last_ts is not None:
+            ts = trades["timestamp"]
+            trades = trades[
+                (ts > self._last_ts) | ((ts == self._last_ts) & ~trades["id"].isin(self._last_ids))
+            ]
+        if trades.empty:
+            return
+
+        self._store(trades)
+
+        last_ts = int(trades["timestamp"].iat[-1])
+        if last_ts != self._last_ts:
+            self._last_ids = set()
+        self._last_ts = last_ts
+        self._last_ids.update(trades.loc[trades["timestamp"] == last_ts, "id"])
+        self.count += len(trades)
+        if self.first_date is None:
+            self.first_date = f"{trades.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}"
+        self.last_date = f"{trades.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}"
+
+
 def refresh_backtest_trades_data(
     exchange: Exchange,
     pairs: list[str],
@@ -208,6 +208,45 @@ def calculate_max_drawdown(
         profit_results, date_col=date_col, value_col=value_col, starting_balance=starting_balance
     )
 
+    return _get_drawdown_result(
+        profit_results, max_drawdown_df, date_col=date_col, relative=relative
+    )
+
+
+def calculate_max_drawdowns(
+    trades: pd.DataFrame,
+    *,
+    date_col: str = "close_date",
+    value_col: str = "profit_abs",
+    starting_balance: float = 0,
+) -> tuple[DrawDownResult, DrawDownResult]:
+    """
+    Calculate absolute and relative max drawdown from one cumulative profit series.
+    Equivalent to calling calculate_max_drawdown() with relative=False and relative=True,
+    but sorts the trades only once.
+    :param trades: DataFrame containing trades (requires columns close_date and profit_ratio)
+    :param date_col: Column in DataFrame to use for dates (defaults to 'close_date')
+    :param value_col: Column in DataFrame to use for values (defaults to 'profit_abs')
+    :param starting_balance: Portfolio starting balance - properly calculate relative drawdown.
+    :return: Tuple of DrawDownResult objects (max drawdown, max relative drawdown)
+    :raise: ValueError if trade-dataframe was found empty.
+    """
+    if len(trades) == 0:
+        raise ValueError("Trade dataframe empty.")
+    profit_results = trades.sort_values(date_col).reset_index(drop=True)
+    max_drawdown_df = _calc_drawdown_series(
+        profit_results, date_col=date_col, value_col=value_col, starting_balance=starting_balance
+    )
+
+    return (
+        _get_drawdown_result(profit_results, max_drawdown_df, date_col=date_col, relative=False),
+        _get_drawdown_result(profit_results, max_drawdown_df, date_col=date_col, relative=True),
+    )
+
+
+def _get_drawdown_result(
+    profit_results: pd.DataFrame, max_drawdown_df: pd.DataFrame, *, date_col: str, relative: bool
+) -> DrawDownResult:
     idxmin = (
         max_drawdown_df["drawdown_relative"].idxmax()
         if relative
@@ -351,11 +390,17 @@ def calculate_sharpe(
 
 
 def calculate_calmar(
-    trades: pd.DataFrame, min_date: datetime, max_date: datetime, starting_balance: float
+    trades: pd.DataFrame,
+    min_date: datetime,
+    max_date: datetime,
+    starting_balance: float,
+    *,
+    max_drawdown: float | None = None,
 ) -> float:
     """
     Calculate calmar
     :param trades: DataFrame containing trades (requires columns close_date and profit_abs)
+    :param max_drawdown: Relative account drawdown of these trades, if already calculated.
     :return: calmar
     """
     if (len(trades) == 0) or (min_date is None) or (max_date is None) or (min_date == max_date):
@@ -369,13 +414,14 @@ def calculate_calmar(
     expected_returns_mean = total_profit / days_period * 100
 
     # calculate max drawdown
-    try:
-        drawdown = calculate_max_drawdown(
-            trades, value_col="profit_abs", starting_balance=starting_balance
-        )
-        max_drawdown = drawdown.relative_account_drawdown
-    except ValueError:
-        max_drawdown = 0
+    if max_drawdown is None:
+        try:
+            drawdown = calculate_max_drawdown(
+                trades, value_col="profit_abs", starting_balance=starting_balance
+            )
+            max_drawdown = drawdown.relative_account_drawdown
+        except ValueError:
+            max_drawdown = 0
 
     if max_drawdown != 0:
         calmar_ratio = expected_returns_mean / max_drawdown * math.sqrt(365)
@@ -15,9 +15,10 @@ from freqtrade.exchange.binance_public_data import (
     concat_safe,
     download_archive_ohlcv,
     download_archive_trades,
+    stream_archive_trades,
 )
 from freqtrade.exchange.common import retrier
-from freqtrade.exchange.exchange_types import FtHas, Tickers
+from freqtrade.exchange.exchange_types import FtHas, Tickers, TradesSink
 from freqtrade.exchange.exchange_utils_timeframe import timeframe_to_msecs
 from freqtrade.misc import deep_merge_dicts, json_load
 from freqtrade.util.datetime_helpers import dt_from_ts, dt_ts
@@ -136,7 +137,7 @@ class Binance(Exchange):
         except ccxt.BaseError as e:
             raise OperationalException(e) from e
 
-    def get_historic_ohlcv(
+    async def get_historic_ohlcv_async(
         self,
         pair: str,
         timeframe: str,
@@ -151,10 +152,7 @@ class Binance(Exchange):
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
         if is_new_pair and candle_type in (CandleType.SPOT, CandleType.FUTURES, CandleType.MARK):
-            with self._loop_lock:
-                x = self.loop.run_until_complete(
-                    self._async_get_candle_history(pair, timeframe, candle_type, 0)
-                )
+            x = await self._async_get_candle_history(pair, timeframe, candle_type, 0)
             if x and x[3] and x[3][0] and x[3][0][0] > since_ms:
                 # Set starting date to first available candle.
                 since_ms = x[3][0][0]
@@ -182,7 +180,7 @@ class Binance(Exchange):
                 )
             )
         ):
-            return super().get_historic_ohlcv(
+            return await super().get_historic_ohlcv_async(
                 pair=pair,
                 timeframe=timeframe,
                 since_ms=since_ms,
@@ -192,7 +190,7 @@ class Binance(Exchange):
             )
         else:
             # Download from data.binance.vision
-            return self.get_historic_ohlcv_fast(
+            return await self.get_historic_ohlcv_fast(
                 pair=pair,
                 timeframe=timeframe,
                 since_ms=since_ms,
@@ -201,7 +199,7 @@ class Binance(Exchange):
                 until_ms=until_ms,
             )
 
-    def get_historic_ohlcv_fast(
+    async def get_historic_ohlcv_fast(
         self,
         pair: str,
         timeframe: str,
@@ -213,17 +211,14 @@ class Binance(Exchange):
         """
         Fastly fetch OHLCV data by leveraging https://data.binance.vision.
         """
-        with self._loop_lock:
-            df = self.loop.run_until_complete(
-                download_archive_ohlcv(
-                    candle_type=candle_type,
-                    pair=pair,
-                    timeframe=timeframe,
-                    since_ms=since_ms,
-                    until_ms=until_ms,
-                    markets=self.markets,
-                )
-            )
+        df = await download_archive_ohlcv(
+            candle_type=candle_type,
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=since_ms,
+            until_ms=until_ms,
+            markets=self.markets,
+        )
 
         # download the remaining data from rest API
         if df.empty:
@@ -235,7 +230,7 @@ class Binance(Exchange):
         if until_ms and rest_since_ms > until_ms:
             rest_df = DataFrame()
         else:
-            rest_df = super().get_historic_ohlcv(
+            rest_df = await super().get_historic_ohlcv_async(
                 pair=pair,
                 timeframe=timeframe,
                 since_ms=rest_since_ms,
@@ -390,7 +385,12 @@ class Binance(Exchange):
         return t, from_id
 
     async def _async_get_trade_history_id(
-        self, pair: str, until: int, since: int, from_id: str | None = None
+        self,
+        pair: str,
+        until: int,
+        since: int,
+        from_id: str | None = None,
+        sink: TradesSink | None = None,
     ) -> tuple[str, list[list]]:
         logger.info(f"Fetching trades from Binance, {from_id=}, {since=}, {until=}")
 
@@ -406,20 +406,35 @@ class Binance(Exchange):
                 listing_date: int = trades[0]["timestamp"]
                 since = max(since, listing_date)
 
-            _, res = await download_archive_trades(
-                CandleType.FUTURES if self.trading_mode == "futures" else CandleType.SPOT,
-                pair,
-                since_ms=since,
-                until_ms=until,
-                markets=self.markets,
-            )
-
-            if not res:
-                end_time = since
-                end_id = from_id
+            candle_type = CandleType.FUTURES if self.trading_mode == "futures" else CandleType.SPOT
+            res: list[list]
+            if sink:
+                # Archive data goes straight to the sink - without accumulating it in memory.
+                res = []
+                last_trade = await stream_archive_trades(
+                    candle_type,
+                    pair,
+                    since_ms=since,
+                    until_ms=until,
+                    markets=self.markets,
+                    sink=sink,
+                )
+                end_time, end_id = last_trade if last_trade else (since, from_id)
             else:
-                end_time = res[-1][0]
-                end_id = res[-1][1]
+                _, res = await download_archive_trades(
+                    candle_type,
+                    pair,
+                    since_ms=since,
+                    until_ms=until,
+                    markets=self.markets,
+                )
+
+                if not res:
+                    end_time = since
+                    end_id = from_id
+                else:
+                    end_time = res[-1][0]
+                    end_id = res[-1][1]
 
             if end_time and end_time >= until:
                 return pair, res
@@ -6,9 +6,12 @@ Documentation can be found in https://github.com/binance/binance-public-data
 import asyncio
 import logging
 import zipfile
+from collections.abc import AsyncGenerator, Callable, Coroutine
+from contextlib import aclosing
 from datetime import date, timedelta
+from functools import partial
 from io import BytesIO
-from typing import Any
+from typing import Any, TypeVar
 
 import aiohttp
 import numpy as np
@@ -23,6 +26,11 @@ from freqtrade.util.datetime_helpers import dt_from_ts, dt_now
 
 logger = logging.getLogger(__name__)
 
+# Days downloaded concurrently when streaming trades - limits the amount of trades held in memory
+ARCHIVE_STREAM_CHUNK_DAYS = 4
+
+T = TypeVar("T")
+
 
 class Http404(Exception):
     def __init__(self, msg, date, url):
@@ -336,7 +344,24 @@ async def download_archive_trades(
         return pair, []
 
 
-def parse_trades_from_zip(csvf):
+def _read_trades_csv(csvf, names: list[str], header: int | None) -> DataFrame:
+    """
+    Read a trades csv file - using pyarrow's multithreaded csv reader if available.
+    """
+    try:
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        return pd.read_csv(csvf, names=names, header=header)
+
+    read_options = pa_csv.ReadOptions(column_names=names, skip_rows=0 if header is None else 1)
+    return pa_csv.read_csv(csvf, read_options=read_options).to_pandas()
+
+
+def parse_trades_df_from_zip(csvf) -> DataFrame:
+    """
+    Parse trades from a daily aggTrades csv file.
+    :return: DataFrame with DEFAULT_TRADES_COLUMNS as columns
+    """
     # https://github.com/binance/binance-public-data/issues/283
     first_byte = csvf.read(1)[0]
     if chr(first_byte).isdigit():
@@ -366,11 +391,7 @@ def parse_trades_from_zip(csvf):
         ]
     csvf.seek(0)
 
-    df = pd.read_csv(
-        csvf,
-        names=names,
-        header=header,
-    )
+    df = _read_trades_csv(csvf, names, header)
     df.loc[:, "cost"] = df["price"] * df["amount"]
     # Side is reversed intentionally
     # based on ccxt parseTrade logic.
@@ -382,19 +403,23 @@ def parse_trades_from_zip(csvf):
         df["timestamp"] // 1000,
         df["timestamp"],
     )
-    return df.loc[:, DEFAULT_TRADES_COLUMNS].to_records(index=False).tolist()
+    return df.loc[:, DEFAULT_TRADES_COLUMNS]
 
 
-async def get_daily_trades(
+def parse_trades_from_zip(csvf):
+    return parse_trades_df_from_zip(csvf).to_records(index=False).tolist()
+
+
+async def get_daily_trades_df(
     symbol: str,
     candle_type: CandleType,
     date: date,
     session: aiohttp.ClientSession,
     retry_count: int = 3,
     retry_delay: float = 0.0,
-) -> list[list]:
+) -> DataFrame:
     """
-    Get daily OHLCV from https://data.binance.vision
+    Get daily trades from https://data.binance.vision
     See https://github.com/binance/binance-public-data
 
     :symbol: binance symbol name, e.g. BTCUSDT
@@ -403,7 +428,7 @@ async def get_daily_trades(
     :session: an aiohttp.ClientSession instance
     :retry_count: times to retry before returning the exceptions
     :retry_delay: the time to wait before every retry
-    :return: a list containing trades in DEFAULT_TRADES_COLUMNS format
+    :return: a DataFrame containing trades with DEFAULT_TRADES_COLUMNS as columns
     """
 
     url = binance_vision_trades_zip_url(symbol, candle_type, date)
@@ -425,7 +450,7 @@ async def get_daily_trades(
                     logger.debug(f"Successfully downloaded {url}")
                     with zipfile.ZipFile(BytesIO(content)) as zipf:
                         with zipf.open(zipf.namelist()[0]) as csvf:
-                            return parse_trades_from_zip(csvf)
+                            return parse_trades_df_from_zip(csvf)
                 elif resp.status == 404:
                     logger.debug(f"Failed to download {url}")
                     raise Http404(f"404: {url}", date, url)
@@ -439,65 +464,163 @@ async def get_daily_trades(
                 raise
 
 
-async def _download_archive_trades(
+async def get_daily_trades(
     symbol: str,
-    pair: str,
     candle_type: CandleType,
+    date: date,
+    session: aiohttp.ClientSession,
+    retry_count: int = 3,
+    retry_delay: float = 0.0,
+) -> list[list]:
+    """
+    Get daily trades from https://data.binance.vision
+    See get_daily_trades_df() for details.
+    :return: a list containing trades in DEFAULT_TRADES_COLUMNS format
+    """
+    df = await get_daily_trades_df(symbol, candle_type, date, session, retry_count, retry_delay)
+    return df.to_records(index=False).tolist()
+
+
+async def _iter_daily_archives(
+    fetch_day: Callable[[date, aiohttp.ClientSession], Coroutine[Any, Any, T]],
+    pair: str,
     start: date,
     end: date,
     stop_on_404: bool,
-) -> list[list]:
-    # daily dataframes, `None` indicates missing data in that day (when `stop_on_404` is False)
-    results: list[list] = []
+    chunk_days: int,
+) -> AsyncGenerator[T, None]:
+    """
+    Download daily archives, `chunk_days` days concurrently, and yield the results in date order.
+    Stops at the first error (or at the first missing day if `stop_on_404` is set),
+    so the yielded data doesn't contain gaps.
+    """
     # the current day being processing, starting at 1.
     current_day = 0
 
     connector = aiohttp.TCPConnector(limit=100)
     async with aiohttp.ClientSession(connector=connector, trust_env=True) as session:
         # the HTTP connections has been throttled by TCPConnector
-        for dates in chunks(list(date_range(start, end)), 30):
-            tasks = [
-                asyncio.create_task(get_daily_trades(symbol, candle_type, date, session))
-                for date in dates
+        for dates in chunks(list(date_range(start, end)), chunk_days):
+            tasks: list[asyncio.Task[T]] = [
+                asyncio.create_task(fetch_day(date, session)) for date in dates
             ]
-            for task in tasks:
-                current_day += 1
-                try:
-                    result = await task
-                except Http404 as e:
-                    if stop_on_404:
-                        logger.debug(f"Failed to download {e.url} due to 404.")
-
-                        # A 404 error on the first day indicates missing data
-                        # on https://data.binance.vision, we provide the warning and the advice.
-                        # https://github.com/freqtrade/freqtrade/blob/acc53065e5fa7ab5197073276306dc9dc3adbfa3/tests/exchange_online/test_binance_compare_ohlcv.py#L7
-                        if current_day == 1:
-                            logger.warning(
-                                f"Fast download is unavailable due to missing data: "
-                                f"{e.url}. Falling back to the slower REST API, "
-                                "which may take more time."
-                            )
-                            if pair in ["BTC/USDT:USDT", "ETH/USDT:USDT", "BCH/USDT:USDT"]:
+            try:
+                for task in tasks:
+                    current_day += 1
+                    try:
+                        result = await task
+                    except Http404 as e:
+                        if stop_on_404:
+                            logger.debug(f"Failed to download {e.url} due to 404.")
+
+                            # A 404 error on the first day indicates missing data
+                            # on https://data.binance.vision, we provide the warning and the advice.
+                            # https://github.com/freqtrade/freqtrade/blob/acc53065e5fa7ab5197073276306dc9dc3adbfa3/tests/exchange_online/test_binance_compare_ohlcv.py#L7
+                            if current_day == 1:
                                 logger.warning(
-                                    f"To avoid the delay, you can first download {pair} using "
-                                    "`--timerange <start date>-20200101`, and then download the "
-                                    "remaining data with `--timerange 20200101-<end date>`."
+                                    f"Fast download is unavailable due to missing data: "
+                                    f"{e.url}. Falling back to the slower REST API, "
+                                    "which may take more time."
                                 )
-                        else:
-                            logger.warning(
-                                f"Binance fast download for {pair} stopped at {e.date} due to "
-                                f"missing data: {e.url}, falling back to rest API for the "
-                                "remaining data, this can take more time."
-                            )
-                        await cancel_and_await_tasks(tasks[tasks.index(task) + 1 :])
-                        return results
-                except Exception as e:
-                    logger.warning(f"An exception raised: {e}")
-                    # Directly return the existing data, do not allow the gap within the data
-                    await cancel_and_await_tasks(tasks[tasks.index(task) + 1 :])
-                    return results
-                else:
-                    # Happy case
-                    results.extend(result)
+                                if pair in ["BTC/USDT:USDT", "ETH/USDT:USDT", "BCH/USDT:USDT"]:
+                                    logger.warning(
+                                        f"To avoid the delay, you can first download {pair} "
+                                        "using `--timerange <start date>-20200101`, and then "
+                                        "download the remaining data with "
+                                        "`--timerange 20200101-<end date>`."
+                                    )
+                            else:
+                                logger.warning(
+                                    f"Binance fast download for {pair} stopped at {e.date} due to "
+                                    f"missing data: {e.url}, falling back to rest API for the "
+                                    "remaining data, this can take more time."
+                                )
+                            return
+                    except Exception as e:
+                        logger.warning(f"An exception raised: {e}")
+                        # Directly return the existing data, do not allow the gap within the data
+                        return
+                    else:
+                        # Happy case
+                        yield result
+            finally:
+                await cancel_and_await_tasks([task for task in tasks if not task.done()])
 
+
+async def _download_archive_trades(
+    symbol: str,
+    pair: str,
+    candle_type: CandleType,
+    start: date,
+    end: date,
+    stop_on_404: bool,
+) -> list[list]:
+    results: list[list] = []
+    days = _iter_daily_archives(
+        partial(get_daily_trades, symbol, candle_type), pair, start, end, stop_on_404, 30
+    )
+    async with aclosing(days):
+        async for result in days:
+            results.extend(result)
     return results
+
+
+async def stream_archive_trades(
+    candle_type: CandleType,
+    pair: str,
+    *,
+    since_ms: int,
+    until_ms: int | None,
+    markets: dict[str, Any],
+    sink: Callable[[DataFrame], None],
+    stop_on_404: bool = True,
+) -> tuple[int, str] | None:
+    """
+    Fetch trades from https://data.binance.vision and pass them to `sink` one day at a time,
+    as soon as they're available.
+    Only a few days are held in memory at any time, independent of the requested time range.
+    :param sink: Callable receiving DataFrames with DEFAULT_TRADES_COLUMNS as columns
+    :return: (timestamp, id) of the last trade passed to `sink`, None if no trades were downloaded
+    """
+    fallback_msg = (
+        "An exception occurred during fast trades download from Binance, falling back to "
+        "the slower REST API, this can take a lot more time."
+    )
+    try:
+        symbol = markets[pair]["id"]
+
+        last_available_date = dt_now() - timedelta(days=2)
+
+        start = dt_from_ts(since_ms)
+        end = dt_from_ts(until_ms) if until_ms else dt_now()
+        end = min(end, last_available_date)
+        if start >= end:
+            return None
+    except Exception as e:
+        logger.warning(fallback_msg, exc_info=e)
+        return None
+
+    last_trade: tuple[int, str] | None = None
+    days = _iter_daily_archives(
+        partial(get_daily_trades_df, symbol, candle_type),
+        pair,
+        start,
+        end,
+        stop_on_404,
+        ARCHIVE_STREAM_CHUNK_DAYS,
+    )
+    async with aclosing(days):
+        while True:
+            try:
+                trades = await anext(days)
+            except StopAsyncIteration:
+                break
+            except Exception as e:
+                logger.warning(fallback_msg, exc_info=e)
+                break
+            if trades.empty:
+                continue
+            # Exceptions in the sink are not handled - data might already be partially stored.
+            sink(trades)
+            last_trade = int(trades["timestamp"].iat[-1]), str(trades["id"].iat[-1])
+    return last_trade
@@ -6,12 +6,11 @@ Cryptocurrency Exchanges support
 import asyncio
 import inspect
 import logging
-import signal
-from collections.abc import Coroutine, Generator
+from collections.abc import Callable, Coroutine, Generator
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from math import floor, isnan
-from threading import Lock
+from threading import Lock, Thread, current_thread
 from typing import Any, Literal, TypeGuard, TypeVar
 
 import ccxt
@@ -37,7 +36,6 @@ from freqtrade.constants import (
     PairWithTimeframe,
 )
 from freqtrade.data.converter import (
-    clean_ohlcv_dataframe,
     ohlcv_to_dataframe,
     trades_df_remove_duplicates,
     trades_dict_to_list,
@@ -77,6 +75,7 @@ from freqtrade.exchange.exchange_types import (
     OrderBook,
     Ticker,
     Tickers,
+    TradesSink,
 )
 from freqtrade.exchange.exchange_utils import (
     ROUND,
@@ -99,6 +98,9 @@ from freqtrade.exchange.exchange_utils_timeframe import (
     timeframe_to_seconds,
 )
 from freqtrade.exchange.exchange_ws import ExchangeWS
+from freqtrade.exchange.funding_fees import FundingFeeIndex
+from freqtrade.exchange.kline_cache import KlineCache
+from freqtrade.exchange.leverage_tiers import LeverageTierIndex
 from freqtrade.misc import (
     chunks,
     deep_merge_dicts,
@@ -115,6 +117,10 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Version of the leverage tiers cache file - files with a newer version are ignored.
+# 1: "updated" for all symbols, 2: adds "symbols_updated" with the update time per symbol
+LEVERAGE_TIERS_CACHE_VERSION = 2
+
 
 class Exchange:
     # Parameters to add directly to buy/sell calls (like agreeing to trading agreement)
@@ -191,9 +197,15 @@ class Exchange:
         self._markets: dict = {}
         self._trading_fees: dict[str, Any] = {}
         self._leverage_tiers: dict[str, list[dict]] = {}
-        # Lock event loop. This is necessary to avoid race-conditions when using force* commands
-        # Due to funding fee fetching.
+        # Built lazily from _leverage_tiers, see _get_leverage_tier_index()
+        self._leverage_tier_index: dict[str, LeverageTierIndex] = {}
+        # Update time of the symbols in the leverage tiers cache
+        self._leverage_tiers_cached_at: dict[str, datetime] = {}
+        # The event loop runs persistently in a dedicated thread (started on first use).
+        # Callers from any thread submit coroutines to it via run_async(),
+        # so independent requests (bot loop, api server, ...) run concurrently.
         self._loop_lock = Lock()
+        self._loop_thread: Thread | None = None
         self.loop = self._init_async_loop()
         self._config: Config = {}
 
@@ -215,7 +227,7 @@ class Exchange:
         self._entry_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=300)
 
         # Holds candles
-        self._klines: dict[PairWithTimeframe, DataFrame] = {}
+        self._klines = KlineCache()
         self._expiring_candle_cache: dict[tuple[str, int], PeriodicCache] = {}
 
         # Holds public_trades
@@ -277,6 +289,12 @@ class Exchange:
         ):
             self._ws_async = self._init_ccxt(exchange_conf, False, ccxt_async_config)
             self._exchange_ws = ExchangeWS(self._config, self._ws_async)
+        # Stream candles for all requested pairs, reconciling via REST api periodically
+        self._ws_ingest_all: bool = exchange_conf.get("ws_ingest_all", False)
+        self._ws_reconcile_interval: int = (
+            exchange_conf.get("ws_reconcile_interval", 60) * 60 * 1000
+        )
+        self._ws_last_reconcile: dict[PairWithTimeframe, int] = {}
 
         logger.info(f'Using Exchange "{self.name}"')
         self.required_candle_call_count = 1
@@ -308,28 +326,49 @@ class Exchange:
         if self._exchange_ws:
             self._exchange_ws.cleanup()
         logger.debug("Exchange object destroyed, closing async loop")
+        loop_thread = getattr(self, "_loop_thread", None)
+        if loop_thread is current_thread():
+            # Garbage collection within the event loop - can't wait for the loop here.
+            self.loop.call_soon(self.loop.stop)
+            return
+        loop_open = getattr(self, "loop", None) and not self.loop.is_closed()
         if (
-            getattr(self, "_api_async", None)
+            loop_open
+            and getattr(self, "_api_async", None)
             and inspect.iscoroutinefunction(self._api_async.close)
             and self._api_async.session
         ):
             logger.debug("Closing async ccxt session.")
-            self.loop.run_until_complete(self._api_async.close())
+            self.run_async(self._api_async.close())
         if (
-            self._ws_async
+            loop_open
+            and getattr(self, "_ws_async", None)
             and inspect.iscoroutinefunction(self._ws_async.close)
             and self._ws_async.session
         ):
             logger.debug("Closing ws ccxt session.")
-            self.loop.run_until_complete(self._ws_async.close())
+            self.run_async(self._ws_async.close())
 
-        if self.loop and not self.loop.is_closed():
+        if loop_thread:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            loop_thread.join()
+            self._loop_thread = None
+        if loop_open:
             self.loop.close()
 
     def _init_async_loop(self) -> asyncio.AbstractEventLoop:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        return loop
+        return asyncio.new_event_loop()
+
+    def _start_loop_thread(self) -> None:
+        """
+        Run the event loop in a dedicated (daemon) thread, unless it's already running.
+        """
+        with self._loop_lock:
+            if self._loop_thread is None:
+                self._loop_thread = Thread(
+                    name="exchange_loop", target=self.loop.run_forever, daemon=True
+                )
+                self._loop_thread.start()
 
     def validate_config(self, config: Config) -> None:
         # Check if timeframe is available
@@ -637,6 +676,20 @@ class Exchange:
         if self._exchange_ws:
             self._exchange_ws.reset_connections()
 
+    def set_candle_close_callback(
+        self, callback: Callable[[str, str, CandleType], None] | None
+    ) -> bool:
+        """
+        Register a callback, called as soon as the websocket receives the first update
+        of a new candle (so the previous candle closed).
+        :param callback: Callable receiving pair, timeframe and candle_type
+        :return: True if the callback was registered, False if websockets are not in use
+        """
+        if self._exchange_ws:
+            self._exchange_ws.candle_close_callback = callback
+            return True
+        return False
+
     async def _api_reload_markets(self, reload: bool = False) -> None:
         try:
             await self._api_async.load_markets(reload=reload, params={})
@@ -651,8 +704,7 @@ class Exchange:
 
     def _load_async_markets(self, reload: bool = False) -> None:
         try:
-            with self._loop_lock:
-                markets = self.loop.run_until_complete(self._api_reload_markets(reload=reload))
+            markets = self.run_async(self._api_reload_markets(reload=reload))
 
             if isinstance(markets, Exception):
                 raise markets
@@ -2375,19 +2427,61 @@ class Exchange:
         :param until_ms: Timestamp in milliseconds to get history up to
         :return: Dataframe with candle (OHLCV) data
         """
-        with self._loop_lock:
-            pair, _, _, data, _ = self.loop.run_until_complete(
-                self._async_get_historic_ohlcv(
-                    pair=pair,
-                    timeframe=timeframe,
-                    since_ms=since_ms,
-                    until_ms=until_ms,
-                    candle_type=candle_type,
-                    raise_=True,
-                )
+        return self.run_async(
+            self.get_historic_ohlcv_async(
+                pair=pair,
+                timeframe=timeframe,
+                since_ms=since_ms,
+                candle_type=candle_type,
+                is_new_pair=is_new_pair,
+                until_ms=until_ms,
             )
+        )
+
+    async def get_historic_ohlcv_async(
+        self,
+        pair: str,
+        timeframe: str,
+        since_ms: int,
+        candle_type: CandleType,
+        is_new_pair: bool = False,
+        until_ms: int | None = None,
+    ) -> DataFrame:
+        """
+        Coroutine variant of get_historic_ohlcv().
+        Allows multiple downloads to run concurrently on the exchange's event loop (see run_async).
+        Requests are throttled by ccxt's rate limiter, candles are converted to a dataframe
+        in a worker thread to not block the event loop.
+        Arguments and return value match get_historic_ohlcv().
+        """
+        pair, _, _, data, _ = await self._async_get_historic_ohlcv(
+            pair=pair,
+            timeframe=timeframe,
+            since_ms=since_ms,
+            until_ms=until_ms,
+            candle_type=candle_type,
+            raise_=True,
+        )
         logger.debug(f"Downloaded data for {pair} from ccxt with length {len(data)}.")
-        return ohlcv_to_dataframe(data, timeframe, pair, fill_missing=False, drop_incomplete=True)
+        return await asyncio.to_thread(
+            ohlcv_to_dataframe, data, timeframe, pair, fill_missing=False, drop_incomplete=True
+        )
+
+    def run_async(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the exchange's event loop and wait for the result.
+        Thread-safe - coroutines submitted from different threads run concurrently.
+        The coroutine is cancelled if waiting is interrupted (e.g. by KeyboardInterrupt).
+        :param coro: Coroutine to run - usually combining multiple exchange coroutines.
+        :return: Result of the coroutine
+        """
+        self._start_loop_thread()
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
 
     async def _async_get_historic_ohlcv(
         self,
@@ -2442,20 +2536,43 @@ class Exchange:
         Try to build a coroutine to get data from websocket.
         """
         if self._can_use_websocket(self._exchange_ws, pair, timeframe, candle_type):
+            paircomb = (pair, timeframe, candle_type)
+            if (
+                self._ws_ingest_all
+                and dt_ts() - self._ws_last_reconcile.get(paircomb, 0)
+                >= self._ws_reconcile_interval
+            ):
+                logger.debug(f"Reconciling websocket candles for {paircomb} via REST api.")
+                return None
             candle_ts = dt_ts(timeframe_to_prev_date(timeframe))
             prev_candle_ts = dt_ts(date_minus_candles(timeframe, 1))
-            candles = self._exchange_ws.ohlcvs(pair, timeframe)
+            # Only copy candles which are not yet in the cache
+            cached = self._klines.get(paircomb)
+            since_ms = None
+            if cached is not None and not cached.empty:
+                since_ms = dt_ts(cached["date"].iloc[-1])
+            candles = self._exchange_ws.ohlcvs(pair, timeframe, since_ms)
             half_candle = int(candle_ts - (candle_ts - prev_candle_ts) * 0.5)
-            last_refresh_time = int(
-                self._exchange_ws.klines_last_refresh.get((pair, timeframe, candle_type), 0)
-            )
+            last_refresh_time = int(self._exchange_ws.klines_last_refresh.get(paircomb, 0))
+
+            if (
+                since_ms is not None
+                and candles
+                and candles[0][0] > since_ms + timeframe_to_msecs(timeframe)
+            ):
+                # Websocket data doesn't connect to the cached candles
+                logger.info(
+                    f"Gap between cached and websocket candles for {pair}, {timeframe}, "
+                    "falling back to REST api."
+                )
+                return None
 
             if (
                 candles
                 and (
-                    (len(candles) > 1 and candles[-1][0] >= prev_candle_ts)
+                    candles[-1][0] >= prev_candle_ts
                     # Edgecase on reconnect, where 1 candle is available but it's the current one
-                    or (len(candles) == 1 and candles[-1][0] < candle_ts)
+                    or (since_ms is None and len(candles) == 1 and candles[-1][0] < candle_ts)
                 )
                 and last_refresh_time >= half_candle
             ):
@@ -2463,7 +2580,9 @@ class Exchange:
                 # Also, we check if the last refresh time is no more than half the candle ago.
                 logger.debug(f"reuse watch result for {pair}, {timeframe}, {last_refresh_time}")
 
-                return self._exchange_ws.get_ohlcv(pair, timeframe, candle_type, candle_ts)
+                return self._exchange_ws.get_ohlcv(
+                    pair, timeframe, candle_type, candle_ts, since_ms
+                )
             logger.info(
                 f"Couldn't reuse watch for {pair}, {timeframe}, falling back to REST api. "
                 f"{candle_ts < last_refresh_time}, {candle_ts}, {last_refresh_time}, "
@@ -2491,7 +2610,8 @@ class Exchange:
         cache: bool,
     ) -> Coroutine[Any, Any, OHLCVResponse]:
         not_all_data = cache and self.required_candle_call_count > 1
-        if cache:
+        if cache and not self._ws_ingest_all:
+            # With ws_ingest_all, subscriptions are handled in _build_ohlcv_dl_jobs
             if self._can_use_websocket(self._exchange_ws, pair, timeframe, candle_type):
                 # Subscribe to websocket
                 self._exchange_ws.schedule_ohlcv(pair, timeframe, candle_type)
@@ -2515,6 +2635,10 @@ class Exchange:
                 )
                 del self._klines[(pair, timeframe, candle_type)]
 
+        if cache and self._ws_ingest_all:
+            # Candles are loaded from the REST api - no reconciliation necessary for a while
+            self._ws_last_reconcile[(pair, timeframe, candle_type)] = dt_ts()
+
         if not since_ms and (self._ft_has["ohlcv_require_since"] or not_all_data):
             # Multiple calls for one pair - to get more history
             one_call = timeframe_to_msecs(timeframe) * self.ohlcv_candle_limit(
@@ -2554,6 +2678,14 @@ class Exchange:
                 )
                 continue
 
+            if (
+                cache
+                and self._ws_ingest_all
+                and self._can_use_websocket(self._exchange_ws, pair, timeframe, candle_type)
+            ):
+                # Keep streaming candles for all pairs - not only the ones due for refresh
+                self._exchange_ws.schedule_ohlcv(pair, timeframe, candle_type)
+
             if (
                 (pair, timeframe, candle_type) not in self._klines
                 or not cache
@@ -2589,23 +2721,13 @@ class Exchange:
             ticks, timeframe, pair=pair, fill_missing=True, drop_incomplete=drop_incomplete
         )
         if cache:
-            if (pair, timeframe, c_type) in self._klines:
-                old = self._klines[(pair, timeframe, c_type)]
-                # Reassign so we return the updated, combined df
-                ohlcv_df = clean_ohlcv_dataframe(
-                    concat([old, ohlcv_df], axis=0),
-                    timeframe,
-                    pair,
-                    fill_missing=True,
-                    drop_incomplete=False,
-                )
-                candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
-                # Age out old candles
-                ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
-                ohlcv_df = ohlcv_df.reset_index(drop=True)
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
-            else:
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
+            candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
+            # Merge with cached candles, ageing out old candles
+            ohlcv_df = self._klines.update_candles(
+                (pair, timeframe, c_type),
+                ohlcv_df,
+                capacity=candle_limit + self._startup_candle_count,
+            )
         return ohlcv_df
 
     def refresh_latest_ohlcv(
@@ -2639,8 +2761,7 @@ class Exchange:
             async def gather_coroutines(coro):
                 return await asyncio.gather(*coro, return_exceptions=True)
 
-            with self._loop_lock:
-                results = self.loop.run_until_complete(gather_coroutines(dl_jobs_batch))
+            results = self.run_async(gather_coroutines(dl_jobs_batch))
 
             for res in results:
                 if isinstance(res, Exception):
@@ -2956,8 +3077,7 @@ class Exchange:
             return await asyncio.gather(*coro, return_exceptions=True)
 
         for dl_job_chunk in chunks(trades_dl_jobs, 100):
-            with self._loop_lock:
-                results = self.loop.run_until_complete(gather_coroutines(dl_job_chunk))
+            results = self.run_async(gather_coroutines(dl_job_chunk))
 
             for res in results:
                 if isinstance(res, Exception):
@@ -3053,7 +3173,13 @@ class Exchange:
         return await self._async_fetch_trades(pair, since=since)
 
     async def _async_get_trade_history_id(
-        self, pair: str, *, until: int, since: int, from_id: str | None = None
+        self,
+        pair: str,
+        *,
+        until: int,
+        since: int,
+        from_id: str | None = None,
+        sink: TradesSink | None = None,
     ) -> tuple[str, list[list]]:
         """
         Asynchronously gets trade history using fetch_trades
@@ -3062,6 +3188,8 @@ class Exchange:
         :param since: Since as integer timestamp in milliseconds
         :param until: Until as integer timestamp in milliseconds
         :param from_id: Download data starting with ID (if id is known). Ignores "since" if set.
+        :param sink: Receives trades in batches, see get_historic_trades().
+            Not used by the REST api implementation.
         returns tuple: (pair, trades-list)
         """
 
@@ -3151,6 +3279,7 @@ class Exchange:
         since: int,
         until: int | None = None,
         from_id: str | None = None,
+        sink: TradesSink | None = None,
     ) -> tuple[str, list[list]]:
         """
         Async wrapper handling downloading trades using either time or id based methods.
@@ -3169,7 +3298,7 @@ class Exchange:
             return await self._async_get_trade_history_time(pair=pair, since=since, until=until)
         elif self._trades_pagination == "id":
             return await self._async_get_trade_history_id(
-                pair=pair, since=since, until=until, from_id=from_id
+                pair=pair, since=since, until=until, from_id=from_id, sink=sink
             )
         else:
             raise OperationalException(
@@ -3182,6 +3311,7 @@ class Exchange:
         since: int,
         until: int | None = None,
         from_id: str | None = None,
+        sink: TradesSink | None = None,
     ) -> tuple[str, list]:
         """
         Get trade history data using asyncio.
@@ -3191,23 +3321,21 @@ class Exchange:
         :param since: Timestamp in milliseconds to get history from
         :param until: Timestamp in milliseconds. Defaults to current timestamp if not defined.
         :param from_id: Download data starting with ID (if id is known)
+        :param sink: Optional callable receiving trades as DataFrame (DEFAULT_TRADES_COLUMNS),
+            in batches and in chronological order. Exchanges supporting it pass bulk data
+            to the sink as it's downloaded - these trades are not part of the returned list.
+            The returned trades follow the trades passed to the sink.
         :returns List of trade data
         """
         if not self.exchange_has("fetchTrades"):
             raise OperationalException("This exchange does not support downloading Trades.")
 
-        with self._loop_lock:
-            task = asyncio.ensure_future(
-                self._async_get_trade_history(pair=pair, since=since, until=until, from_id=from_id)
+        # Interrupting the download (e.g. Ctrl+C) cancels the running task.
+        return self.run_async(
+            self._async_get_trade_history(
+                pair=pair, since=since, until=until, from_id=from_id, sink=sink
             )
-
-            for sig in [signal.SIGINT, signal.SIGTERM]:
-                try:
-                    self.loop.add_signal_handler(sig, task.cancel)
-                except NotImplementedError:
-                    # Not all platforms implement signals (e.g. windows)
-                    pass
-            return self.loop.run_until_complete(task)
+        )
 
     @retrier
     def _get_funding_fees_from_exchange(self, pair: str, since: datetime | int) -> float:
@@ -3314,8 +3442,7 @@ class Exchange:
                     return await asyncio.gather(*input_coro, return_exceptions=True)
 
                 for input_coro in chunks(coros, 100):
-                    with self._loop_lock:
-                        results = self.loop.run_until_complete(gather_results(input_coro))
+                    results = self.run_async(gather_results(input_coro))
 
                     for res in results:
                         if isinstance(res, Exception):
@@ -3331,11 +3458,22 @@ class Exchange:
         return {}
 
     def cache_leverage_tiers(self, tiers: dict[str, list[dict]], stake_currency: str) -> None:
+        """
+        Store leverage tiers on disk.
+        Symbols loaded from the cache keep their update time, so they expire independently
+        of newly fetched symbols.
+        """
         filename = self._config["datadir"] / "futures" / f"leverage_tiers_{stake_currency}.json"
         if not filename.parent.is_dir():
             filename.parent.mkdir(parents=True)
+        now = datetime.now(timezone.utc)
+        self._leverage_tiers_cached_at = {
+            symbol: self._leverage_tiers_cached_at.get(symbol, now) for symbol in tiers
+        }
         data = {
-            "updated": datetime.now(timezone.utc),
+            "version": LEVERAGE_TIERS_CACHE_VERSION,
+            "updated": now,
+            "symbols_updated": self._leverage_tiers_cached_at,
             "data": tiers,
         }
         file_dump_json(filename, data)
@@ -3345,22 +3483,40 @@ class Exchange:
     ) -> dict[str, list[dict]] | None:
         """
         Load cached leverage tiers from disk
+        Outdated symbols are omitted, so only these need to be refreshed.
         :param cache_time: The maximum age of the cache before it is considered outdated
+        :return: Cached tiers per symbol, None if no up-to-date tiers are available.
         """
         if not cache_time:
             # Default to 4 weeks
             cache_time = timedelta(weeks=4)
+        self._leverage_tiers_cached_at = {}
         filename = self._config["datadir"] / "futures" / f"leverage_tiers_{stake_currency}.json"
         if filename.is_file():
             try:
                 tiers = file_load_json(filename)
+                if tiers.get("version", 1) > LEVERAGE_TIERS_CACHE_VERSION:
+                    logger.info("Cached leverage tiers use an unknown format. Will update.")
+                    return None
                 updated = tiers.get("updated")
-                if updated:
-                    updated_dt = parser.parse(updated)
-                    if updated_dt < datetime.now(timezone.utc) - cache_time:
-                        logger.info("Cached leverage tiers are outdated. Will update.")
-                        return None
-                return tiers.get("data")
+                symbols_updated = tiers.get("symbols_updated", {})
+                outdated_before = datetime.now(timezone.utc) - cache_time
+                data: dict[str, list[dict]] = {}
+                cached_at: dict[str, datetime] = {}
+                outdated = False
+                for symbol, symbol_tiers in tiers.get("data", {}).items():
+                    symbol_updated = symbols_updated.get(symbol, updated)
+                    if symbol_updated:
+                        updated_dt = parser.parse(symbol_updated)
+                        if updated_dt < outdated_before:
+                            outdated = True
+                            continue
+                        cached_at[symbol] = updated_dt
+                    data[symbol] = symbol_tiers
+                if outdated:
+                    logger.info("Cached leverage tiers are outdated. Will update.")
+                self._leverage_tiers_cached_at = cached_at
+                return data or None
             except Exception:
                 logger.exception("Error loading cached leverage tiers. Refreshing.")
         return None
@@ -3404,27 +3560,18 @@ class Exchange:
                     f"{self.name}.get_max_leverage requires argument stake_amount"
                 )
 
-            if pair not in self._leverage_tiers:
+            tier_index = self._get_leverage_tier_index(pair)
+            if tier_index is None:
                 # Maybe raise exception because it can't be traded on futures?
                 return 1.0
 
-            pair_tiers = self._leverage_tiers[pair]
-
-            if stake_amount == 0:
-                return pair_tiers[0]["maxLeverage"]  # Max lev for lowest amount
-
-            # Find the appropriate tier based on stake_amount
-            prior_max_lev = None
-            for tier in pair_tiers:
-                min_stake = tier["minNotional"] / (prior_max_lev or tier["maxLeverage"])
-                max_stake = tier["maxNotional"] / tier["maxLeverage"]
-                prior_max_lev = tier["maxLeverage"]
-                # Adjust notional by leverage to do a proper comparison
-                if min_stake <= stake_amount <= max_stake:
-                    return tier["maxLeverage"]
+            # Find the appropriate tier based on stake_amount (max lev for lowest amount if 0)
+            max_leverage = tier_index.max_leverage(stake_amount)
+            if max_leverage is not None:
+                return max_leverage
 
             #     else:  # if on the last tier
-            if stake_amount > max_stake:
+            if stake_amount > tier_index.max_stake():
                 # If stake is > than max tradeable amount
                 raise InvalidOrderException(f"Amount {stake_amount} too high for {pair}")
 
@@ -3451,13 +3598,24 @@ class Exchange:
         """
         if self.trading_mode != TradingMode.FUTURES:
             return None
-        if pair not in self._leverage_tiers:
+        tier_index = self._get_leverage_tier_index(pair)
+        if tier_index is None:
             return None
-        pair_tiers = self._leverage_tiers[pair]
-        for tier in reversed(pair_tiers):
-            if leverage <= tier["maxLeverage"]:
-                return tier["maxNotional"]
-        return None
+        return tier_index.max_notional(leverage)
+
+    def _get_leverage_tier_index(self, pair: str) -> LeverageTierIndex | None:
+        """
+        Indexed leverage tiers for pair - rebuilt whenever the tiers of the pair are replaced.
+        :return: LeverageTierIndex, or None if there are no leverage tiers for this pair.
+        """
+        pair_tiers = self._leverage_tiers.get(pair)
+        if pair_tiers is None:
+            return None
+        tier_index = self._leverage_tier_index.get(pair)
+        if tier_index is None or tier_index.tiers is not pair_tiers:
+            tier_index = LeverageTierIndex(pair_tiers)
+            self._leverage_tier_index[pair] = tier_index
+        return tier_index
 
     @retrier
     def _set_leverage(
@@ -3639,7 +3797,7 @@ class Exchange:
 
     def calculate_funding_fees(
         self,
-        df: DataFrame,
+        df: DataFrame | FundingFeeIndex,
         amount: float,
         is_short: bool,
         open_date: datetime,
@@ -3650,6 +3808,7 @@ class Exchange:
         calculates the sum of all funding fees that occurred for a pair during a futures trade
         :param df: Dataframe containing combined funding and mark rates
                    as `open_fund` and `open_mark`.
+                   Or a FundingFeeIndex built from it, for repeated calculations (backtesting).
         :param amount: The quantity of the trade
         :param is_short: trade direction
         :param open_date: The date and time that the trade started
@@ -3658,7 +3817,9 @@ class Exchange:
         """
         fees: float = 0
 
-        if not df.empty:
+        if isinstance(df, FundingFeeIndex):
+            fees = df.funding_between(open_date, close_date) * amount
+        elif not df.empty:
             df1 = df[(df["date"] >= open_date) & (df["date"] <= close_date)]
             fees = sum(df1["open_fund"] * df1["open_mark"] * amount)
         if isnan(fees):
@@ -3813,16 +3974,15 @@ class Exchange:
             or self.exchange_has("fetchLeverageTiers")
             or self.exchange_has("fetchMarketLeverageTiers")
         ):
-            if pair not in self._leverage_tiers:
+            tier_index = self._get_leverage_tier_index(pair)
+            if tier_index is None:
                 raise InvalidOrderException(
                     f"Maintenance margin rate for {pair} is unavailable for {self.name}"
                 )
 
-            pair_tiers = self._leverage_tiers[pair]
-
-            for tier in reversed(pair_tiers):
-                if notional_value >= tier["minNotional"]:
-                    return (tier["maintenanceMarginRate"], tier["maintAmt"])
+            tier = tier_index.maintenance_tier(notional_value)
+            if tier is not None:
+                return (tier["maintenanceMarginRate"], tier["maintAmt"])
 
             raise ExchangeError("nominal value can not be lower than 0")
             # The lowest notional_floor for any pair in fetch_leverage_tiers is always 0 because it
@@ -1,5 +1,8 @@
+from collections.abc import Callable
 from typing import Any, Literal, TypedDict
 
+from pandas import DataFrame
+
 from freqtrade.enums import CandleType
 
 
@@ -106,3 +109,6 @@ CcxtOrder = dict[str, Any]
 
 # pair, timeframe, candleType, OHLCV, drop last?,
 OHLCVResponse = tuple[str, str, CandleType, list, bool]
+
+# Receives downloaded trades in batches (DEFAULT_TRADES_COLUMNS)
+TradesSink = Callable[[DataFrame], None]
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 import time
-from copy import deepcopy
+from collections.abc import Callable
 from functools import partial
 from threading import Thread
 
@@ -29,6 +29,8 @@ class ExchangeWS:
         self._klines_scheduled: set[PairWithTimeframe] = set()
         self.klines_last_refresh: dict[PairWithTimeframe, float] = {}
         self.klines_last_request: dict[PairWithTimeframe, float] = {}
+        # Called (from the websocket thread) once a new candle starts - so the previous one closed
+        self.candle_close_callback: Callable[[str, str, CandleType], None] | None = None
         self._thread = Thread(name="ccxt_ws", target=self._start_forever)
         self._thread.start()
         self.__cleanup_called = False
@@ -87,18 +89,26 @@ class ExchangeWS:
         self.klines_last_refresh.pop(paircomb, None)
 
     @retrier(retries=3)
-    def ohlcvs(self, pair: str, timeframe: str) -> list[list]:
+    def ohlcvs(self, pair: str, timeframe: str, since_ms: int | None = None) -> list[list]:
         """
         Returns a copy of the klines for a pair/timeframe combination
         Note: this will only contain the data received from the websocket
             so the data will build up over time.
+        :param since_ms: Only return candles starting at or after this timestamp.
+            Avoids copying the whole cache if only the most recent candles are needed.
         """
         try:
-            return deepcopy(self._ccxt_object.ohlcvs.get(pair, {}).get(timeframe, []))
-        except RuntimeError as e:
+            candles = self._ccxt_object.ohlcvs.get(pair, {}).get(timeframe, [])
+            start = 0
+            if since_ms is not None:
+                start = len(candles)
+                while start > 0 and candles[start - 1][0] >= since_ms:
+                    start -= 1
+            return [list(candle) for candle in candles[start:]]
+        except (RuntimeError, IndexError) as e:
             # Capture runtime errors and retry
             # TemporaryError does not cause backoff - so we're essentially retrying immediately
-            raise TemporaryError(f"Error deepcopying: {e}") from e
+            raise TemporaryError(f"Error copying candles: {e}") from e
 
     def cleanup_expired(self) -> None:
         """
@@ -170,11 +180,17 @@ class ExchangeWS:
     async def _continuously_async_watch_ohlcv(
         self, pair: str, timeframe: str, candle_type: CandleType
     ) -> None:
+        last_candle_ts = 0
         try:
             while (pair, timeframe, candle_type) in self._klines_watching:
                 start = dt_ts()
                 data = await self._ccxt_object.watch_ohlcv(pair, timeframe)
                 self.klines_last_refresh[(pair, timeframe, candle_type)] = dt_ts()
+                if data:
+                    candle_ts = data[-1][0]
+                    if last_candle_ts and candle_ts > last_candle_ts:
+                        self._candle_closed(pair, timeframe, candle_type)
+                    last_candle_ts = max(last_candle_ts, candle_ts)
                 logger.debug(
                     f"watch done {pair}, {timeframe}, data {len(data)} "
                     f"in {(dt_ts() - start) / 1000:.3f}s"
@@ -186,14 +202,23 @@ class ExchangeWS:
         finally:
             self._klines_watching.discard((pair, timeframe, candle_type))
 
+    def _candle_closed(self, pair: str, timeframe: str, candle_type: CandleType) -> None:
+        if self.candle_close_callback:
+            try:
+                self.candle_close_callback(pair, timeframe, candle_type)
+            except Exception:
+                logger.exception(f"Exception in candle close callback for {pair}, {timeframe}")
+
     def schedule_ohlcv(self, pair: str, timeframe: str, candle_type: CandleType) -> None:
         """
-        Schedule a pair/timeframe combination to be watched
+        Schedule a pair/timeframe combination to be watched.
+        Pairs which are already watched only get their last request time updated.
         """
-        self._klines_watching.add((pair, timeframe, candle_type))
-        self.klines_last_request[(pair, timeframe, candle_type)] = dt_ts()
-        # asyncio.run_coroutine_threadsafe(self.schedule_schedule(), loop=self._loop)
-        asyncio.run_coroutine_threadsafe(self._schedule_while_true(), loop=self._loop)
+        paircomb = (pair, timeframe, candle_type)
+        self.klines_last_request[paircomb] = dt_ts()
+        if paircomb not in self._klines_watching or paircomb not in self._klines_scheduled:
+            self._klines_watching.add(paircomb)
+            asyncio.run_coroutine_threadsafe(self._schedule_while_true(), loop=self._loop)
         self.cleanup_expired()
 
     async def get_ohlcv(
@@ -202,13 +227,15 @@ class ExchangeWS:
         timeframe: str,
         candle_type: CandleType,
         candle_ts: int,
+        since_ms: int | None = None,
     ) -> OHLCVResponse:
         """
         Returns cached klines from ccxt's "watch" cache.
         :param candle_ts: timestamp of the end-time of the candle we expect.
+        :param since_ms: Only return candles starting at or after this timestamp.
         """
-        # Deepcopy the response - as it might be modified in the background as new messages arrive
-        candles = self.ohlcvs(pair, timeframe)
+        # Copy the response - as it might be modified in the background as new messages arrive
+        candles = self.ohlcvs(pair, timeframe, since_ms)
         refresh_date = self.klines_last_refresh[(pair, timeframe, candle_type)]
         received_ts = candles[-1][0] if candles else 0
         drop_hint = received_ts >= candle_ts
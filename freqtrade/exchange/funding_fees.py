@@ -0,0 +1,54 @@
+"""
+Cumulative funding index, used to calculate funding fees for arbitrary periods.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+
+class FundingFeeIndex:
+    """
+    Prefix sums of funding rate x mark price over the funding timestamps of one pair.
+    Built once from combined funding / mark rates (see Exchange.combine_funding_and_mark()),
+    the funding for any period is then a lookup of 2 positions - instead of filtering
+    the dataframe for every trade.
+    """
+
+    def __init__(self, df: DataFrame):
+        if df.empty:
+            dates = np.array([], dtype=np.int64)
+            values = np.array([], dtype=np.float64)
+        else:
+            df = df.sort_values("date", kind="stable")
+            dates = pd.DatetimeIndex(df["date"]).as_unit("ns").asi8
+            values = (df["open_fund"] * df["open_mark"]).to_numpy(dtype=np.float64)
+        self._dates = dates
+        isnan = np.isnan(values)
+        # Leading 0 so the sum of [lo, hi) is cumsum[hi] - cumsum[lo]
+        self._cumsum = np.concatenate(([0.0], np.cumsum(np.where(isnan, 0.0, values))))
+        self._nan_count = np.concatenate(([0], np.cumsum(isnan)))
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the index arrays"""
+        return self._dates.nbytes + self._cumsum.nbytes + self._nan_count.nbytes
+
+    def funding_between(self, open_date: datetime, close_date: datetime) -> float:
+        """
+        Sum of funding rate x mark price for all funding timestamps within
+        open_date and close_date (both inclusive).
+        :return: Sum, NaN if a rate within the period is unavailable.
+        """
+        lo = np.searchsorted(self._dates, pd.Timestamp(open_date).value, side="left")
+        hi = np.searchsorted(self._dates, pd.Timestamp(close_date).value, side="right")
+        if hi <= lo:
+            return 0.0
+        if self._nan_count[hi] - self._nan_count[lo] > 0:
+            return float("nan")
+        return float(self._cumsum[hi] - self._cumsum[lo])
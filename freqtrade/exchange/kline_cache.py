@@ -0,0 +1,178 @@
+"""
+In-memory candle (kline) cache used by the exchange class.
+"""
+
+import logging
+from collections.abc import Iterator, MutableMapping
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, concat
+
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, PairWithTimeframe
+from freqtrade.data.converter import clean_ohlcv_dataframe
+from freqtrade.exchange.exchange_utils_timeframe import timeframe_to_seconds
+
+
+logger = logging.getLogger(__name__)
+
+_VALUE_COLUMNS = DEFAULT_DATAFRAME_COLUMNS[1:]
+
+
+class OHLCVBuffer:
+    """
+    Fixed-capacity columnar buffer holding the candles of one pair / timeframe / candle type.
+    Candles are stored in preallocated arrays, with some headroom to append new candles.
+    Once the headroom is used up, the newest `capacity` candles are moved to new arrays.
+    Written candles are never modified, so dataframes returned by `to_dataframe()`
+    (which are views on the arrays) don't change with later updates.
+    """
+
+    def __init__(self, df: DataFrame, capacity: int):
+        self.capacity = max(capacity, 1)
+        self._headroom = max(self.capacity // 4, 16)
+        df = df.tail(self.capacity)
+        self._allocate(len(df))
+        self._dates[: len(df)] = df["date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+        self._values[: len(df)] = df.loc[:, _VALUE_COLUMNS].to_numpy(dtype=np.float64)
+        self._start = 0
+        self._end = len(df)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def _allocate(self, rows: int) -> None:
+        size = max(rows, self.capacity) + self._headroom
+        self._dates = np.empty(size, dtype=np.int64)
+        self._values = np.empty((size, len(_VALUE_COLUMNS)), dtype=np.float64)
+
+    def _reallocate(self, keep_until: int, extra: int) -> None:
+        """
+        Move the candles up to `keep_until` to new arrays, making room for `extra` candles.
+        Only the candles which are still within capacity after adding `extra` are kept.
+        """
+        keep_from = max(self._start, keep_until - max(self.capacity - extra, 0))
+        dates = self._dates[keep_from:keep_until]
+        values = self._values[keep_from:keep_until]
+        self._allocate(len(dates) + extra)
+        self._dates[: len(dates)] = dates
+        self._values[: len(dates)] = values
+        self._start = 0
+        self._end = len(dates)
+
+    def append(self, new: DataFrame, timeframe: str) -> bool:
+        """
+        Append candles to the buffer.
+        Candles already in the buffer are replaced by the new candles.
+        :param new: Sorted, gap-free candles (as returned by ohlcv_to_dataframe())
+        :param timeframe: Timeframe of the candles
+        :return: False if the candles can't be appended without hole or reordering.
+        """
+        if new.empty:
+            return True
+        if len(self) == 0:
+            return False
+        new_dates = new["date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+        dates = self._dates[self._start : self._end]
+        if new_dates[0] < dates[0] or new_dates[-1] < dates[-1]:
+            return False
+        cut = self._start + int(np.searchsorted(dates, new_dates[0]))
+        overlap = self._end - cut
+        if overlap == 0 and new_dates[0] != dates[-1] + timeframe_to_seconds(timeframe) * 10**9:
+            # Hole in the data
+            return False
+        if overlap > len(new):
+            return False
+
+        new_values = new.loc[:, _VALUE_COLUMNS].to_numpy(dtype=np.float64)
+        if overlap and (
+            np.array_equal(self._dates[cut : self._end], new_dates[:overlap])
+            and np.array_equal(self._values[cut : self._end], new_values[:overlap], equal_nan=True)
+        ):
+            # Overlapping candles didn't change
+            new_dates = new_dates[overlap:]
+            new_values = new_values[overlap:]
+        elif overlap:
+            # Overlapping candles changed - replace them in new arrays
+            self._reallocate(cut, len(new_dates))
+
+        rows = len(new_dates)
+        if self._end + rows > len(self._dates):
+            self._reallocate(self._end, rows)
+        self._dates[self._end : self._end + rows] = new_dates
+        self._values[self._end : self._end + rows] = new_values
+        self._end += rows
+        self._start = max(self._start, self._end - self.capacity)
+        return True
+
+    def to_dataframe(self) -> DataFrame:
+        """
+        Return the buffered candles as dataframe.
+        Price and volume columns are views on the buffer - the dataframe must not be modified.
+        """
+        df = DataFrame(self._values[self._start : self._end], columns=_VALUE_COLUMNS, copy=False)
+        df.insert(
+            0, "date", pd.to_datetime(self._dates[self._start : self._end], unit="ns", utc=True)
+        )
+        return df
+
+
+class KlineCache(MutableMapping[PairWithTimeframe, DataFrame]):
+    """
+    Mapping of (pair, timeframe, candle_type) to the cached candles.
+    Dataframes assigned directly are returned as is. Once updated via `update_candles()`,
+    candles are kept in an OHLCVBuffer with bounded size.
+    """
+
+    def __init__(self) -> None:
+        self._frames: dict[PairWithTimeframe, DataFrame] = {}
+        self._buffers: dict[PairWithTimeframe, OHLCVBuffer] = {}
+
+    def __getitem__(self, key: PairWithTimeframe) -> DataFrame:
+        return self._frames[key]
+
+    def __setitem__(self, key: PairWithTimeframe, value: DataFrame) -> None:
+        self._frames[key] = value
+        self._buffers.pop(key, None)
+
+    def __delitem__(self, key: PairWithTimeframe) -> None:
+        del self._frames[key]
+        self._buffers.pop(key, None)
+
+    def __iter__(self) -> Iterator[PairWithTimeframe]:
+        return iter(self._frames)
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def update_candles(self, key: PairWithTimeframe, new: DataFrame, capacity: int) -> DataFrame:
+        """
+        Add new candles to the cache, keeping at most `capacity` candles.
+        :param key: (pair, timeframe, candle_type) to update
+        :param new: Sorted, gap-free candles (as returned by ohlcv_to_dataframe())
+        :param capacity: Maximum number of candles to keep
+        :return: Updated candles for this key
+        """
+        pair, timeframe, _ = key
+        if key not in self._frames:
+            self[key] = new
+            return new
+        buffer = self._buffers.get(key)
+        if buffer is None or buffer.capacity != capacity:
+            buffer = OHLCVBuffer(self._frames[key], capacity)
+
+        if not buffer.append(new, timeframe):
+            # Candles don't line up with the cached candles - merge and fill up the holes.
+            combined = clean_ohlcv_dataframe(
+                concat([self._frames[key], new], axis=0),
+                timeframe,
+                pair,
+                fill_missing=True,
+                drop_incomplete=False,
+            )
+            buffer = OHLCVBuffer(combined, capacity)
+
+        df = buffer.to_dataframe()
+        self._frames[key] = df
+        self._buffers[key] = buffer
+        return df
@@ -13,6 +13,7 @@ from freqtrade.exceptions import DDosProtection, OperationalException, Temporary
 from freqtrade.exchange import Exchange
 from freqtrade.exchange.common import retrier
 from freqtrade.exchange.exchange_types import CcxtBalances, FtHas
+from freqtrade.exchange.funding_fees import FundingFeeIndex
 
 
 logger = logging.getLogger(__name__)
@@ -147,7 +148,7 @@ class Kraken(Exchange):
 
     def calculate_funding_fees(
         self,
-        df: DataFrame,
+        df: DataFrame | FundingFeeIndex,
         amount: float,
         is_short: bool,
         open_date: datetime,
@@ -174,7 +175,9 @@ class Kraken(Exchange):
             )
         fees: float = 0
 
-        if not df.empty:
+        if isinstance(df, FundingFeeIndex):
+            fees = df.funding_between(open_date, close_date) * amount * time_in_ratio
+        elif not df.empty:
             df = df[(df["date"] >= open_date) & (df["date"] <= close_date)]
             fees = sum(df["open_fund"] * df["open_mark"] * amount * time_in_ratio)
 
@@ -0,0 +1,83 @@
+"""
+Indexed lookups into the (parsed) leverage tiers of one pair.
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import pairwise
+
+
+class LeverageTierIndex:
+    """
+    Precomputed tier boundaries for one pair, allowing bisect based lookups.
+    Tiers are expected in ascending order (as returned by the exchanges). Lookups fall back
+    to a linear scan if the boundaries are not sorted - so results don't depend on the order.
+    Results are identical to iterating over the tiers.
+    """
+
+    def __init__(self, tiers: list[dict]):
+        # Kept to detect when the tiers of a pair were replaced.
+        self.tiers = tiers
+        self._min_notional = [tier["minNotional"] for tier in tiers]
+        self._max_leverage = [tier["maxLeverage"] for tier in tiers]
+        self._max_stake = [tier["maxNotional"] / tier["maxLeverage"] for tier in tiers]
+        # The minimum stake of a tier is based on the leverage of the prior tier
+        prior_max_lev = [self._max_leverage[0], *self._max_leverage[:-1]] if tiers else []
+        self._min_stake = [
+            min_notional / (prior_lev or max_lev)
+            for min_notional, prior_lev, max_lev in zip(
+                self._min_notional, prior_max_lev, self._max_leverage, strict=True
+            )
+        ]
+        # Negated, so max leverage is ascending for bisect
+        self._neg_max_leverage = [-lev for lev in self._max_leverage]
+        self._min_notional_sorted = _is_sorted(self._min_notional)
+        self._max_stake_sorted = _is_sorted(self._max_stake)
+        self._max_leverage_sorted = _is_sorted(self._neg_max_leverage)
+
+    def max_leverage(self, stake_amount: float) -> float | None:
+        """
+        Max leverage of the first tier containing stake_amount.
+        :return: Max leverage, or None if no tier contains stake_amount
+        """
+        if stake_amount == 0:
+            return self._max_leverage[0]
+        # Tiers before `start` end below stake_amount
+        start = bisect_left(self._max_stake, stake_amount) if self._max_stake_sorted else 0
+        for i in range(start, len(self.tiers)):
+            if self._min_stake[i] <= stake_amount <= self._max_stake[i]:
+                return self._max_leverage[i]
+        return None
+
+    def max_stake(self) -> float:
+        """Maximum stake of the last tier"""
+        return self._max_stake[-1]
+
+    def max_notional(self, leverage: float) -> float | None:
+        """
+        Max notional of the last tier allowing `leverage`.
+        :return: Max notional, or None if no tier allows this leverage
+        """
+        if self._max_leverage_sorted:
+            i = bisect_right(self._neg_max_leverage, -leverage) - 1
+            return self.tiers[i]["maxNotional"] if i >= 0 else None
+        for tier in reversed(self.tiers):
+            if leverage <= tier["maxLeverage"]:
+                return tier["maxNotional"]
+        return None
+
+    def maintenance_tier(self, notional_value: float) -> dict | None:
+        """
+        Last tier with a minNotional below or equal to `notional_value`.
+        :return: Tier, or None if notional_value is below all tiers
+        """
+        if self._min_notional_sorted:
+            i = bisect_right(self._min_notional, notional_value) - 1
+            return self.tiers[i] if i >= 0 else None
+        for tier in reversed(self.tiers):
+            if notional_value >= tier["minNotional"]:
+                return tier
+        return None
+
+
+def _is_sorted(values: list[float]) -> bool:
+    return all(a <= b for a, b in pairwise(values))
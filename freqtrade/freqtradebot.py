@@ -7,7 +7,7 @@ import traceback
 from copy import deepcopy
 from datetime import datetime, time, timedelta, timezone
 from math import isclose
-from threading import Lock
+from threading import Event, Lock
 from time import sleep
 from typing import Any
 
@@ -19,6 +19,7 @@ from freqtrade.constants import BuySell, Config, EntryExecuteMode, ExchangeConfi
 from freqtrade.data.converter import order_book_to_dataframe
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import (
+    CandleType,
     ExitCheckTuple,
     ExitType,
     MarginMode,
@@ -148,6 +149,14 @@ class FreqtradeBot(LoggingMixin):
 
         # Protect exit-logic from forcesell and vice versa
         self._exit_lock = Lock()
+        # Set to wake up the worker before the throttling time is over
+        self.wakeup_event = Event()
+        if self.config.get("internals", {}).get("wakeup_on_candle_close", False):
+            if not self.exchange.set_candle_close_callback(self._candle_closed):
+                logger.warning(
+                    "`internals.wakeup_on_candle_close` requires websocket support "
+                    "for this exchange. Falling back to regular throttling."
+                )
         timeframe_secs = timeframe_to_seconds(self.strategy.timeframe)
         self._exit_reason_cache = PeriodicCache(100, ttl=timeframe_secs)
         LoggingMixin.__init__(self, logger, timeframe_secs)
@@ -185,6 +194,14 @@ class FreqtradeBot(LoggingMixin):
 
         self._measure_execution = MeasureTime(log_took_too_long, timeframe_secs * 0.25)
 
+    def _candle_closed(self, pair: str, timeframe: str, candle_type: CandleType) -> None:
+        """
+        Called from the websocket thread when a new candle starts.
+        Wakes up the bot loop if a candle of the strategy timeframe closed for a whitelisted pair.
+        """
+        if timeframe == self.strategy.timeframe and pair in self.active_pair_whitelist:
+            self.wakeup_event.set()
+
     def notify_status(self, msg: str, msg_type=RPCMessageType.STATUS) -> None:
         """
         Public method for users of this class (worker, etc.) to send notifications
@@ -265,9 +282,10 @@ class FreqtradeBot(LoggingMixin):
             self.strategy.gather_informative_pairs(),
         )
 
-        strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
-            current_time=datetime.now(timezone.utc)
-        )
+        if self.strategy.ft_has_callback("bot_loop_start"):
+            strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
+                current_time=datetime.now(timezone.utc)
+            )
 
         with self._measure_execution:
             self.strategy.analyze(self.active_pair_whitelist)
@@ -908,17 +926,19 @@ class FreqtradeBot(LoggingMixin):
         amount = (stake_amount / enter_limit_requested) * leverage
         order_type = ordertype or self.strategy.order_types["entry"]
 
-        if mode == "initial" and not strategy_safe_wrapper(
-            self.strategy.confirm_trade_entry, default_retval=True
-        )(
-            pair=pair,
-            order_type=order_type,
-            amount=amount,
-            rate=enter_limit_requested,
-            time_in_force=time_in_force,
-            current_time=datetime.now(timezone.utc),
-            entry_tag=enter_tag,
-            side=trade_side,
+        if (
+            mode == "initial"
+            and self.strategy.ft_has_callback("confirm_trade_entry")
+            and not strategy_safe_wrapper(self.strategy.confirm_trade_entry, default_retval=True)(
+                pair=pair,
+                order_type=order_type,
+                amount=amount,
+                rate=enter_limit_requested,
+                time_in_force=time_in_force,
+                current_time=datetime.now(timezone.utc),
+                entry_tag=enter_tag,
+                side=trade_side,
+            )
         ):
             logger.info(f"User denied entry for {pair}.")
             return False
@@ -1101,16 +1121,18 @@ class FreqtradeBot(LoggingMixin):
             )
         if mode != "replace":
             # Don't call custom_entry_price in order-adjust scenario
-            custom_entry_price = strategy_safe_wrapper(
-                self.strategy.custom_entry_price, default_retval=enter_limit_requested
-            )(
-                pair=pair,
-                trade=trade,
-                current_time=datetime.now(timezone.utc),
-                proposed_rate=enter_limit_requested,
-                entry_tag=entry_tag,
-                side=trade_side,
-            )
+            custom_entry_price = enter_limit_requested
+            if self.strategy.ft_has_callback("custom_entry_price"):
+                custom_entry_price = strategy_safe_wrapper(
+                    self.strategy.custom_entry_price, default_retval=enter_limit_requested
+                )(
+                    pair=pair,
+                    trade=trade,
+                    current_time=datetime.now(timezone.utc),
+                    proposed_rate=enter_limit_requested,
+                    entry_tag=entry_tag,
+                    side=trade_side,
+                )
 
             enter_limit_requested = self.get_valid_price(custom_entry_price, enter_limit_requested)
 
@@ -1121,6 +1143,8 @@ class FreqtradeBot(LoggingMixin):
             max_leverage = self.exchange.get_max_leverage(pair, stake_amount)
             if leverage_:
                 leverage = leverage_
+            elif not self.strategy.ft_has_callback("leverage"):
+                leverage = 1.0
             else:
                 leverage = strategy_safe_wrapper(self.strategy.leverage, default_retval=1.0)(
                     pair=pair,
@@ -1151,7 +1175,7 @@ class FreqtradeBot(LoggingMixin):
             pair, enter_limit_requested, leverage
         )
 
-        if trade is None:
+        if trade is None and self.strategy.ft_has_callback("custom_stake_amount"):
             stake_available = self.wallets.get_available_stake_amount()
             stake_amount = strategy_safe_wrapper(
                 self.strategy.custom_stake_amount, default_retval=stake_amount
@@ -1677,19 +1701,21 @@ class FreqtradeBot(LoggingMixin):
                 is_short=trade.is_short,
                 refresh=True,
             )
-            adjusted_price = strategy_safe_wrapper(
-                self.strategy.adjust_order_price, default_retval=order_obj.safe_placement_price
-            )(
-                trade=trade,
-                order=order_obj,
-                pair=trade.pair,
-                current_time=datetime.now(timezone.utc),
-                proposed_rate=proposed_rate,
-                current_order_rate=order_obj.safe_placement_price,
-                entry_tag=trade.enter_tag,
-                side=trade.trade_direction,
-                is_entry=is_entry,
-            )
+            adjusted_price: float | None = order_obj.safe_placement_price
+            if self.strategy.ft_has_callback("adjust_order_price"):
+                adjusted_price = strategy_safe_wrapper(
+                    self.strategy.adjust_order_price, default_retval=adjusted_price
+                )(
+                    trade=trade,
+                    order=order_obj,
+                    pair=trade.pair,
+                    current_time=datetime.now(timezone.utc),
+                    proposed_rate=proposed_rate,
+                    current_order_rate=order_obj.safe_placement_price,
+                    entry_tag=trade.enter_tag,
+                    side=trade.trade_direction,
+                    is_entry=is_entry,
+                )
 
             replacing = True
             cancel_reason = constants.CANCEL_REASON["REPLACE"]
@@ -2070,16 +2096,18 @@ class FreqtradeBot(LoggingMixin):
         # set custom_exit_price if available
         proposed_limit_rate = limit
         current_profit = trade.calc_profit_ratio(limit)
-        custom_exit_price = strategy_safe_wrapper(
-            self.strategy.custom_exit_price, default_retval=proposed_limit_rate
-        )(
-            pair=trade.pair,
-            trade=trade,
-            current_time=datetime.now(timezone.utc),
-            proposed_rate=proposed_limit_rate,
-            current_profit=current_profit,
-            exit_tag=exit_reason,
-        )
+        custom_exit_price = proposed_limit_rate
+        if self.strategy.ft_has_callback("custom_exit_price"):
+            custom_exit_price = strategy_safe_wrapper(
+                self.strategy.custom_exit_price, default_retval=proposed_limit_rate
+            )(
+                pair=trade.pair,
+                trade=trade,
+                current_time=datetime.now(timezone.utc),
+                proposed_rate=proposed_limit_rate,
+                current_profit=current_profit,
+                exit_tag=exit_reason,
+            )
 
         limit = self.get_valid_price(custom_exit_price, proposed_limit_rate)
 
@@ -2097,6 +2125,7 @@ class FreqtradeBot(LoggingMixin):
         if (
             exit_check.exit_type != ExitType.LIQUIDATION
             and not sub_trade_amt
+            and self.strategy.ft_has_callback("confirm_trade_exit")
             and not strategy_safe_wrapper(self.strategy.confirm_trade_exit, default_retval=True)(
                 pair=trade.pair,
                 trade=trade,
@@ -2337,9 +2366,13 @@ class FreqtradeBot(LoggingMixin):
 
     def _update_trade_after_fill(self, trade: Trade, order: Order, send_msg: bool) -> Trade:
         if order.status in constants.NON_OPEN_EXCHANGE_STATES:
-            strategy_safe_wrapper(self.strategy.order_filled, default_retval=None)(
-                pair=trade.pair, trade=trade, order=order, current_time=datetime.now(timezone.utc)
-            )
+            if self.strategy.ft_has_callback("order_filled"):
+                strategy_safe_wrapper(self.strategy.order_filled, default_retval=None)(
+                    pair=trade.pair,
+                    trade=trade,
+                    order=order,
+                    current_time=datetime.now(timezone.utc),
+                )
             # If a entry order was closed, force update on stoploss on exchange
             if order.ft_order_side == trade.entry_side:
                 if send_msg:
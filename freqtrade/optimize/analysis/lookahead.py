@@ -99,7 +99,7 @@ class LookaheadAnalysis(BaseAnalysis):
                                 f"{str(self_value)} != {str(other_value)}"
                             )
 
-    def prepare_data(self, varholder: VarHolder, pairs_to_load: list[DataFrame]):
+    def prepare_data(self, varholder: VarHolder, pairs_to_load: list[str]) -> None:
         if "freqai" in self.local_config and "identifier" in self.local_config["freqai"]:
             # purge previous data if the freqai model is defined
             # (to be sure nothing is carried over from older backtests)
@@ -128,13 +128,19 @@ class LookaheadAnalysis(BaseAnalysis):
         self._fee = backtesting.fee
         backtesting._set_strategy(backtesting.strategylist[0])
 
-        varholder.data, varholder.timerange = backtesting.load_bt_data()
+        varholder.data, varholder.timerange = backtesting.load_bt_data(
+            self.get_preloaded_data(varholder)
+        )
         varholder.timeframe = backtesting.timeframe
 
         varholder.indicators = backtesting.strategy.advise_all_indicators(varholder.data)
         varholder.result = self.get_result(backtesting, varholder.indicators)
 
     def fill_entry_and_exit_varHolders(self, result_row):
+        """
+        Create entry and exit varholders for the given trade.
+        The partial backtests are run by prepare_entry_and_exit_varHolders().
+        """
         # entry_varHolder
         entry_varHolder = VarHolder()
         self.entry_varHolders.append(entry_varHolder)
@@ -144,7 +150,6 @@ class LookaheadAnalysis(BaseAnalysis):
         entry_varHolder.to_dt = result_row["open_date"] + timedelta(
             minutes=timeframe_to_minutes(self.full_varHolder.timeframe)
         )
-        self.prepare_data(entry_varHolder, [result_row["pair"]])
 
         # exit_varHolder
         exit_varHolder = VarHolder()
@@ -155,7 +160,22 @@ class LookaheadAnalysis(BaseAnalysis):
             minutes=timeframe_to_minutes(self.full_varHolder.timeframe)
         )
         exit_varHolder.compared_dt = result_row["close_date"]
-        self.prepare_data(exit_varHolder, [result_row["pair"]])
+
+    def prepare_entry_and_exit_varHolders(self, rows_to_check: list[tuple[int, Any]]) -> None:
+        """
+        Run the partial backtests for all trades to check - in parallel if configured.
+        """
+        jobs = []
+        for idx, result_row in rows_to_check:
+            jobs.append((self.entry_varHolders[idx], [result_row["pair"]]))
+            jobs.append((self.exit_varHolders[idx], [result_row["pair"]]))
+
+        prepared = self.prepare_data_parallel(jobs)
+        for (idx, _), entry_varHolder, exit_varHolder in zip(
+            rows_to_check, prepared[::2], prepared[1::2], strict=True
+        ):
+            self.entry_varHolders[idx] = entry_varHolder
+            self.exit_varHolders[idx] = exit_varHolder
 
     # now we analyze a full trade of full_varholder and look for analyze its bias
     def analyze_row(self, idx: int, result_row):
@@ -166,9 +186,6 @@ class LookaheadAnalysis(BaseAnalysis):
         # keep track of how many signals are processed at total
         self.current_analysis.total_signals += 1
 
-        # fill entry_varHolder and exit_varHolder
-        self.fill_entry_and_exit_varHolders(result_row)
-
         # this will trigger a logger-message
         buy_or_sell_biased: bool = False
 
@@ -221,8 +238,9 @@ class LookaheadAnalysis(BaseAnalysis):
 
         # now we loop through all signals
         # starting from the same datetime to avoid miss-reports of bias
+        rows_to_check: list[tuple[int, Any]] = []
         for idx, result_row in self.full_varHolder.result["results"].iterrows():
-            if self.current_analysis.total_signals == self.targeted_trade_amount:
+            if len(rows_to_check) == self.targeted_trade_amount:
                 logger.info(f"Found targeted trade amount = {self.targeted_trade_amount} signals.")
                 break
             if found_signals < self.minimum_trade_amount:
@@ -246,6 +264,11 @@ class LookaheadAnalysis(BaseAnalysis):
                 self.exit_varHolders.append(VarHolder())
                 continue
 
+            self.fill_entry_and_exit_varHolders(result_row)
+            rows_to_check.append((idx, result_row))
+
+        self.prepare_entry_and_exit_varHolders(rows_to_check)
+        for idx, result_row in rows_to_check:
             self.analyze_row(idx, result_row)
 
         if len(self.entry_varHolders) < self.minimum_trade_amount:
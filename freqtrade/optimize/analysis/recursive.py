@@ -6,8 +6,6 @@ from datetime import timedelta
 from pathlib import Path
 from typing import Any
 
-from pandas import DataFrame
-
 from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.loggers.set_log_levels import (
     reduce_verbosity_for_bias_tester,
@@ -124,7 +122,7 @@ class RecursiveAnalysis(BaseAnalysis):
         else:
             logger.info("No lookahead bias on indicators found.")
 
-    def prepare_data(self, varholder: VarHolder, pairs_to_load: list[DataFrame]):
+    def prepare_data(self, varholder: VarHolder, pairs_to_load: list[str]) -> None:
         if "freqai" in self.local_config and "identifier" in self.local_config["freqai"]:
             # purge previous data if the freqai model is defined
             # (to be sure nothing is carried over from older backtests)
@@ -143,12 +141,21 @@ class RecursiveAnalysis(BaseAnalysis):
             + str(self.dt_to_timestamp(varholder.to_dt))
         )
         prepare_data_config["exchange"]["pair_whitelist"] = pairs_to_load
+        if hasattr(varholder, "startup_candle"):
+            prepare_data_config["startup_candle_count"] = varholder.startup_candle
+
+        if self._fee is not None:
+            # Don't re-calculate fee per run, the backtest is not used for recursive analysis.
+            prepare_data_config["fee"] = self._fee
 
         backtesting = Backtesting(prepare_data_config, self.exchange)
         self.exchange = backtesting.exchange
+        self._fee = backtesting.fee
         backtesting._set_strategy(backtesting.strategylist[0])
 
-        varholder.data, varholder.timerange = backtesting.load_bt_data()
+        varholder.data, varholder.timerange = backtesting.load_bt_data(
+            self.get_preloaded_data(varholder)
+        )
         varholder.timeframe = backtesting.timeframe
 
         varholder.indicators = backtesting.strategy.advise_all_indicators(varholder.data)
@@ -161,10 +168,6 @@ class RecursiveAnalysis(BaseAnalysis):
         partial_varHolder.to_dt = self.full_varHolder.to_dt
         partial_varHolder.startup_candle = startup_candle
 
-        self.local_config["startup_candle_count"] = startup_candle
-
-        self.prepare_data(partial_varHolder, self.local_config["pairs"])
-
         self.partial_varHolder_array.append(partial_varHolder)
 
     def fill_partial_varholder_lookahead(self, end_date):
@@ -175,10 +178,20 @@ class RecursiveAnalysis(BaseAnalysis):
         partial_varHolder.from_dt = self.full_varHolder.from_dt
         partial_varHolder.to_dt = end_date
 
-        self.prepare_data(partial_varHolder, self.local_config["pairs"])
-
         self.partial_varHolder_lookahead_array.append(partial_varHolder)
 
+    def prepare_partial_varholders(self) -> None:
+        """
+        Calculate indicators for all partial varholders - in parallel if configured.
+        """
+        varholders = self.partial_varHolder_lookahead_array + self.partial_varHolder_array
+        prepared = self.prepare_data_parallel(
+            [(varholder, self.local_config["pairs"]) for varholder in varholders]
+        )
+        lookahead_count = len(self.partial_varHolder_lookahead_array)
+        self.partial_varHolder_lookahead_array = prepared[:lookahead_count]
+        self.partial_varHolder_array = prepared[lookahead_count:]
+
     def start(self) -> None:
         super().start()
 
@@ -199,6 +212,8 @@ class RecursiveAnalysis(BaseAnalysis):
         for startup_candle in self._startup_candle:
             self.fill_partial_varholder(start_date_partial, startup_candle)
 
+        self.prepare_partial_varholders()
+
         # Restore verbosity, so it's not too quiet for the next strategy
         restore_verbosity_for_bias_tester()
 
@@ -5,19 +5,26 @@ from pathlib import Path
 import rapidjson
 
 
-def get_strategy_run_id(strategy) -> str:
+def get_strategy_run_id(strategy, ignored_keys: tuple[str, ...] = ()) -> str:
     """
     Generate unique identification hash for a backtest run. Identical config and strategy file will
     always return an identical hash.
     :param strategy: strategy object.
+    :param ignored_keys: Additional config keys to exclude from the hash.
     :return: hex string id.
     """
     digest = hashlib.sha1()  # noqa: S324
     config = deepcopy(strategy.config)
 
     # Options that have no impact on results of individual backtest.
-    not_important_keys = ("strategy_list", "original_config", "telegram", "api_server")
-    for k in not_important_keys:
+    not_important_keys = (
+        "strategy_list",
+        "strategy_workers",
+        "original_config",
+        "telegram",
+        "api_server",
+    )
+    for k in not_important_keys + ignored_keys:
         if k in config:
             del config[k]
 
@@ -6,6 +6,9 @@ This module contains the backtesting logic
 
 import logging
 from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime, timedelta
 
@@ -40,6 +43,7 @@ from freqtrade.exchange import (
     timeframe_to_seconds,
 )
 from freqtrade.exchange.exchange import TICK_SIZE, Exchange
+from freqtrade.exchange.funding_fees import FundingFeeIndex
 from freqtrade.ft_types import (
     BacktestContentType,
     BacktestContentTypeIcomplete,
@@ -50,6 +54,7 @@ from freqtrade.leverage.liquidation_price import update_liquidation_prices
 from freqtrade.mixins import LoggingMixin
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
 from freqtrade.optimize.bt_progress import BTProgress
+from freqtrade.optimize.exit_candidates import ExitCandidates, exit_candidates_supported
 from freqtrade.optimize.optimize_reports import (
     generate_backtest_stats,
     generate_rejected_signals,
@@ -57,6 +62,7 @@ from freqtrade.optimize.optimize_reports import (
     show_backtest_results,
     store_backtest_results,
 )
+from freqtrade.optimize.strategy_workers import backtest_strategies_in_workers
 from freqtrade.persistence import (
     CustomDataWrapper,
     LocalTrade,
@@ -169,6 +175,13 @@ class Backtesting:
         self.timeframe_secs = timeframe_to_seconds(self.timeframe)
         self.timeframe_min = self.timeframe_secs // 60
         self.timeframe_td = timedelta(seconds=self.timeframe_secs)
+        # Number of threads used to analyze pairs - 1 analyzes pairs one by one.
+        self.analyze_workers: int = self.config.get("analyze_workers", 1)
+        # Number of processes used to backtest the strategies of the strategy list.
+        self.strategy_workers: int = self.config.get("strategy_workers", 1)
+        if self.strategy_workers > 1 and self.config.get("freqai", {}).get("enabled", False):
+            logger.warning("FreqAI strategies are backtested one after the other.")
+            self.strategy_workers = 1
         self.disable_database_use()
         self.init_backtest_detail()
         self.pairlists = PairListManager(self.exchange, self.config, self.dataprovider)
@@ -223,6 +236,9 @@ class Backtesting:
         self._can_short = self.trading_mode != TradingMode.SPOT
         self._position_stacking: bool = self.config.get("position_stacking", False)
         self.enable_protections: bool = self.config.get("enable_protections", False)
+        # Candles on which exits are possible - set per backtest for supported strategies.
+        self._exit_candidates: ExitCandidates | None = None
+        self._next_exit: dict[int, datetime] = {}
         migrate_data(config, self.exchange)
 
         self.init_backtest()
@@ -257,7 +273,7 @@ class Backtesting:
         else:
             self.timeframe_detail_td = timedelta(seconds=0)
         self.detail_data: dict[str, DataFrame] = {}
-        self.futures_data: dict[str, DataFrame] = {}
+        self.futures_data: dict[str, DataFrame | FundingFeeIndex] = {}
 
     def init_backtest(self):
         self.prepare_backtest(False)
@@ -288,23 +304,57 @@ class Backtesting:
         if self.config.get("enable_protections", False):
             self.protections = ProtectionManager(self.config, strategy.protections)
 
-    def load_bt_data(self) -> tuple[dict[str, DataFrame], TimeRange]:
+    @contextmanager
+    def analyze_executor(self) -> Iterator[Executor | None]:
+        """
+        Thread pool to populate indicators / signals for multiple pairs concurrently.
+        Yields None if analyze_workers is 1 - pairs are then analyzed one by one.
+        """
+        if self.analyze_workers <= 1:
+            yield None
+            return
+        executor = ThreadPoolExecutor(
+            max_workers=self.analyze_workers, thread_name_prefix="ft_analyze"
+        )
+        try:
+            yield executor
+        finally:
+            # Cancel queued pairs if the backtest was aborted or failed - running ones are awaited.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def load_bt_data(
+        self, preloaded: dict[str, DataFrame] | None = None
+    ) -> tuple[dict[str, DataFrame], TimeRange]:
         """
         Loads backtest data and returns the data combined with the timerange
         as tuple.
+        :param preloaded: Already loaded (raw) candles covering at least the configured
+            timerange including the startup period. If given, the data is sliced
+            from these candles instead of being loaded from disk.
         """
         self.progress.init_step(BacktestState.DATALOAD, 1)
 
-        data = history.load_data(
-            datadir=self.config["datadir"],
-            pairs=self.pairlists.whitelist,
-            timeframe=self.timeframe,
-            timerange=self.timerange,
-            startup_candles=self.required_startup,
-            fail_without_data=True,
-            data_format=self.config["dataformat_ohlcv"],
-            candle_type=self.config.get("candle_type_def", CandleType.SPOT),
-        )
+        if preloaded is not None:
+            timerange_startup = deepcopy(self.timerange)
+            timerange_startup.subtract_start(self.timeframe_secs * self.required_startup)
+            data = {
+                pair: trim_dataframe(preloaded[pair], timerange_startup).reset_index(drop=True)
+                for pair in self.pairlists.whitelist
+                if pair in preloaded
+            }
+            if not data:
+                raise OperationalException("No data found. Terminating.")
+        else:
+            data = history.load_data(
+                datadir=self.config["datadir"],
+                pairs=self.pairlists.whitelist,
+                timeframe=self.timeframe,
+                timerange=self.timerange,
+                startup_candles=self.required_startup,
+                fail_without_data=True,
+                data_format=self.config["dataformat_ohlcv"],
+                candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+            )
 
         min_date, max_date = history.get_timerange(data)
 
@@ -373,7 +423,7 @@ class Backtesting:
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=CandleType.from_string(self.exchange.get_option("mark_ohlcv_price")),
             )
-            # Combine data to avoid combining the data per trade.
+            # Combine data (into a cumulative index) to avoid combining the data per trade.
             unavailable_pairs = []
             uses_leverage_tiers = self.exchange.get_option("uses_leverage_tiers", True)
             for pair in self.pairlists.whitelist:
@@ -381,10 +431,12 @@ class Backtesting:
                     unavailable_pairs.append(pair)
                     continue
 
-                self.futures_data[pair] = self.exchange.combine_funding_and_mark(
-                    funding_rates=funding_rates_dict[pair],
-                    mark_rates=mark_rates_dict[pair],
-                    futures_funding_rate=self.config.get("futures_funding_rate", None),
+                self.futures_data[pair] = FundingFeeIndex(
+                    self.exchange.combine_funding_and_mark(
+                        funding_rates=funding_rates_dict[pair],
+                        mark_rates=mark_rates_dict[pair],
+                        futures_funding_rate=self.config.get("futures_funding_rate", None),
+                    )
                 )
 
             if unavailable_pairs:
@@ -430,6 +482,7 @@ class Backtesting:
         self.replaced_entry_orders = 0
         self.canceled_exit_orders = 0
         self.replaced_exit_orders = 0
+        self._next_exit = {}
         self.dataprovider.clear_cache()
         if enable_protections:
             self._load_protections(self.strategy)
@@ -456,49 +509,68 @@ class Backtesting:
         data: dict = {}
         self.progress.init_step(BacktestState.CONVERT, len(processed))
 
-        # Create dict with data
-        for pair in processed.keys():
-            pair_data = processed[pair]
-            self.check_abort()
-            self.progress.increment()
+        with self.analyze_executor() as executor:
+            analyzed: Iterator[DataFrame] | None = None
+            if executor is not None:
+                # Results are returned in the order of processed.
+                analyzed = executor.map(
+                    lambda pair, pair_data: self.strategy.ft_advise_signals(
+                        pair_data, {"pair": pair}
+                    ),
+                    list(processed.keys()),
+                    list(processed.values()),
+                )
+            # Create dict with data
+            for pair in processed.keys():
+                data[pair] = self._ohlcv_as_list(processed, pair, analyzed)
+        return data
 
+    def _ohlcv_as_list(
+        self, processed: dict[str, DataFrame], pair: str, analyzed: Iterator[DataFrame] | None
+    ) -> list:
+        pair_data = processed[pair]
+        self.check_abort()
+        self.progress.increment()
+
+        if analyzed is not None:
+            df_analyzed = next(analyzed)
+        else:
             if not pair_data.empty:
                 # Cleanup from prior runs
                 pair_data.drop(HEADERS[5:] + ["buy", "sell"], axis=1, errors="ignore")
             df_analyzed = self.strategy.ft_advise_signals(pair_data, {"pair": pair})
-            # Update dataprovider cache
-            self.dataprovider._set_cached_df(
-                pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
-            )
+        # Update dataprovider cache
+        self.dataprovider._set_cached_df(
+            pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
+        )
 
-            # Trim startup period from analyzed dataframe
-            df_analyzed = processed[pair] = pair_data = trim_dataframe(
-                df_analyzed, self.timerange, startup_candles=self.required_startup
-            )
+        # Trim startup period from analyzed dataframe
+        df_analyzed = processed[pair] = pair_data = trim_dataframe(
+            df_analyzed, self.timerange, startup_candles=self.required_startup
+        )
 
-            # Create a copy of the dataframe before shifting, that way the entry signal/tag
-            # remains on the correct candle for callbacks.
-            df_analyzed = df_analyzed.copy()
-
-            # To avoid using data from future, we use entry/exit signals shifted
-            # from the previous candle
-            for col in HEADERS[5:]:
-                tag_col = col in ("enter_tag", "exit_tag")
-                if col in df_analyzed.columns:
-                    df_analyzed[col] = (
-                        df_analyzed.loc[:, col]
-                        .replace([nan], [0 if not tag_col else None])
-                        .shift(1)
-                    )
-                elif not df_analyzed.empty:
-                    df_analyzed[col] = 0 if not tag_col else None
+        # Create a copy of the dataframe before shifting, that way the entry signal/tag
+        # remains on the correct candle for callbacks.
+        df_analyzed = df_analyzed.copy()
+
+        # To avoid using data from future, we use entry/exit signals shifted
+        # from the previous candle
+        for col in HEADERS[5:]:
+            tag_col = col in ("enter_tag", "exit_tag")
+            if col in df_analyzed.columns:
+                df_analyzed[col] = (
+                    df_analyzed.loc[:, col].replace([nan], [0 if not tag_col else None]).shift(1)
+                )
+            elif not df_analyzed.empty:
+                df_analyzed[col] = 0 if not tag_col else None
 
-            df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
+        df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
+        if self._exit_candidates is not None and not df_analyzed.empty:
+            self._exit_candidates.add_pair(pair, df_analyzed)
 
-            # Convert from Pandas to list for performance reasons
-            # (Looping Pandas is slow.)
-            data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
-        return data
+        # Convert from Pandas to list for performance reasons
+        # (Looping Pandas is slow.)
+        return df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
 
     def _get_close_rate(
         self,
@@ -743,12 +815,13 @@ class Backtesting:
         if order and self._get_order_filled(order.ft_price, row):
             order.close_bt_order(current_date, trade)
             self._run_funding_fees(trade, current_date, force=True)
-            strategy_safe_wrapper(self.strategy.order_filled, default_retval=None)(
-                pair=trade.pair,
-                trade=trade,  # type: ignore[arg-type]
-                order=order,
-                current_time=current_date,
-            )
+            if self.strategy.ft_has_callback("order_filled"):
+                strategy_safe_wrapper(self.strategy.order_filled, default_retval=None)(
+                    pair=trade.pair,
+                    trade=trade,  # type: ignore[arg-type]
+                    order=order,
+                    current_time=current_date,
+                )
 
             if self.margin_mode == MarginMode.CROSS or not (
                 order.ft_order_side == trade.exit_side and order.safe_amount == trade.amount
@@ -821,16 +894,18 @@ class Backtesting:
                     exit_reason = row[EXIT_TAG_IDX]
                 # Custom exit pricing only for exit-signals
                 if order_type == "limit":
-                    rate = strategy_safe_wrapper(
-                        self.strategy.custom_exit_price, default_retval=close_rate
-                    )(
-                        pair=trade.pair,
-                        trade=trade,  # type: ignore[arg-type]
-                        current_time=current_time,
-                        proposed_rate=close_rate,
-                        current_profit=current_profit,
-                        exit_tag=exit_reason,
-                    )
+                    rate = close_rate
+                    if self.strategy.ft_has_callback("custom_exit_price"):
+                        rate = strategy_safe_wrapper(
+                            self.strategy.custom_exit_price, default_retval=close_rate
+                        )(
+                            pair=trade.pair,
+                            trade=trade,  # type: ignore[arg-type]
+                            current_time=current_time,
+                            proposed_rate=close_rate,
+                            current_profit=current_profit,
+                            exit_tag=exit_reason,
+                        )
                     if rate is not None and rate != close_rate:
                         close_rate = price_to_precision(
                             rate, trade.price_precision, trade.precision_mode_price
@@ -844,19 +919,22 @@ class Backtesting:
             # Confirm trade exit:
             time_in_force = self.strategy.order_time_in_force["exit"]
 
-            if exit_.exit_type not in (
-                ExitType.LIQUIDATION,
-                ExitType.PARTIAL_EXIT,
-            ) and not strategy_safe_wrapper(self.strategy.confirm_trade_exit, default_retval=True)(
-                pair=trade.pair,
-                trade=trade,  # type: ignore[arg-type]
-                order_type=order_type,
-                amount=amount_,
-                rate=close_rate,
-                time_in_force=time_in_force,
-                sell_reason=exit_reason,  # deprecated
-                exit_reason=exit_reason,
-                current_time=current_time,
+            if (
+                exit_.exit_type not in (ExitType.LIQUIDATION, ExitType.PARTIAL_EXIT)
+                and self.strategy.ft_has_callback("confirm_trade_exit")
+                and not strategy_safe_wrapper(
+                    self.strategy.confirm_trade_exit, default_retval=True
+                )(
+                    pair=trade.pair,
+                    trade=trade,  # type: ignore[arg-type]
+                    order_type=order_type,
+                    amount=amount_,
+                    rate=close_rate,
+                    time_in_force=time_in_force,
+                    sell_reason=exit_reason,  # deprecated
+                    exit_reason=exit_reason,
+                    current_time=current_time,
+                )
             ):
                 return None
 
@@ -910,6 +988,41 @@ class Backtesting:
         trade.orders.append(order)
         return trade
 
+    def _exit_candidates_enabled(self) -> bool:
+        """
+        Exit checks can be skipped on candles where no exit is possible
+        if exits only depend on the candles of the main timeframe.
+        """
+        return (
+            self.trading_mode == TradingMode.SPOT
+            and not self.timeframe_detail
+            and exit_candidates_supported(self.strategy)
+        )
+
+    def _exit_possible(self, trade: LocalTrade, pair: str, current_time: datetime) -> bool:
+        """
+        False if no exit can trigger on this candle - so the exit check can be skipped.
+        NOTE: Called for every candle of open trades. Please keep it optimized.
+        """
+        if (
+            self._exit_candidates is None
+            or trade.is_short
+            or not trade.stop_loss
+            or trade.has_open_orders
+        ):
+            return True
+        next_exit = self._next_exit.get(trade.id)
+        if next_exit is None:
+            next_exit = self._exit_candidates.next_exit(pair, trade, current_time)
+            if next_exit is None:
+                return True
+            self._next_exit[trade.id] = next_exit
+        if current_time < next_exit:
+            return False
+        # Candle may trigger an exit - search the next one after this check.
+        del self._next_exit[trade.id]
+        return True
+
     def _check_trade_exit(
         self, trade: LocalTrade, row: tuple, current_time: datetime
     ) -> LocalTrade | None:
@@ -969,16 +1082,18 @@ class Backtesting:
         precision_mode_price: int,
     ) -> tuple[float, float, float, float]:
         if order_type == "limit":
-            new_rate = strategy_safe_wrapper(
-                self.strategy.custom_entry_price, default_retval=propose_rate
-            )(
-                pair=pair,
-                trade=trade,  # type: ignore[arg-type]
-                current_time=current_time,
-                proposed_rate=propose_rate,
-                entry_tag=entry_tag,
-                side=direction,
-            )  # default value is the open rate
+            new_rate = propose_rate  # default value is the open rate
+            if self.strategy.ft_has_callback("custom_entry_price"):
+                new_rate = strategy_safe_wrapper(
+                    self.strategy.custom_entry_price, default_retval=propose_rate
+                )(
+                    pair=pair,
+                    trade=trade,  # type: ignore[arg-type]
+                    current_time=current_time,
+                    proposed_rate=propose_rate,
+                    entry_tag=entry_tag,
+                    side=direction,
+                )
             # We can't place orders higher than current high (otherwise it'd be a stop limit entry)
             # which freqtrade does not support in live.
             if new_rate is not None and new_rate != propose_rate:
@@ -1010,6 +1125,7 @@ class Backtesting:
                     entry_tag=entry_tag,
                 )
                 if self.trading_mode != TradingMode.SPOT
+                and self.strategy.ft_has_callback("leverage")
                 else 1.0
             )
             # Cap leverage between 1.0 and max_leverage.
@@ -1026,7 +1142,7 @@ class Backtesting:
         )
         stake_available = self.wallets.get_available_stake_amount()
 
-        if not pos_adjust:
+        if not pos_adjust and self.strategy.ft_has_callback("custom_stake_amount"):
             stake_amount = strategy_safe_wrapper(
                 self.strategy.custom_stake_amount, default_retval=stake_amount
             )(
@@ -1117,7 +1233,7 @@ class Backtesting:
             # Backcalculate actual stake amount.
             stake_amount = amount * propose_rate / leverage
 
-            if not pos_adjust:
+            if not pos_adjust and self.strategy.ft_has_callback("confirm_trade_entry"):
                 # Confirm trade entry:
                 if not strategy_safe_wrapper(
                     self.strategy.confirm_trade_entry, default_retval=True
@@ -1347,7 +1463,9 @@ class Backtesting:
         Returns True if the trade should be deleted.
         """
         # only check on new candles for open entry orders
-        if current_time > order.order_date_utc:
+        if current_time > order.order_date_utc and self.strategy.ft_has_callback(
+            "adjust_order_price"
+        ):
             is_entry = order.side == trade.entry_side
             requested_rate = strategy_safe_wrapper(
                 self.strategy.adjust_order_price, default_retval=order.ft_price
@@ -1484,7 +1602,7 @@ class Backtesting:
                 self.wallets.update()
 
             # 4. Create exit orders (if any)
-            if trade.has_open_position:
+            if trade.has_open_position and self._exit_possible(trade, pair, current_time):
                 self._check_trade_exit(trade, row, current_time)  # Place exit order if necessary
 
             # 5. Process exit orders.
@@ -1573,9 +1691,10 @@ class Backtesting:
             # Reset open trade count for this candle
             # Critical to avoid exceeding max_open_trades in backtesting
             # when timeframe-detail is used and trades close within the opening candle.
-            strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
-                current_time=current_time
-            )
+            if self.strategy.ft_has_callback("bot_loop_start"):
+                strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
+                    current_time=current_time
+                )
             pair_detail_cache: dict[str, list[tuple]] = {}
             pair_tradedir_cache: dict[str, LongShort | None] = {}
             pairs_with_open_trades = [t.pair for t in LocalTrade.bt_trades_open]
@@ -1675,6 +1794,9 @@ class Backtesting:
         self.prepare_backtest(self.enable_protections)
         # Ensure wallets are up-to-date (important for --strategy-list)
         self.wallets.update()
+        self._exit_candidates = (
+            ExitCandidates(self.strategy) if self._exit_candidates_enabled() else None
+        )
         # Use dict of lists with data for performance
         # (looping lists is a lot faster than pandas DataFrames)
         data: dict = self._get_ohlcv_as_lists(processed)
@@ -1727,7 +1849,8 @@ class Backtesting:
         self._set_strategy(strat)
 
         # need to reprocess data every time to populate signals
-        preprocessed = self.strategy.advise_all_indicators(data)
+        with self.analyze_executor() as executor:
+            preprocessed = self.strategy.advise_all_indicators(data, executor=executor)
 
         # Trim startup period from analyzed dataframe
         # This only used to determine if trimming would result in an empty dataframe
@@ -1812,12 +1935,21 @@ class Backtesting:
 
         self.load_prior_backtest()
 
+        strategies: list[IStrategy] = []
         for strat in self.strategylist:
             if self.results and strat.get_strategy_name() in self.results["strategy"]:
                 # When previous result hash matches - reuse that result and skip backtesting.
                 logger.info(f"Reusing result of previous backtest for {strat.get_strategy_name()}")
                 continue
-            min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
+            strategies.append(strat)
+
+        if self.strategy_workers > 1 and len(strategies) > 1:
+            min_date, max_date = backtest_strategies_in_workers(
+                self, strategies, data, self.strategy_workers
+            )
+        else:
+            for strat in strategies:
+                min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
 
         # Update old results with new ones.
         if len(self.all_bt_content) > 0:
@@ -1,8 +1,11 @@
 import logging
 from copy import deepcopy
 from datetime import datetime, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Any
 
+from joblib import Parallel, delayed, dump, load
 from pandas import DataFrame
 
 from freqtrade.configuration import TimeRange
@@ -10,6 +13,10 @@ from freqtrade.configuration import TimeRange
 
 logger = logging.getLogger(__name__)
 
+# Per worker-process state, reused across all partial backtests a worker runs.
+_worker_exchange: Any | None = None
+_worker_data: dict[Path, dict[str, DataFrame]] = {}
+
 
 class VarHolder:
     timerange: TimeRange
@@ -30,12 +37,96 @@ class BaseAnalysis:
         self.full_varHolder = VarHolder()
         self.exchange: Any | None = None
         self._fee = None
+        # Raw candles of the full backtest, reused for partial backtests covering a subset
+        self._raw_data: dict[str, DataFrame] | None = None
+        self._data_file: Path | None = None
 
         # pull variables the scope of the lookahead_analysis-instance
         self.local_config = deepcopy(config)
         self.local_config["strategy"] = strategy_obj["name"]
         self.strategy_obj = strategy_obj
 
+    def __getstate__(self):
+        """
+        Only ship configuration and cached values to worker processes.
+        Exchange and loaded data are not picklable (or too large) -
+        workers use the memory-mapped data file instead.
+        """
+        state = self.__dict__.copy()
+        state["exchange"] = None
+        state["_raw_data"] = None
+        state["strategy_obj"] = {k: v for k, v in self.strategy_obj.items() if k != "class"}
+        full_varHolder = VarHolder()
+        for attr in ("from_dt", "to_dt", "timeframe"):
+            if hasattr(self.full_varHolder, attr):
+                setattr(full_varHolder, attr, getattr(self.full_varHolder, attr))
+        state["full_varHolder"] = full_varHolder
+        return state
+
+    @property
+    def analysis_jobs(self) -> int:
+        if "freqai" in self.local_config and "identifier" in self.local_config["freqai"]:
+            # Model folders are purged before every run - which can't happen concurrently.
+            return 1
+        return self.local_config.get("analysis_jobs", 1)
+
+    def get_preloaded_data(self, varholder: VarHolder) -> dict[str, DataFrame] | None:
+        """
+        Raw candles of the full backtest - if they cover the timerange of the given varholder.
+        Partial backtests starting at the same date can slice these instead of reloading data.
+        """
+        if (
+            self._raw_data is None
+            or varholder is self.full_varHolder
+            or varholder.from_dt != self.full_varHolder.from_dt
+            or varholder.to_dt > self.full_varHolder.to_dt
+        ):
+            return None
+        return self._raw_data
+
+    def _dump_raw_data(self, tmp_dir: Path) -> None:
+        """
+        Dump the raw candles of the full backtest so worker processes can memory-map them.
+        """
+        self._data_file = tmp_dir / "analysis_tickerdata.pkl"
+        dump(self._raw_data, self._data_file)
+
+    def prepare_data(self, varholder: VarHolder, pairs_to_load: list[str]) -> None:
+        """
+        Run the backtest for varholder, filling its data, indicators and results.
+        Implemented by the analysis.
+        """
+        raise NotImplementedError()
+
+    def prepare_data_parallel(self, jobs: list[tuple[VarHolder, list[str]]]) -> list[VarHolder]:
+        """
+        Run prepare_data() for all given (varholder, pairs) combinations.
+        Uses a process pool if analysis_jobs is not 1.
+        :return: List of filled varholders, in the same order as jobs.
+        """
+        if self.analysis_jobs == 1 or len(jobs) <= 1:
+            for varholder, pairs_to_load in jobs:
+                self.prepare_data(varholder, pairs_to_load)
+            return [varholder for varholder, _ in jobs]
+
+        # Temporary directory per run - so concurrent analyses don't share the data file.
+        # Workers may still have the data file mapped on cleanup (which fails on Windows).
+        with TemporaryDirectory(prefix="ft_analysis_", ignore_cleanup_errors=True) as tmp_dir:
+            if self._raw_data is not None:
+                self._dump_raw_data(Path(tmp_dir))
+            try:
+                with Parallel(n_jobs=self.analysis_jobs) as parallel:
+                    logger.info(
+                        f"Running {len(jobs)} partial backtests "
+                        f"using {parallel._effective_n_jobs()} worker processes."
+                    )
+                    return parallel(
+                        delayed(_prepare_data_worker)(self, varholder, pairs_to_load)
+                        for varholder, pairs_to_load in jobs
+                    )
+            finally:
+                self._data_file = None
+
     @staticmethod
     def dt_to_timestamp(dt: datetime):
         timestamp = int(dt.replace(tzinfo=timezone.utc).timestamp())
@@ -58,7 +149,28 @@ class BaseAnalysis:
             self.full_varHolder.to_dt = parsed_timerange.stopdt
 
         self.prepare_data(self.full_varHolder, self.local_config["pairs"])
+        self._raw_data = self.full_varHolder.data
 
     def start(self) -> None:
         # first make a single backtest
         self.fill_full_varholder()
+
+
+def _prepare_data_worker(
+    analysis: BaseAnalysis, varholder: VarHolder, pairs_to_load: list[str]
+) -> VarHolder:
+    """
+    Runs prepare_data() for one varholder within a worker process.
+    Exchange and memory-mapped raw data are kept for the lifetime of the worker.
+    """
+    global _worker_exchange
+    if analysis._data_file is not None:
+        if analysis._data_file not in _worker_data:
+            # Data files of previous runs are no longer used.
+            _worker_data.clear()
+            _worker_data[analysis._data_file] = load(analysis._data_file, mmap_mode="r")
+        analysis._raw_data = _worker_data[analysis._data_file]
+    analysis.exchange = _worker_exchange
+    analysis.prepare_data(varholder, pairs_to_load)
+    _worker_exchange = analysis.exchange
+    return varholder
@@ -0,0 +1,122 @@
+"""
+Search for candles on which open trades may exit, used by backtesting to skip
+per-candle exit checks for strategies without custom exit callbacks.
+"""
+
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from freqtrade.persistence import LocalTrade
+from freqtrade.strategy.interface import IStrategy
+
+
+# Methods which must not be overridden by the strategy for exits to be predictable.
+EXIT_METHODS = (
+    "should_exit",
+    "custom_exit",
+    "custom_sell",
+    "ft_stoploss_reached",
+    "ft_stoploss_adjust",
+    "min_roi_reached",
+    "min_roi_reached_entry",
+)
+# Profit (as ratio) tolerance when comparing with ROI - so rounding within the
+# profit calculation can never hide an exit.
+ROI_PROFIT_TOLERANCE = 1e-6
+# Candles checked in the first step of the search - doubled for every following step.
+SEARCH_CHUNK = 64
+
+NO_EXIT = datetime.max.replace(tzinfo=timezone.utc)
+
+
+def exit_candidates_supported(strategy: IStrategy) -> bool:
+    """
+    Exits only depend on static ROI, a fixed stoploss and exit signals.
+    """
+    return (
+        not strategy.trailing_stop
+        and not strategy.use_custom_stoploss
+        and not strategy.use_custom_roi
+        and not strategy.position_adjustment_enable
+        and not any(strategy.ft_overrides(method) for method in EXIT_METHODS)
+    )
+
+
+class ExitCandidates:
+    """
+    High / low / exit signal arrays per pair.
+    The exit candidate of a long trade is the first candle on which the low reaches
+    the stoploss, the high reaches the ROI rate for the trade duration at that candle,
+    or an exit signal is present. Candles before that can't trigger an exit.
+    Candidates are conservative - the exit itself is evaluated by the regular exit logic.
+    """
+
+    def __init__(self, strategy: IStrategy):
+        self.use_exit_signal = strategy.use_exit_signal
+        roi = sorted((int(k), float(v)) for k, v in strategy.minimal_roi.items())
+        self._roi_durations = np.array([k for k, _ in roi], dtype=np.int64)
+        self._roi_values = np.array([v for _, v in roi], dtype=np.float64)
+        self._pairs: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    def add_pair(self, pair: str, df: DataFrame) -> None:
+        """
+        :param df: Dataframe with the rows used in the backtest (signals shifted).
+        """
+        self._pairs[pair] = (
+            pd.DatetimeIndex(df["date"]).as_unit("ns").asi8,
+            df["high"].to_numpy(dtype=np.float64),
+            df["low"].to_numpy(dtype=np.float64),
+            df["exit_long"].to_numpy(dtype=np.float64),
+        )
+
+    def _roi_rates(self, trade: LocalTrade, durations: np.ndarray) -> np.ndarray:
+        """
+        Rate at which the profit reaches the ROI for each trade duration (in minutes).
+        Inverse of the (spot) profit calculation in LocalTrade.calc_profit_ratio().
+        """
+        idx = np.searchsorted(self._roi_durations, durations, side="right") - 1
+        roi = np.where(idx >= 0, self._roi_values[np.maximum(idx, 0)], np.inf)
+        return (
+            trade.open_trade_value
+            * (1 + roi - ROI_PROFIT_TOLERANCE)
+            / (trade.amount * (1 - (trade.fee_close or 0.0)))
+        )
+
+    def next_exit(self, pair: str, trade: LocalTrade, current_time: datetime) -> datetime | None:
+        """
+        Date of the next candle (starting at current_time) on which trade may exit.
+        Updates min / max rates of the trade for all candles before that.
+        :return: Candle date, NO_EXIT if no exit can happen until the end of the data,
+            None if current_time is not a candle of this pair.
+        """
+        dates, high, low, exit_long = self._pairs[pair]
+        current_ns = pd.Timestamp(current_time).value
+        start = idx = int(np.searchsorted(dates, current_ns))
+        if idx >= len(dates) or dates[idx] != current_ns:
+            return None
+        open_ns = pd.Timestamp(trade.open_date_utc).value
+        chunk = SEARCH_CHUNK
+        while idx < len(dates):
+            end = min(idx + chunk, len(dates))
+            durations = (dates[idx:end] - open_ns) // 60_000_000_000
+            # Written as negations - so NaN values are treated as possible exits.
+            possible = ~(low[idx:end] > trade.stop_loss) | ~(
+                high[idx:end] < self._roi_rates(trade, durations)
+            )
+            if self.use_exit_signal:
+                possible |= exit_long[idx:end] != 0
+            hits = np.flatnonzero(possible)
+            if len(hits):
+                idx += int(hits[0])
+                break
+            idx = end
+            chunk *= 2
+
+        if idx > start:
+            trade.adjust_min_max_rates(float(high[start:idx].max()), float(low[start:idx].min()))
+        if idx >= len(dates):
+            return NO_EXIT
+        return pd.Timestamp(dates[idx], tz=timezone.utc).to_pydatetime()
@@ -99,7 +99,11 @@ class Hyperopt:
         """
         Remove hyperopt pickle files to restart hyperopt.
         """
-        for f in [self.data_pickle_file, self.results_file]:
+        for f in [
+            self.data_pickle_file,
+            self.results_file,
+            HyperoptTools.get_index_filename(self.results_file),
+        ]:
             p = Path(f)
             if p.is_file():
                 logger.info(f"Removing `{p}`.")
@@ -110,17 +114,24 @@ class Hyperopt:
         Save hyperopt results to file
         Store one line per epoch.
         While not a valid json object - this allows appending easily.
+        The epoch's byte offset and key metrics are appended to the sidecar index.
         :param epoch: result dictionary for this epoch.
         """
         epoch[FTHYPT_FILEVERSION] = 2
-        with self.results_file.open("a") as f:
-            rapidjson.dump(
+        line = (
+            rapidjson.dumps(
                 epoch,
-                f,
                 default=hyperopt_serializer,
                 number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN,
-            )
-            f.write("\n")
+            ).encode()
+            + b"\n"
+        )
+        with self.results_file.open("ab") as f:
+            offset = f.tell()
+            f.write(line)
+        HyperoptTools.append_index_entry(
+            self.results_file, HyperoptTools.create_index_entry(epoch, offset, len(line))
+        )
 
         self.num_epochs_saved += 1
         logger.debug(
@@ -228,6 +239,7 @@ class Hyperopt:
         # order they will be shown to the user.
         val["is_best"] = is_best
         val["is_random"] = is_random
+        self.hyperopter.complete_epoch(val, full_stats=is_best)
         self.print_results(val)
 
         if is_best:
@@ -31,7 +31,11 @@ from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
 from freqtrade.optimize.hyperopt_loss.hyperopt_loss_interface import IHyperOptLoss
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer, HyperoptTools
-from freqtrade.optimize.optimize_reports import generate_strategy_stats
+from freqtrade.optimize.optimize_reports import (
+    HYPEROPT_STATS_OPTIONAL_METRICS,
+    generate_hyperopt_stats,
+    generate_strategy_stats,
+)
 from freqtrade.optimize.space import (
     DimensionProtocol,
     SKDecimal,
@@ -40,6 +44,7 @@ from freqtrade.optimize.space import (
     ft_IntDistribution,
 )
 from freqtrade.resolvers.hyperopt_resolver import HyperOptLossResolver
+from freqtrade.strategy.indicator_cache import enable_indicator_cache
 from freqtrade.util.dry_run_wallet import get_dry_run_wallet
 
 
@@ -101,6 +106,14 @@ class HyperOptimizer:
             self.config
         )
         self.calculate_loss = self.custom_hyperoptloss.hyperopt_loss_function
+        self.required_metrics = self.custom_hyperoptloss.required_metrics
+        # Full strategy stats are generated for every epoch only if the loss function needs
+        # them, or every epoch is printed. Otherwise only for best epochs (complete_epoch()).
+        self.full_stats_per_epoch = (
+            self.required_metrics is None
+            or config.get("print_all", False)
+            or not set(self.required_metrics).issubset(HYPEROPT_STATS_OPTIONAL_METRICS)
+        )
 
         self.data_pickle_file = data_pickle_file
 
@@ -325,6 +338,9 @@ class HyperOptimizer:
             processed = load(f, mmap_mode="r")
         if self.analyze_per_epoch:
             # Data is not yet analyzed, rerun populate_indicators.
+            # Indicators using strategy.cached_indicator() are only recalculated
+            # if the parameters they depend on changed.
+            enable_indicator_cache()
             processed = self.advise_and_trim(processed)
 
         bt_results = self.backtesting.backtest(
@@ -352,15 +368,16 @@ class HyperOptimizer:
     ) -> dict[str, Any]:
         params_details = self._get_params_details(params_dict)
 
-        strat_stats = generate_strategy_stats(
-            self.pairlist,
-            self.backtesting.strategy.get_strategy_name(),
-            backtesting_results,
-            min_date,
-            max_date,
-            market_change=self.market_change,
-            is_hyperopt=True,
-        )
+        if self.full_stats_per_epoch:
+            strat_stats = self._generate_strategy_stats(backtesting_results, min_date, max_date)
+        else:
+            strat_stats = generate_hyperopt_stats(
+                self.pairlist,
+                backtesting_results,
+                min_date,
+                max_date,
+                required_metrics=self.required_metrics or (),
+            )
         results_explanation = HyperoptTools.format_results_explanation_string(
             strat_stats, self.config["stake_currency"]
         )
@@ -387,7 +404,7 @@ class HyperOptimizer:
                 backtest_stats=strat_stats,
                 starting_balance=get_dry_run_wallet(self.config),
             )
-        return {
+        result = {
             "loss": loss,
             "params_dict": params_dict,
             "params_details": params_details,
@@ -396,6 +413,42 @@ class HyperOptimizer:
             "results_explanation": results_explanation,
             "total_profit": total_profit,
         }
+        if not self.full_stats_per_epoch:
+            # Kept until the epoch has been evaluated, see complete_epoch()
+            result["backtest_content"] = backtesting_results
+        return result
+
+    def _generate_strategy_stats(
+        self, backtesting_results: BacktestContentType, min_date: datetime, max_date: datetime
+    ) -> dict[str, Any]:
+        return generate_strategy_stats(
+            self.pairlist,
+            self.backtesting.strategy.get_strategy_name(),
+            backtesting_results,
+            min_date,
+            max_date,
+            market_change=self.market_change,
+            is_hyperopt=True,
+        )
+
+    def complete_epoch(self, epoch: dict[str, Any], full_stats: bool) -> None:
+        """
+        Drop the backtest results kept with an epoch - replacing the lightweight metrics
+        with full strategy stats if full_stats is set (for epochs shown to the user).
+        Lightweight metrics don't allow showing the epoch in detail with hyperopt-show.
+        """
+        backtesting_results = epoch.pop("backtest_content", None)
+        if backtesting_results is None:
+            return
+        if full_stats:
+            epoch["results_metrics"] = self._generate_strategy_stats(
+                backtesting_results, self.min_date, self.max_date
+            )
+        else:
+            # Allows exporting the parameters of this epoch with hyperopt-show
+            epoch["results_metrics"]["strategy_name"] = (
+                self.backtesting.strategy.get_strategy_name()
+            )
 
     def convert_dimensions_to_optuna_space(self, s_dimensions: list[DimensionProtocol]) -> dict:
         o_dimensions: dict[str, optuna.distributions.BaseDistribution] = {}
@@ -447,8 +500,13 @@ class HyperOptimizer:
         logger.info(f"Using optuna sampler {o_sampler}.")
         return optuna.create_study(sampler=sampler, direction="minimize")
 
-    def advise_and_trim(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
-        preprocessed = self.backtesting.strategy.advise_all_indicators(data)
+    def advise_and_trim(
+        self, data: dict[str, DataFrame], copy: bool = True
+    ) -> dict[str, DataFrame]:
+        with self.backtesting.analyze_executor() as executor:
+            preprocessed = self.backtesting.strategy.advise_all_indicators(
+                data, executor=executor, copy=copy
+            )
 
         # Trim startup period from analyzed dataframe to get correct dates for output.
         # This is only used to keep track of min/max date after trimming.
@@ -469,7 +527,8 @@ class HyperOptimizer:
         if not self.analyze_per_epoch:
             HyperoptStateContainer.set_state(HyperoptState.INDICATORS)
 
-            preprocessed = self.advise_and_trim(data)
+            # data is not used afterwards - no need to copy it.
+            preprocessed = self.advise_and_trim(data, copy=False)
 
             logger.info(
                 f"Hyperopting with data from "
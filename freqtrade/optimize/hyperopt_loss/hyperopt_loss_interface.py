@@ -19,6 +19,11 @@ class IHyperOptLoss(ABC):
     """
 
     timeframe: str
+    # Metrics of ``backtest_stats`` used by this loss function.
+    # None (the default) provides the full strategy stats for every epoch.
+    # Loss functions only relying on ``results`` should use an empty tuple - allowing
+    # hyperopt to generate full stats only for epochs which are shown.
+    required_metrics: tuple[str, ...] | None = None
 
     @staticmethod
     @abstractmethod
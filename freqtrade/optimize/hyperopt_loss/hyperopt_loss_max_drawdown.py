@@ -21,6 +21,8 @@ class MaxDrawDownHyperOptLoss(IHyperOptLoss):
     Less max drawdown more profit -> Lower return value
     """
 
+    required_metrics = ()
+
     @staticmethod
     def hyperopt_loss_function(
         results: DataFrame,
@@ -19,6 +19,8 @@ DRAWDOWN_MULT = 0.075
 
 
 class ProfitDrawDownHyperOptLoss(IHyperOptLoss):
+    required_metrics = ()
+
     @staticmethod
     def hyperopt_loss_function(
         results: DataFrame, starting_balance: float, *args, **kwargs
@@ -20,6 +20,8 @@ class SharpeHyperOptLossDaily(IHyperOptLoss):
     This implementation uses the Sharpe Ratio calculation.
     """
 
+    required_metrics = ()
+
     @staticmethod
     def hyperopt_loss_function(
         results: DataFrame,
@@ -20,6 +20,8 @@ class SortinoHyperOptLossDaily(IHyperOptLoss):
     This implementation uses the Sortino Ratio calculation.
     """
 
+    required_metrics = ()
+
     @staticmethod
     def hyperopt_loss_function(
         results: DataFrame,
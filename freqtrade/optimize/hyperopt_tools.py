@@ -1,9 +1,9 @@
 import logging
+import os
 from collections.abc import Iterator
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
 
 import numpy as np
 import rapidjson
@@ -22,6 +22,30 @@ NON_OPT_PARAM_APPENDIX = "  # value loaded from strategy"
 
 HYPER_PARAMS_FILE_FORMAT = rapidjson.NM_NATIVE | rapidjson.NM_NAN
 
+# Epoch keys (and results_metrics keys) kept in the results index.
+# These cover hyperopt_filter_epochs() and the hyperopt-list table.
+HYPEROPT_INDEX_KEYS = (
+    "current_epoch",
+    "loss",
+    "is_best",
+    "is_initial_point",
+    "is_random",
+    "results_explanation",
+)
+HYPEROPT_INDEX_METRICS = (
+    "total_trades",
+    "wins",
+    "draws",
+    "losses",
+    "profit_mean",
+    "profit_total",
+    "profit_total_abs",
+    "holding_avg",
+    "holding_avg_s",
+    "max_drawdown_abs",
+    "max_drawdown_account",
+)
+
 
 def hyperopt_serializer(x):
     if isinstance(x, np.integer):
@@ -114,21 +138,146 @@ class HyperoptTools:
             return any(s in config["spaces"] for s in [space, "all", "default"])
 
     @staticmethod
-    def _read_results(results_file: Path, batch_size: int = 10) -> Iterator[list[Any]]:
+    def get_index_filename(results_file: Path) -> Path:
         """
-        Stream hyperopt results from file
+        Get the filename of the sidecar index belonging to a hyperopt results file
         """
-        import rapidjson
+        return results_file.with_name(f"{results_file.name}.idx")
 
-        logger.info(f"Reading epochs from '{results_file}'")
-        with results_file.open("r") as f:
-            data = []
+    @staticmethod
+    def create_index_entry(epoch: dict, offset: int, length: int) -> dict:
+        """
+        Build the index entry for one epoch.
+        :param epoch: full epoch result
+        :param offset: Byte offset of the epoch line within the results file
+        :param length: Length of the epoch line (in bytes, including the newline)
+        """
+        metrics = epoch.get("results_metrics", {})
+        entry = {k: epoch.get(k) for k in HYPEROPT_INDEX_KEYS}
+        entry["results_metrics"] = {k: metrics[k] for k in HYPEROPT_INDEX_METRICS if k in metrics}
+        entry["offset"] = offset
+        entry["length"] = length
+        return entry
+
+    @staticmethod
+    def _index_results(results_file: Path, start: int = 0) -> Iterator[dict]:
+        """
+        Stream index entries for all epochs in results_file, starting at byte offset `start`.
+        Stops at an incomplete trailing line (hyperopt may still be writing).
+        """
+        with results_file.open("rb") as f:
+            f.seek(start)
+            offset = start
             for line in f:
-                data += [rapidjson.loads(line)]
-                if len(data) >= batch_size:
-                    yield data
-                    data = []
-        yield data
+                if not line.endswith(b"\n"):
+                    break
+                yield HyperoptTools.create_index_entry(rapidjson.loads(line), offset, len(line))
+                offset += len(line)
+
+    @staticmethod
+    def _read_results_index(results_file: Path) -> list[dict]:
+        """
+        Load the sidecar index for results_file.
+        Epochs which are not yet part of the index (hyperopt may still be running) are parsed
+        from the results file, but only kept in memory - the index is only appended to by
+        hyperopt itself. Missing or broken indexes are rebuilt and replaced as a whole.
+        :return: List of index entries, one per epoch, in file order.
+        """
+        index_file = HyperoptTools.get_index_filename(results_file)
+        index: list[dict] = []
+        rewrite = not index_file.is_file()
+        if not rewrite:
+            expected_offset = 0
+            with index_file.open("rb") as f:
+                for line in f:
+                    try:
+                        entry = rapidjson.loads(line)
+                    except ValueError:
+                        # Partially written line - rebuild the remainder
+                        rewrite = True
+                        break
+                    if entry["offset"] < expected_offset:
+                        # Duplicate entry
+                        rewrite = True
+                        continue
+                    if entry["offset"] > expected_offset:
+                        # Missing entry - rebuild the remainder
+                        rewrite = True
+                        break
+                    index.append(entry)
+                    expected_offset = entry["offset"] + entry["length"]
+
+        results_size = results_file.stat().st_size
+        indexed_size = index[-1]["offset"] + index[-1]["length"] if index else 0
+        if indexed_size > results_size or (
+            index and not HyperoptTools._index_entry_matches(results_file, index[-1])
+        ):
+            logger.info(f"Index for '{results_file}' does not match results file, rebuilding.")
+            index, indexed_size, rewrite = [], 0, True
+
+        if indexed_size < results_size:
+            index += list(HyperoptTools._index_results(results_file, indexed_size))
+        if rewrite:
+            HyperoptTools._write_index(index_file, index)
+        return index
+
+    @staticmethod
+    def _write_index(index_file: Path, index: list[dict]) -> None:
+        """
+        Replace index_file with the given entries.
+        Written to a temporary file first, so readers never see a partial index.
+        """
+        tmp_file = index_file.with_name(f"{index_file.name}.{os.getpid()}.tmp")
+        try:
+            with tmp_file.open("wb") as f:
+                for entry in index:
+                    HyperoptTools._write_index_entry(f, entry)
+            tmp_file.replace(index_file)
+        except OSError:
+            logger.warning(f"Could not write hyperopt index file {index_file}.")
+            tmp_file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _index_entry_matches(results_file: Path, entry: dict) -> bool:
+        """
+        Cheap sanity check - verify that the entry points to a full line in results_file.
+        """
+        with results_file.open("rb") as f:
+            f.seek(entry["offset"])
+            line = f.read(entry["length"])
+        return line[:1] == b"{" and line[-1:] == b"\n"
+
+    @staticmethod
+    def _write_index_entry(f, entry: dict) -> None:
+        f.write(
+            rapidjson.dumps(
+                entry,
+                default=hyperopt_serializer,
+                number_mode=HYPER_PARAMS_FILE_FORMAT,
+            ).encode()
+            + b"\n"
+        )
+
+    @staticmethod
+    def append_index_entry(results_file: Path, entry: dict) -> None:
+        """
+        Append one entry to the sidecar index of results_file
+        """
+        with HyperoptTools.get_index_filename(results_file).open("ab") as f:
+            HyperoptTools._write_index_entry(f, entry)
+
+    @staticmethod
+    def load_epochs(results_file: Path, entries: list[dict]) -> list[dict]:
+        """
+        Load the full epoch results for the given index entries.
+        Only the referenced lines are read from the results file.
+        """
+        epochs = []
+        with results_file.open("rb") as f:
+            for entry in entries:
+                f.seek(entry["offset"])
+                epochs.append(rapidjson.loads(f.read(entry["length"])))
+        return epochs
 
     @staticmethod
     def _test_hyperopt_results_exist(results_file) -> bool:
@@ -144,7 +293,18 @@ class HyperoptTools:
             return False
 
     @staticmethod
-    def load_filtered_results(results_file: Path, config: Config) -> tuple[list, int]:
+    def load_filtered_results(
+        results_file: Path, config: Config, metrics_only: bool = False
+    ) -> tuple[list, int]:
+        """
+        Load and filter epochs from a hyperopt results file.
+        Filtering is done on the results index, so only matching epochs are parsed in full.
+        :param results_file: Hyperopt results file (.fthypt)
+        :param config: Configuration containing the filter options
+        :param metrics_only: Return index entries (key metrics only) instead of full epochs.
+            Use `load_epochs()` to load the full epochs at a later point.
+        :return: tuple of (filtered epochs, total number of epochs)
+        """
         filteroptions = {
             "only_best": config.get("hyperopt_list_best", False),
             "only_profitable": config.get("hyperopt_list_profitable", False),
@@ -164,21 +324,19 @@ class HyperoptTools:
             logger.warning(f"Hyperopt file {results_file} not found.")
             return [], 0
 
-        epochs = []
-        total_epochs = 0
-        for epochs_tmp in HyperoptTools._read_results(results_file):
-            if total_epochs == 0 and epochs_tmp[0].get("is_best") is None:
-                raise OperationalException(
-                    "The file with HyperoptTools results is incompatible with this version "
-                    "of Freqtrade and cannot be loaded."
-                )
-            total_epochs += len(epochs_tmp)
-            epochs += hyperopt_filter_epochs(epochs_tmp, filteroptions, log=False)
-
+        logger.info(f"Reading epochs from '{results_file}'")
+        index = HyperoptTools._read_results_index(results_file)
+        if index and index[0].get("is_best") is None:
+            raise OperationalException(
+                "The file with HyperoptTools results is incompatible with this version "
+                "of Freqtrade and cannot be loaded."
+            )
+        total_epochs = len(index)
         logger.info(f"Loaded {total_epochs} previous evaluations from disk.")
 
-        # Final filter run ...
-        epochs = hyperopt_filter_epochs(epochs, filteroptions, log=True)
+        epochs = hyperopt_filter_epochs(index, filteroptions, log=True)
+        if not metrics_only:
+            epochs = HyperoptTools.load_epochs(results_file, epochs)
 
         return epochs, total_epochs
 
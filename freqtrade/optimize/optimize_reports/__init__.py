@@ -12,9 +12,11 @@ from freqtrade.optimize.optimize_reports.bt_output import (
 )
 from freqtrade.optimize.optimize_reports.bt_storage import store_backtest_results
 from freqtrade.optimize.optimize_reports.optimize_reports import (
+    HYPEROPT_STATS_OPTIONAL_METRICS,
     generate_all_periodic_breakdown_stats,
     generate_backtest_stats,
     generate_daily_stats,
+    generate_hyperopt_stats,
     generate_pair_metrics,
     generate_periodic_breakdown_stats,
     generate_rejected_signals,
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Any
 from zipfile import ZIP_DEFLATED, ZipFile
 
+import rapidjson
 from pandas import DataFrame
 
 from freqtrade.configuration import sanitize_config
@@ -29,6 +30,27 @@ def file_dump_joblib(file_obj: BytesIO, data: Any, log: bool = True) -> None:
     joblib.dump(data, file_obj)
 
 
+def _dump_trades_parquet(trades: list[dict[str, Any]]) -> bytes | None:
+    """
+    Serialize the trades of one strategy to parquet.
+    Nested orders are stored as json strings.
+    :param trades: List of trade dicts, as contained in the backtest statistics
+    :return: Parquet content, or None if the trades can't be stored as parquet.
+    """
+    try:
+        df = DataFrame(trades)
+        if "orders" in df.columns:
+            df["orders"] = df["orders"].map(
+                lambda orders: rapidjson.dumps(orders, default=str, number_mode=rapidjson.NM_NATIVE)
+            )
+        buf = BytesIO()
+        df.to_parquet(buf, index=False, compression="zstd")
+        return buf.getvalue()
+    except Exception as e:
+        logger.warning(f"Could not store trades as parquet, falling back to json. Error: {e}")
+        return None
+
+
 def _generate_filename(recordfilename: Path, appendix: str, suffix: str) -> Path:
     """
     Generates a filename based on the provided parameters.
@@ -58,6 +80,8 @@ def store_backtest_results(
     """
     Stores backtest results and analysis data in a zip file, with metadata stored separately
     for convenience.
+    Trades are stored as parquet per strategy, so the remaining statistics can be loaded
+    without parsing all trades.
     :param config: Configuration dictionary
     :param stats: Dataframe containing the backtesting statistics
     :param dtappendix: Datetime to use for the filename
@@ -78,9 +102,19 @@ def store_backtest_results(
 
     # Create zip file and add the files
     with ZipFile(zip_filename, "w", ZIP_DEFLATED) as zipf:
-        # Store stats
+        # Store trades as parquet - and a summary of the stats (without trades) as json.
+        strategy_stats: dict[str, Any] = {}
+        for strategy_name, strat_stats in stats["strategy"].items():
+            trades = strat_stats.get("trades")
+            trades_content = _dump_trades_parquet(trades) if trades else None
+            if trades_content is None:
+                strategy_stats[strategy_name] = strat_stats
+                continue
+            zipf.writestr(f"{base_filename.stem}_{strategy_name}_trades.parquet", trades_content)
+            strategy_stats[strategy_name] = {k: v for k, v in strat_stats.items() if k != "trades"}
+
         stats_copy = {
-            "strategy": stats["strategy"],
+            "strategy": strategy_stats,
             "strategy_comparison": stats["strategy_comparison"],
         }
         stats_buf = StringIO()
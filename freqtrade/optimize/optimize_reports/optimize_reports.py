@@ -4,16 +4,18 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Literal
 
 import numpy as np
-from pandas import DataFrame, Series, concat, to_datetime
+from pandas import DataFrame, concat, to_datetime
 
 from freqtrade.constants import BACKTEST_BREAKDOWNS, DATETIME_PRINT_FORMAT
 from freqtrade.data.metrics import (
+    DrawDownResult,
     calculate_cagr,
     calculate_calmar,
     calculate_csum,
     calculate_expectancy,
     calculate_market_change,
     calculate_max_drawdown,
+    calculate_max_drawdowns,
     calculate_sharpe,
     calculate_sortino,
     calculate_sqn,
@@ -83,15 +85,23 @@ def _generate_result_line(
     """
     Generate one result dict, with "first_column" as key.
     """
+    trade_count = len(result)
+    profit_abs = result["profit_abs"]
+    winning = profit_abs > 0
+    losing = profit_abs < 0
+    wins = int(winning.sum())
+    losses = int(losing.sum())
     profit_sum = result["profit_ratio"].sum()
+    profit_total_abs = profit_abs.sum()
     # (end-capital - starting capital) / starting capital
-    profit_total = result["profit_abs"].sum() / starting_balance
+    profit_total = profit_total_abs / starting_balance
     backtest_days = (max_date - min_date).days or 1
-    final_balance = starting_balance + result["profit_abs"].sum()
+    final_balance = starting_balance + profit_total_abs
     expectancy, expectancy_ratio = calculate_expectancy(result)
-    winning_profit = result.loc[result["profit_abs"] > 0, "profit_abs"].sum()
-    losing_profit = result.loc[result["profit_abs"] < 0, "profit_abs"].sum()
+    winning_profit = profit_abs[winning].sum()
+    losing_profit = profit_abs[losing].sum()
     profit_factor = winning_profit / abs(losing_profit) if losing_profit else 0.0
+    profit_mean = result["profit_ratio"].mean() if trade_count > 0 else 0.0
 
     try:
         drawdown = calculate_max_drawdown(
@@ -103,14 +113,12 @@ def _generate_result_line(
 
     return {
         "key": first_column,
-        "trades": len(result),
-        "profit_mean": result["profit_ratio"].mean() if len(result) > 0 else 0.0,
-        "profit_mean_pct": (
-            round(result["profit_ratio"].mean() * 100.0, 2) if len(result) > 0 else 0.0
-        ),
+        "trades": trade_count,
+        "profit_mean": profit_mean,
+        "profit_mean_pct": round(profit_mean * 100.0, 2) if trade_count > 0 else 0.0,
         "profit_sum": profit_sum,
         "profit_sum_pct": round(profit_sum * 100.0, 2),
-        "profit_total_abs": result["profit_abs"].sum(),
+        "profit_total_abs": profit_total_abs,
         "profit_total": profit_total,
         "profit_total_pct": round(profit_total * 100.0, 2),
         "duration_avg": (
@@ -124,16 +132,22 @@ def _generate_result_line(
         # 'duration_min': str(timedelta(
         #                     minutes=round(result['trade_duration'].min()))
         #                     ) if not result.empty else '0:00',
-        "wins": len(result[result["profit_abs"] > 0]),
-        "draws": len(result[result["profit_abs"] == 0]),
-        "losses": len(result[result["profit_abs"] < 0]),
-        "winrate": len(result[result["profit_abs"] > 0]) / len(result) if len(result) else 0.0,
+        "wins": wins,
+        "draws": int((profit_abs == 0).sum()),
+        "losses": losses,
+        "winrate": wins / trade_count if trade_count else 0.0,
         "cagr": calculate_cagr(backtest_days, starting_balance, final_balance),
         "expectancy": expectancy,
         "expectancy_ratio": expectancy_ratio,
         "sortino": calculate_sortino(result, min_date, max_date, starting_balance),
         "sharpe": calculate_sharpe(result, min_date, max_date, starting_balance),
-        "calmar": calculate_calmar(result, min_date, max_date, starting_balance),
+        "calmar": calculate_calmar(
+            result,
+            min_date,
+            max_date,
+            starting_balance,
+            max_drawdown=drawdown.relative_account_drawdown if drawdown else 0.0,
+        ),
         "sqn": calculate_sqn(result, starting_balance),
         "profit_factor": profit_factor,
         "max_drawdown_account": drawdown.relative_account_drawdown if drawdown else 0.0,
@@ -169,8 +183,10 @@ def generate_pair_metrics(  #
 
     tabular_data = []
 
+    # Split once instead of filtering the full results for every pair
+    pair_results = dict(list(results.groupby("pair", sort=False)))
     for pair in pairlist:
-        result = results[results["pair"] == pair]
+        result = pair_results.get(pair, results.iloc[:0])
         if skip_nan and result["profit_abs"].isnull().all():
             continue
 
@@ -270,26 +286,39 @@ def generate_periodic_breakdown_stats(
         return []
     results["close_date"] = to_datetime(results["close_date"], utc=True)
     resample_period = _get_resample_from_period(period)
-    resampled = results.resample(resample_period, on="close_date")
+    profit = results["profit_abs"]
+    # Aggregate all periods in one pass
+    periods = (
+        DataFrame(
+            {
+                "close_date": results["close_date"],
+                "profit_abs": profit,
+                "wins": profit > 0,
+                "draws": profit == 0,
+                "losses": profit < 0,
+                "winning_profit": profit.where(profit > 0, 0.0),
+                "losing_profit": profit.where(profit < 0, 0.0),
+            }
+        )
+        .resample(resample_period, on="close_date")
+        .sum()
+    )
     stats = []
-    for name, day in resampled:
-        profit_abs = day["profit_abs"].sum().round(10)
-        wins = sum(day["profit_abs"] > 0)
-        draws = sum(day["profit_abs"] == 0)
-        losses = sum(day["profit_abs"] < 0)
-        trades = wins + draws + losses
-        winning_profit = day.loc[day["profit_abs"] > 0, "profit_abs"].sum()
-        losing_profit = day.loc[day["profit_abs"] < 0, "profit_abs"].sum()
-        profit_factor = winning_profit / abs(losing_profit) if losing_profit else 0.0
+    for row in periods.itertuples():
+        wins = int(row.wins)
+        draws = int(row.draws)
+        losses = int(row.losses)
+        losing_profit = row.losing_profit
+        profit_factor = row.winning_profit / abs(losing_profit) if losing_profit else 0.0
         stats.append(
             {
-                "date": name.strftime("%d/%m/%Y"),
-                "date_ts": int(name.to_pydatetime().timestamp() * 1000),
-                "profit_abs": profit_abs,
+                "date": row.Index.strftime("%d/%m/%Y"),
+                "date_ts": int(row.Index.to_pydatetime().timestamp() * 1000),
+                "profit_abs": round(row.profit_abs, 10),
                 "wins": wins,
                 "draws": draws,
                 "losses": losses,
-                "trades": trades,
+                "trades": wins + draws + losses,
                 "profit_factor": round(profit_factor, 8),
             }
         )
@@ -310,13 +339,16 @@ def calc_streak(dataframe: DataFrame) -> tuple[int, int]:
     :return: Tuple containing consecutive wins and losses
     """
 
-    df = Series(np.where(dataframe["profit_ratio"] > 0, "win", "loss")).to_frame("result")
-    df["streaks"] = df["result"].ne(df["result"].shift()).cumsum().rename("streaks")
-    df["counter"] = df["streaks"].groupby(df["streaks"]).cumcount() + 1
-    res = df.groupby(df["result"]).max()
-    #
-    cons_wins = int(res.loc["win", "counter"]) if "win" in res.index else 0
-    cons_losses = int(res.loc["loss", "counter"]) if "loss" in res.index else 0
+    is_win = dataframe["profit_ratio"].to_numpy() > 0
+    if len(is_win) == 0:
+        return 0, 0
+    # Run-length encoding of consecutive wins / losses
+    run_starts = np.concatenate(([0], np.flatnonzero(is_win[1:] != is_win[:-1]) + 1))
+    run_lengths = np.diff(np.append(run_starts, len(is_win)))
+    run_is_win = is_win[run_starts]
+
+    cons_wins = int(run_lengths[run_is_win].max()) if run_is_win.any() else 0
+    cons_losses = int(run_lengths[~run_is_win].max()) if not run_is_win.all() else 0
     return cons_wins, cons_losses
 
 
@@ -415,8 +447,9 @@ def generate_daily_stats(results: DataFrame) -> dict[str, Any]:
             "losing_days": 0,
             "daily_profit_list": [],
         }
-    daily_profit_rel = results.resample("1d", on="close_date")["profit_ratio"].sum()
-    daily_profit = results.resample("1d", on="close_date")["profit_abs"].sum().round(10)
+    daily = results.resample("1d", on="close_date")[["profit_ratio", "profit_abs"]].sum()
+    daily_profit_rel = daily["profit_ratio"]
+    daily_profit = daily["profit_abs"].round(10)
     worst_rel = min(daily_profit_rel)
     best_rel = max(daily_profit_rel)
     worst = min(daily_profit)
@@ -537,6 +570,14 @@ def generate_strategy_stats(
     expectancy, expectancy_ratio = calculate_expectancy(results)
     backtest_days = (max_date - min_date).days or 1
     trades_dict = results.to_dict(orient="records")
+
+    drawdown: DrawDownResult | None = None
+    underwater: DrawDownResult | None = None
+    if len(results) > 0:
+        # max_relative_drawdown = Underwater
+        drawdown, underwater = calculate_max_drawdowns(
+            results, value_col="profit_abs", starting_balance=start_balance
+        )
     strat_stats = {
         "trades": trades_dict,
         "locks": [lock.to_json() for lock in content["locks"]],
@@ -565,7 +606,13 @@ def generate_strategy_stats(
         "expectancy_ratio": expectancy_ratio,
         "sortino": calculate_sortino(results, min_date, max_date, start_balance),
         "sharpe": calculate_sharpe(results, min_date, max_date, start_balance),
-        "calmar": calculate_calmar(results, min_date, max_date, start_balance),
+        "calmar": calculate_calmar(
+            results,
+            min_date,
+            max_date,
+            start_balance,
+            max_drawdown=drawdown.relative_account_drawdown if drawdown else 0.0,
+        ),
         "sqn": calculate_sqn(results, start_balance),
         "profit_factor": profit_factor,
         "backtest_start": min_date.strftime(DATETIME_PRINT_FORMAT),
@@ -618,15 +665,7 @@ def generate_strategy_stats(
         **trade_stats,
     }
 
-    try:
-        drawdown = calculate_max_drawdown(
-            results, value_col="profit_abs", starting_balance=start_balance
-        )
-        # max_relative_drawdown = Underwater
-        underwater = calculate_max_drawdown(
-            results, value_col="profit_abs", starting_balance=start_balance, relative=True
-        )
-
+    if drawdown is not None and underwater is not None:
         strat_stats.update(
             {
                 "max_drawdown_account": drawdown.relative_account_drawdown,
@@ -644,7 +683,7 @@ def generate_strategy_stats(
         csum_min, csum_max = calculate_csum(results, start_balance)
         strat_stats.update({"csum_min": csum_min, "csum_max": csum_max})
 
-    except ValueError:
+    else:
         strat_stats.update(
             {
                 "max_drawdown_account": 0.0,
@@ -664,6 +703,103 @@ def generate_strategy_stats(
     return strat_stats
 
 
+# Metrics which generate_hyperopt_stats() can calculate on top of its base metrics.
+HYPEROPT_STATS_OPTIONAL_METRICS = (
+    "results_per_pair",
+    "sharpe",
+    "sortino",
+    "calmar",
+    "sqn",
+    "expectancy",
+    "expectancy_ratio",
+    "profit_factor",
+)
+
+
+def generate_hyperopt_stats(
+    pairlist: list[str],
+    content: BacktestContentType,
+    min_date: datetime,
+    max_date: datetime,
+    required_metrics: tuple[str, ...] = (),
+) -> dict[str, Any]:
+    """
+    Generate the subset of strategy stats required to evaluate, store and list a hyperopt epoch.
+    Much cheaper than generate_strategy_stats() - which should be used for epochs
+    that are shown in detail.
+    :param pairlist: List of pairs to backtest
+    :param content: Backtest result data in the format:
+                    {'results: results, 'config: config}}.
+    :param min_date: Backtest start date
+    :param max_date: Backtest end date
+    :param required_metrics: Additional metrics (from HYPEROPT_STATS_OPTIONAL_METRICS)
+    :return: Dictionary containing the requested metrics.
+    """
+    results: DataFrame = content["results"]
+    config = content["config"]
+    start_balance = get_dry_run_wallet(config)
+    trade_count = len(results)
+    profit_abs = results["profit_abs"]
+    profit_total_abs = profit_abs.sum()
+    wins = int((profit_abs > 0).sum())
+    holding_avg = (
+        timedelta(minutes=round(results["trade_duration"].mean())) if trade_count else timedelta()
+    )
+    drawdown = None
+    if trade_count > 0:
+        drawdown = calculate_max_drawdown(
+            results, value_col="profit_abs", starting_balance=start_balance
+        )
+
+    stats: dict[str, Any] = {
+        "total_trades": trade_count,
+        "trade_count_long": int((~results["is_short"]).sum()),
+        "trade_count_short": int(results["is_short"].sum()),
+        "wins": wins,
+        "draws": int((profit_abs == 0).sum()),
+        "losses": int((profit_abs < 0).sum()),
+        "winrate": wins / trade_count if trade_count else 0.0,
+        "profit_mean": results["profit_ratio"].mean() if trade_count > 0 else 0,
+        "profit_median": results["profit_ratio"].median() if trade_count > 0 else 0,
+        "profit_total": profit_total_abs / start_balance,
+        "profit_total_abs": profit_total_abs,
+        "holding_avg": holding_avg,
+        "holding_avg_s": holding_avg.total_seconds(),
+        "max_drawdown_account": drawdown.relative_account_drawdown if drawdown else 0.0,
+        "max_drawdown_abs": drawdown.drawdown_abs if drawdown else 0.0,
+        "stake_currency": config["stake_currency"],
+        "starting_balance": start_balance,
+    }
+
+    if "results_per_pair" in required_metrics:
+        stats["results_per_pair"] = generate_pair_metrics(
+            pairlist,
+            stake_currency=config["stake_currency"],
+            starting_balance=start_balance,
+            results=results,
+            min_date=min_date,
+            max_date=max_date,
+        )
+    if "sharpe" in required_metrics:
+        stats["sharpe"] = calculate_sharpe(results, min_date, max_date, start_balance)
+    if "sortino" in required_metrics:
+        stats["sortino"] = calculate_sortino(results, min_date, max_date, start_balance)
+    if "calmar" in required_metrics:
+        stats["calmar"] = calculate_calmar(
+            results, min_date, max_date, start_balance, max_drawdown=stats["max_drawdown_account"]
+        )
+    if "sqn" in required_metrics:
+        stats["sqn"] = calculate_sqn(results, start_balance)
+    if "expectancy" in required_metrics or "expectancy_ratio" in required_metrics:
+        stats["expectancy"], stats["expectancy_ratio"] = calculate_expectancy(results)
+    if "profit_factor" in required_metrics:
+        losing_profit = profit_abs[profit_abs < 0].sum()
+        stats["profit_factor"] = (
+            profit_abs[profit_abs > 0].sum() / abs(losing_profit) if losing_profit else 0.0
+        )
+    return stats
+
+
 def generate_backtest_stats(
     btdata: dict[str, DataFrame],
     all_results: dict[str, BacktestContentType],
@@ -0,0 +1,114 @@
+"""
+Backtest the strategies of --strategy-list in worker processes.
+Candles are loaded once, and shared with the worker processes through a memory-mapped file.
+Every worker process uses its own Backtesting instance - trades are kept per process.
+"""
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from datetime import datetime
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
+
+from joblib import dump, load
+from pandas import DataFrame
+
+from freqtrade.constants import Config
+from freqtrade.ft_types import BacktestContentType
+
+
+if TYPE_CHECKING:
+    from freqtrade.optimize.backtesting import Backtesting
+    from freqtrade.strategy import IStrategy
+
+
+logger = logging.getLogger(__name__)
+
+StrategyResult = tuple[datetime, datetime, BacktestContentType, dict[str, DataFrame]]
+
+
+def _init_worker() -> None:
+    from freqtrade.loggers import setup_logging_pre
+
+    setup_logging_pre()
+
+
+def run_strategy_backtest(
+    config: Config, strategy_name: str, required_startup: int, data_file: Path
+) -> StrategyResult:
+    """
+    Backtest one strategy of the strategy list - runs in a worker process.
+    :param required_startup: Startup candles of the strategy list - the candles in data_file
+        include these, and all strategies are trimmed by the same startup period.
+    :return: min_date, max_date, backtest content and signal analysis of the strategy
+    """
+    from freqtrade.optimize.backtesting import Backtesting
+
+    stratconf = deepcopy(config)
+    stratconf["strategy"] = strategy_name
+    stratconf.pop("strategy_list", None)
+    backtesting = Backtesting(stratconf)
+    try:
+        backtesting.required_startup = required_startup
+        backtesting.config["startup_candle_count"] = required_startup
+        data, timerange = backtesting.load_bt_data(preloaded=load(data_file, mmap_mode="r"))
+        min_date, max_date = backtesting.backtest_one_strategy(
+            backtesting.strategylist[0], data, timerange
+        )
+        analysis = {
+            key: results[strategy_name]
+            for key, results in backtesting.analysis_results.items()
+            if strategy_name in results
+        }
+        return min_date, max_date, backtesting.all_bt_content[strategy_name], analysis
+    finally:
+        Backtesting.cleanup()
+
+
+def backtest_strategies_in_workers(
+    backtesting: "Backtesting",
+    strategies: list["IStrategy"],
+    data: dict[str, DataFrame],
+    workers: int,
+) -> tuple[datetime, datetime]:
+    """
+    Backtest strategies in up to `workers` processes at the same time.
+    Results are added to backtesting (all_bt_content / analysis_results),
+    as if the strategies had been backtested one after the other.
+    :param data: Candles loaded by backtesting.load_bt_data()
+    :return: min_date, max_date of the backtested data
+    """
+    workers = min(workers, len(strategies))
+    logger.info(f"Backtesting {len(strategies)} strategies in {workers} processes.")
+    ctx = multiprocessing.get_context("spawn")
+    with TemporaryDirectory(prefix="ft_backtest_") as tmp_dir:
+        data_file = Path(tmp_dir) / "backtest_data.pkl"
+        dump(data, data_file)
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=ctx, initializer=_init_worker
+        ) as executor:
+            futures = {
+                strategy.get_strategy_name(): executor.submit(
+                    run_strategy_backtest,
+                    backtesting.config,
+                    strategy.get_strategy_name(),
+                    backtesting.required_startup,
+                    data_file,
+                )
+                for strategy in strategies
+            }
+            try:
+                for strategy_name, future in futures.items():
+                    min_date, max_date, content, analysis = future.result()
+                    content["run_id"] = backtesting.run_ids.get(strategy_name, "")
+                    backtesting.all_bt_content[strategy_name] = content
+                    for key, result in analysis.items():
+                        backtesting.analysis_results[key][strategy_name] = result
+            except BaseException:
+                # Don't start the remaining strategies if one of them failed.
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+    return min_date, max_date
@@ -0,0 +1,122 @@
+"""
+Cache of analyzed candle history, used by the /pair_history endpoint.
+Analyzing a long timerange is expensive - an analyzed dataframe is kept for a while,
+so requests for the same (or a narrower) timerange can be served from it.
+"""
+
+import logging
+from datetime import datetime
+from threading import Lock
+from typing import Any
+
+from cachetools import TTLCache
+from pandas import DataFrame
+
+from freqtrade.configuration import TimeRange
+
+
+logger = logging.getLogger(__name__)
+
+# Memory budget (in MB) for cached analyzed dataframes.
+ANALYZED_HISTORY_CACHE_MB = 512
+# Time (in seconds) analyzed dataframes are kept.
+ANALYZED_HISTORY_CACHE_TTL = 600
+
+HistoryKey = tuple[Any, ...]
+
+
+def _timerange_key(timerange: TimeRange) -> tuple[Any, ...]:
+    return (timerange.starttype, timerange.startts, timerange.stoptype, timerange.stopts)
+
+
+class AnalyzedHistory:
+    """
+    Analyzed dataframe of one pair, including startup candles.
+    """
+
+    def __init__(
+        self,
+        dataframe: DataFrame,
+        timerange: TimeRange,
+        startup_candles: int,
+        analyzed_at: datetime,
+    ):
+        self.dataframe = dataframe
+        self.timerange = timerange
+        self.analyzed_at = analyzed_at
+        # Candles before this date are startup candles.
+        self.first_date = (
+            dataframe["date"].iloc[startup_candles] if len(dataframe) > startup_candles else None
+        )
+        self.nbytes = int(dataframe.memory_usage(index=True, deep=True).sum())
+
+    def covers(self, timerange: TimeRange) -> bool:
+        """
+        Can the candles of timerange be served from this dataframe.
+        """
+        if self.timerange.starttype and (
+            not timerange.starttype or timerange.startts < self.timerange.startts
+        ):
+            return False
+        if self.timerange.stoptype and (
+            not timerange.stoptype or timerange.stopts > self.timerange.stopts
+        ):
+            return False
+        return True
+
+    def slice(self, timerange: TimeRange) -> DataFrame:
+        """
+        Candles within timerange - without startup candles.
+        """
+        df = self.dataframe
+        if self.first_date is None:
+            return df.iloc[0:0]
+        start = self.first_date
+        if timerange.startdt:
+            start = max(start, timerange.startdt)
+        df = df.loc[df["date"] >= start]
+        if timerange.stopdt:
+            df = df.loc[df["date"] <= timerange.stopdt]
+        return df
+
+
+class AnalyzedHistoryCache:
+    """
+    Analyzed dataframes by (strategy, pair, timeframe) and timerange,
+    limited by size and age.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = ANALYZED_HISTORY_CACHE_MB * 1024 * 1024,
+        ttl: int = ANALYZED_HISTORY_CACHE_TTL,
+    ):
+        self._cache: TTLCache = TTLCache(
+            maxsize=max_bytes, ttl=ttl, getsizeof=lambda entry: entry.nbytes
+        )
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get(self, key: HistoryKey, timerange: TimeRange) -> AnalyzedHistory | None:
+        """
+        Get an analyzed dataframe which covers timerange.
+        """
+        with self._lock:
+            for cache_key, entry in list(self._cache.items()):
+                if cache_key[0] == key and entry.covers(timerange):
+                    # Mark as recently used
+                    return self._cache.get(cache_key)
+        return None
+
+    def put(self, key: HistoryKey, entry: AnalyzedHistory) -> None:
+        if entry.nbytes > self._cache.maxsize:
+            logger.debug(f"Analyzed history for {key} too large to cache.")
+            return
+        with self._lock:
+            self._cache[(key, _timerange_key(entry.timerange))] = entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
@@ -1,7 +1,8 @@
 import asyncio
 import logging
+from concurrent.futures import Future
 from copy import deepcopy
-from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -21,7 +22,6 @@ from freqtrade.data.btanalysis import (
 )
 from freqtrade.enums import BacktestState
 from freqtrade.exceptions import ConfigurationError, DependencyException, OperationalException
-from freqtrade.ft_types import get_BacktestResultType_default
 from freqtrade.misc import deep_merge_dicts, is_file_in_dir
 from freqtrade.rpc.api_server.api_schemas import (
     BacktestHistoryEntry,
@@ -29,9 +29,18 @@ from freqtrade.rpc.api_server.api_schemas import (
     BacktestMetadataUpdate,
     BacktestRequest,
     BacktestResponse,
+    BgJobStarted,
+)
+from freqtrade.rpc.api_server.backtest_sessions import (
+    BT_WORKERS_DEFAULT,
+    BacktestSessionCache,
+    BacktestWorkerPool,
+    get_sessions_max_bytes,
+    load_session,
+    run_session_backtest,
 )
 from freqtrade.rpc.api_server.deps import get_config
-from freqtrade.rpc.api_server.webserver_bgwork import ApiBG
+from freqtrade.rpc.api_server.webserver_bgwork import ApiBG, JobsContainer
 from freqtrade.rpc.rpc import RPCException
 
 
@@ -41,83 +50,29 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _get_bt_sessions(config: Config) -> BacktestSessionCache:
+    if ApiBG.bt_sessions is None:
+        ApiBG.bt_sessions = BacktestSessionCache(get_sessions_max_bytes(config))
+    return ApiBG.bt_sessions
+
+
 def __run_backtest_bg(btconfig: Config):
-    from freqtrade.data.metrics import combined_dataframes_with_rel_mean
-    from freqtrade.optimize.optimize_reports import generate_backtest_stats, store_backtest_results
     from freqtrade.resolvers import StrategyResolver
 
     asyncio.set_event_loop(asyncio.new_event_loop())
     try:
         # Reload strategy
-        lastconfig = ApiBG.bt["last_config"]
         strat = StrategyResolver.load_strategy(btconfig)
         validate_config_consistency(btconfig)
 
-        if (
-            not ApiBG.bt["bt"]
-            or lastconfig.get("timeframe") != strat.timeframe
-            or lastconfig.get("timeframe_detail") != btconfig.get("timeframe_detail")
-            or lastconfig.get("timerange") != btconfig["timerange"]
-        ):
-            from freqtrade.optimize.backtesting import Backtesting
-
-            ApiBG.bt["bt"] = Backtesting(btconfig)
-        else:
-            ApiBG.bt["bt"].config = btconfig
-            ApiBG.bt["bt"].init_backtest()
-        # Only reload data if timeframe changed.
-        if (
-            not ApiBG.bt["data"]
-            or not ApiBG.bt["timerange"]
-            or lastconfig.get("timeframe") != strat.timeframe
-            or lastconfig.get("timerange") != btconfig["timerange"]
-        ):
-            ApiBG.bt["data"], ApiBG.bt["timerange"] = ApiBG.bt["bt"].load_bt_data()
-
-        lastconfig["timerange"] = btconfig["timerange"]
-        lastconfig["timeframe"] = strat.timeframe
-        lastconfig["enable_protections"] = btconfig.get("enable_protections")
-        lastconfig["dry_run_wallet"] = btconfig.get("dry_run_wallet")
-
-        ApiBG.bt["bt"].enable_protections = btconfig.get("enable_protections", False)
-        ApiBG.bt["bt"].strategylist = [strat]
-        ApiBG.bt["bt"].results = get_BacktestResultType_default()
-        ApiBG.bt["bt"].load_prior_backtest()
-
-        ApiBG.bt["bt"].abort = False
-        strategy_name = strat.get_strategy_name()
-        if ApiBG.bt["bt"].results and strategy_name in ApiBG.bt["bt"].results["strategy"]:
-            # When previous result hash matches - reuse that result and skip backtesting.
-            logger.info(f"Reusing result of previous backtest for {strategy_name}")
-        else:
-            min_date, max_date = ApiBG.bt["bt"].backtest_one_strategy(
-                strat, ApiBG.bt["data"], ApiBG.bt["timerange"]
-            )
-
-            ApiBG.bt["bt"].results = generate_backtest_stats(
-                ApiBG.bt["data"],
-                ApiBG.bt["bt"].all_bt_content,
-                min_date=min_date,
-                max_date=max_date,
-            )
-
-            if btconfig.get("export", "none") == "trades":
-                combined_res = combined_dataframes_with_rel_mean(
-                    ApiBG.bt["data"], min_date, max_date
-                )
-                fn = store_backtest_results(
-                    btconfig,
-                    ApiBG.bt["bt"].results,
-                    datetime.now().strftime("%Y-%m-%d_%H-%M-%S"),
-                    market_change_data=combined_res,
-                    strategy_files={
-                        s.get_strategy_name(): s.__file__ for s in ApiBG.bt["bt"].strategylist
-                    },
-                )
-                ApiBG.bt["bt"].results["metadata"][strategy_name]["filename"] = str(fn.stem)
-                ApiBG.bt["bt"].results["metadata"][strategy_name]["strategy"] = strategy_name
-
-        logger.info("Backtest finished.")
+        # Reuses loaded data if a backtest with the same data settings ran before.
+        session = load_session(
+            _get_bt_sessions(btconfig),
+            btconfig,
+            strat,
+            on_backtesting=lambda bt: ApiBG.bt.update(bt=bt),
+        )
+        run_session_backtest(session, strat, btconfig)
 
     except ConfigurationError as e:
         logger.error(f"Backtesting encountered a configuration Error: {e}")
@@ -129,15 +84,7 @@ def __run_backtest_bg(btconfig: Config):
         ApiBG.bgtask_running = False
 
 
-@router.post("/backtest", response_model=BacktestResponse, tags=["webserver", "backtest"])
-async def api_start_backtest(
-    bt_settings: BacktestRequest, background_tasks: BackgroundTasks, config=Depends(get_config)
-):
-    ApiBG.bt["bt_error"] = None
-    """Start backtesting if not done so already"""
-    if ApiBG.bgtask_running:
-        raise RPCException("Bot Background task already running")
-
+def _prepare_btconfig(bt_settings: BacktestRequest, config: Config) -> Config:
     if ":" in bt_settings.strategy:
         raise HTTPException(status_code=500, detail="base64 encoded strategies are not allowed.")
 
@@ -156,6 +103,19 @@ async def api_start_backtest(
 
     # Force dry-run for backtesting
     btconfig["dry_run"] = True
+    return btconfig
+
+
+@router.post("/backtest", response_model=BacktestResponse, tags=["webserver", "backtest"])
+async def api_start_backtest(
+    bt_settings: BacktestRequest, background_tasks: BackgroundTasks, config=Depends(get_config)
+):
+    ApiBG.bt["bt_error"] = None
+    """Start backtesting if not done so already"""
+    if ApiBG.bgtask_running:
+        raise RPCException("Bot Background task already running")
+
+    btconfig = _prepare_btconfig(bt_settings, config)
 
     # Start backtesting
     # Initialize backtesting object
@@ -234,8 +194,8 @@ def api_delete_backtest():
         ApiBG.bt["bt"].cleanup()
         del ApiBG.bt["bt"]
         ApiBG.bt["bt"] = None
-        del ApiBG.bt["data"]
-        ApiBG.bt["data"] = None
+        if ApiBG.bt_sessions is not None:
+            ApiBG.bt_sessions.clear()
         logger.info("Backtesting reset")
     return {
         "status": "reset",
@@ -266,6 +226,150 @@ def api_backtest_abort():
     }
 
 
+def _get_bt_pool(config: Config) -> BacktestWorkerPool:
+    if ApiBG.bt_pool is None:
+        workers = config.get("api_server", {}).get("backtest_workers", BT_WORKERS_DEFAULT)
+        ApiBG.bt_pool = BacktestWorkerPool(workers, get_sessions_max_bytes(config))
+    return ApiBG.bt_pool
+
+
+def _backtest_job_done(job_id: str, future: Future) -> None:
+    if not (job := ApiBG.jobs.get(job_id)):
+        return
+    if future.cancelled():
+        job["status"] = "cancelled"
+    elif e := future.exception():
+        logger.error(f"Backtest job {job_id} failed: {e}")
+        job["error"] = str(e)
+        job["status"] = "failed"
+    else:
+        job["result"] = future.result()
+        job["progress"] = 1
+        job["status"] = "success"
+    job["is_running"] = False
+
+
+def _get_backtest_job(job_id: str) -> JobsContainer:
+    job = ApiBG.jobs.get(job_id)
+    if not job or job["category"] != "backtest":
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return job
+
+
+@router.post("/backtest/jobs", response_model=BgJobStarted, tags=["webserver", "backtest"])
+def api_start_backtest_job(bt_settings: BacktestRequest, config=Depends(get_config)):
+    """
+    Start a backtest in a worker process.
+    Multiple backtests can run at the same time - up to `backtest_workers`, others are queued.
+    """
+    btconfig = _prepare_btconfig(bt_settings, config)
+
+    job_id = ApiBG.get_job_id()
+    ApiBG.jobs[job_id] = {
+        "category": "backtest",
+        "status": "running",
+        "progress": 0,
+        "is_running": True,
+        "result": {},
+        "error": None,
+    }
+    future = _get_bt_pool(config).submit(job_id, btconfig)
+    future.add_done_callback(partial(_backtest_job_done, job_id))
+
+    return {
+        "status": "Backtest started in background.",
+        "job_id": job_id,
+    }
+
+
+@router.get(
+    "/backtest/jobs/{job_id}", response_model=BacktestResponse, tags=["webserver", "backtest"]
+)
+def api_get_backtest_job(job_id: str):
+    """
+    Get progress or result of a backtest job.
+    """
+    job = _get_backtest_job(job_id)
+    if job["is_running"]:
+        progress = ApiBG.bt_pool.progress(job_id) if ApiBG.bt_pool else {}
+        job["progress"] = progress.get("progress", 0)
+        return {
+            "status": "running",
+            "running": True,
+            "step": progress.get("step", str(BacktestState.STARTUP)),
+            "progress": job["progress"],
+            "trade_count": progress.get("trade_count", 0),
+            "status_msg": "Backtest running",
+        }
+    if job["error"] or job["status"] == "cancelled":
+        return {
+            "status": "error",
+            "running": False,
+            "step": "",
+            "progress": 0,
+            "status_msg": f"Backtest failed with {job['error'] or job['status']}",
+        }
+    return {
+        "status": "ended",
+        "running": False,
+        "status_msg": "Backtest ended",
+        "step": "finished",
+        "progress": 1,
+        "backtest_result": job["result"],
+    }
+
+
+@router.get(
+    "/backtest/jobs/{job_id}/abort",
+    response_model=BacktestResponse,
+    tags=["webserver", "backtest"],
+)
+def api_abort_backtest_job(job_id: str):
+    job = _get_backtest_job(job_id)
+    if not job["is_running"] or not ApiBG.bt_pool:
+        return {
+            "status": "not_running",
+            "running": False,
+            "step": "",
+            "progress": 0,
+            "status_msg": "Backtest ended",
+        }
+    ApiBG.bt_pool.abort(job_id)
+    return {
+        "status": "stopping",
+        "running": False,
+        "step": "",
+        "progress": 0,
+        "status_msg": "Backtest ended",
+    }
+
+
+@router.delete(
+    "/backtest/jobs/{job_id}", response_model=BacktestResponse, tags=["webserver", "backtest"]
+)
+def api_delete_backtest_job(job_id: str):
+    """Remove a finished backtest job, including its result"""
+    job = _get_backtest_job(job_id)
+    if job["is_running"]:
+        return {
+            "status": "running",
+            "running": True,
+            "step": "",
+            "progress": 0,
+            "status_msg": "Backtest running",
+        }
+    del ApiBG.jobs[job_id]
+    if ApiBG.bt_pool:
+        ApiBG.bt_pool.release(job_id)
+    return {
+        "status": "reset",
+        "running": False,
+        "step": "",
+        "progress": 0,
+        "status_msg": "Backtest reset",
+    }
+
+
 @router.get(
     "/backtest/history", response_model=list[BacktestHistoryEntry], tags=["webserver", "backtest"]
 )
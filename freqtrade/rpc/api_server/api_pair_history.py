@@ -22,6 +22,7 @@ def pair_history(
     timerange: str,
     strategy: str,
     freqaimodel: str | None = None,
+    columnar: bool = False,
     config=Depends(get_config),
     exchange=Depends(get_exchange),
 ):
@@ -38,7 +39,9 @@ def pair_history(
     )
     validate_config_consistency(config_loc)
     try:
-        return RPC._rpc_analysed_history_full(config_loc, pair, timeframe, exchange, None, False)
+        return RPC._rpc_analysed_history_full(
+            config_loc, pair, timeframe, exchange, None, False, columnar=columnar
+        )
     except Exception as e:
         raise HTTPException(status_code=502, detail=str(e))
 
@@ -71,6 +74,7 @@ def pair_history_filtered(payload: PairHistoryRequest, config=Depends(get_config
             exchange,
             payload.columns,
             payload.live_mode,
+            columnar=payload.columnar,
         )
     except Exception as e:
         logger.exception("Error in pair_history_filtered")
@@ -529,6 +529,7 @@ class PairHistoryRequest(PairCandlesRequest, ExchangeModePayloadMixin):
     strategy: str | None = None
     freqaimodel: str | None = None
     live_mode: bool = False
+    columnar: bool = False
 
 
 class PairHistory(BaseModel):
@@ -539,6 +540,7 @@ class PairHistory(BaseModel):
     columns: list[str]
     all_columns: list[str] = []
     data: SerializeAsAny[list[Any]]
+    columnar: bool = False
     annotations: list[AnnotationType] | None = None
     length: int
     buy_signals: int
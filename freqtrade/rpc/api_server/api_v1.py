@@ -89,7 +89,8 @@ logger = logging.getLogger(__name__)
 # 2.40: Add hyperopt-loss endpoint
 # 2.41: Add download-data endpoint
 # 2.42: Add /pair_history endpoint with live data
-API_VERSION = 2.42
+# 2.43: Cached /pair_history analysis, columnar response format
+API_VERSION = 2.43
 
 # Public API, requires no auth.
 router_public = APIRouter()
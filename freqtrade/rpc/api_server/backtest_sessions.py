@@ -0,0 +1,301 @@
+"""
+Warm backtest sessions for webserver mode.
+Keeps loaded backtest data in memory (limited by size) so following backtests can reuse it,
+and runs backtests in worker processes so multiple backtests can run at the same time.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from pandas import DataFrame
+
+from freqtrade.configuration import TimeRange
+from freqtrade.configuration.config_validation import validate_config_consistency
+from freqtrade.constants import Config
+from freqtrade.enums import BacktestState
+from freqtrade.exchange.funding_fees import FundingFeeIndex
+from freqtrade.ft_types import BacktestResultType, get_BacktestResultType_default
+
+
+if TYPE_CHECKING:
+    from freqtrade.optimize.backtesting import Backtesting
+    from freqtrade.strategy import IStrategy
+
+
+logger = logging.getLogger(__name__)
+
+# Memory budget for warm backtest data (in MB) - applies per process.
+BT_SESSIONS_MAX_MB_DEFAULT = 2048
+# Number of worker processes for concurrent backtest jobs.
+BT_WORKERS_DEFAULT = 2
+# Interval (in seconds) in which worker processes publish backtest progress.
+BT_PROGRESS_INTERVAL = 0.5
+
+SessionKey = tuple[Any, ...]
+
+
+def get_session_key(btconfig: Config, strategy: "IStrategy") -> SessionKey:
+    """
+    Loaded data only depends on these settings - backtests for different strategies
+    (or different stake / protection settings) can share one session.
+    """
+    return (
+        strategy.timeframe,
+        btconfig.get("timeframe_detail") or "",
+        btconfig.get("timerange") or "",
+        tuple(btconfig["exchange"].get("pair_whitelist", [])),
+        strategy.startup_candle_count,
+        str(btconfig.get("trading_mode", "spot")),
+    )
+
+
+def _data_size(data: dict[str, Any]) -> int:
+    size = 0
+    for value in data.values():
+        if isinstance(value, DataFrame):
+            size += int(value.memory_usage(index=True).sum())
+        elif isinstance(value, FundingFeeIndex):
+            size += value.nbytes
+    return size
+
+
+class BacktestSession:
+    """
+    A Backtesting instance, together with the data it loaded.
+    """
+
+    def __init__(self, bt: "Backtesting", data: dict[str, DataFrame], timerange: TimeRange):
+        self.bt = bt
+        self.data = data
+        self.timerange = timerange
+        self.nbytes = _data_size(data) + _data_size(bt.detail_data) + _data_size(bt.futures_data)
+
+
+class BacktestSessionCache:
+    """
+    Least recently used backtest sessions, limited by the size of their data.
+    The most recently used session is always kept, even if it exceeds the limit on its own.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._sessions: OrderedDict[SessionKey, BacktestSession] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, key: SessionKey) -> bool:
+        return key in self._sessions
+
+    @property
+    def nbytes(self) -> int:
+        return sum(session.nbytes for session in self._sessions.values())
+
+    def get(self, key: SessionKey) -> BacktestSession | None:
+        with self._lock:
+            if session := self._sessions.get(key):
+                self._sessions.move_to_end(key)
+            return session
+
+    def put(self, key: SessionKey, session: BacktestSession) -> None:
+        with self._lock:
+            self._sessions[key] = session
+            self._sessions.move_to_end(key)
+            while len(self._sessions) > 1 and self.nbytes > self.max_bytes:
+                evicted, _ = self._sessions.popitem(last=False)
+                logger.info(f"Releasing backtest data for {evicted}.")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+
+
+def get_sessions_max_bytes(config: Config) -> int:
+    max_mb = config.get("api_server", {}).get("backtest_memory_mb", BT_SESSIONS_MAX_MB_DEFAULT)
+    return int(max_mb * 1024 * 1024)
+
+
+def load_session(
+    sessions: BacktestSessionCache,
+    btconfig: Config,
+    strategy: "IStrategy",
+    on_backtesting: Callable[["Backtesting"], None] | None = None,
+) -> BacktestSession:
+    """
+    Get the warm session for this configuration - or create a new one, loading the data.
+    :param on_backtesting: Called with the Backtesting instance before data is loaded.
+    """
+    key = get_session_key(btconfig, strategy)
+    if session := sessions.get(key):
+        session.bt.config = btconfig
+        session.bt.init_backtest()
+        if on_backtesting:
+            on_backtesting(session.bt)
+        return session
+
+    from freqtrade.optimize.backtesting import Backtesting
+
+    bt = Backtesting(btconfig)
+    if on_backtesting:
+        on_backtesting(bt)
+    data, timerange = bt.load_bt_data()
+    session = BacktestSession(bt, data, timerange)
+    sessions.put(key, session)
+    return session
+
+
+def run_session_backtest(
+    session: BacktestSession, strategy: "IStrategy", btconfig: Config
+) -> BacktestResultType:
+    """
+    Backtest one strategy on the data of the session.
+    Reuses a cached result if available (according to `backtest_cache`).
+    """
+    from freqtrade.data.metrics import combined_dataframes_with_rel_mean
+    from freqtrade.optimize.optimize_reports import generate_backtest_stats, store_backtest_results
+
+    bt = session.bt
+    bt.enable_protections = btconfig.get("enable_protections", False)
+    bt.strategylist = [strategy]
+    bt.results = get_BacktestResultType_default()
+    bt.load_prior_backtest()
+
+    bt.abort = False
+    strategy_name = strategy.get_strategy_name()
+    if bt.results and strategy_name in bt.results["strategy"]:
+        # When previous result hash matches - reuse that result and skip backtesting.
+        logger.info(f"Reusing result of previous backtest for {strategy_name}")
+    else:
+        min_date, max_date = bt.backtest_one_strategy(strategy, session.data, session.timerange)
+
+        bt.results = generate_backtest_stats(
+            session.data, bt.all_bt_content, min_date=min_date, max_date=max_date
+        )
+
+        if btconfig.get("export", "none") == "trades":
+            combined_res = combined_dataframes_with_rel_mean(session.data, min_date, max_date)
+            fn = store_backtest_results(
+                btconfig,
+                bt.results,
+                datetime.now().strftime("%Y-%m-%d_%H-%M-%S"),
+                market_change_data=combined_res,
+                strategy_files={s.get_strategy_name(): s.__file__ for s in bt.strategylist},
+            )
+            bt.results["metadata"][strategy_name]["filename"] = str(fn.stem)
+            bt.results["metadata"][strategy_name]["strategy"] = strategy_name
+
+    logger.info("Backtest finished.")
+    return bt.results
+
+
+# State of worker processes
+# Shared dict (manager proxy) with progress and abort requests per job.
+_worker_state: Any = None
+_worker_sessions: BacktestSessionCache | None = None
+
+
+def _init_worker(state: Any, max_bytes: int) -> None:
+    from freqtrade.loggers import setup_logging_pre
+
+    global _worker_state, _worker_sessions
+    setup_logging_pre()
+    _worker_state = state
+    _worker_sessions = BacktestSessionCache(max_bytes)
+
+
+def _publish_progress(job_id: str, bt: "Backtesting | None") -> None:
+    from freqtrade.persistence import LocalTrade
+
+    if bt is None:
+        return
+    if _worker_state.get(("abort", job_id)):
+        bt.abort = True
+    _worker_state[job_id] = {
+        "step": bt.progress.action,
+        "progress": bt.progress.progress,
+        "trade_count": len(LocalTrade.bt_trades),
+    }
+
+
+def run_backtest_job(job_id: str, btconfig: Config) -> BacktestResultType:
+    """
+    Runs one backtest in a worker process, using the warm sessions of this worker.
+    Progress is published to the shared state while the backtest runs.
+    """
+    from freqtrade.resolvers import StrategyResolver
+
+    if _worker_sessions is None:
+        raise RuntimeError("Worker process not initialized.")
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    current: dict[str, Backtesting] = {}
+    stopped = threading.Event()
+
+    def publish() -> None:
+        while not stopped.wait(BT_PROGRESS_INTERVAL):
+            _publish_progress(job_id, current.get("bt"))
+
+    publisher = threading.Thread(target=publish, name="ft_bt_progress", daemon=True)
+    publisher.start()
+    try:
+        strat = StrategyResolver.load_strategy(btconfig)
+        validate_config_consistency(btconfig)
+
+        session = load_session(
+            _worker_sessions, btconfig, strat, on_backtesting=lambda bt: current.update(bt=bt)
+        )
+        return run_session_backtest(session, strat, btconfig)
+    finally:
+        stopped.set()
+        publisher.join()
+        _publish_progress(job_id, current.get("bt"))
+
+
+class BacktestWorkerPool:
+    """
+    Runs backtests in worker processes - so multiple backtests can run concurrently.
+    Every worker process keeps its own warm sessions (limited to max_bytes).
+    """
+
+    def __init__(self, max_workers: int, max_bytes: int):
+        ctx = multiprocessing.get_context("spawn")
+        self.max_workers = max_workers
+        self._manager = ctx.Manager()
+        self._state = self._manager.dict()
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(self._state, max_bytes),
+        )
+
+    def submit(self, job_id: str, btconfig: Config) -> Future:
+        return self._executor.submit(run_backtest_job, job_id, btconfig)
+
+    def progress(self, job_id: str) -> dict[str, Any]:
+        """
+        Latest progress published by the worker running this job.
+        """
+        return self._state.get(job_id) or {
+            "step": str(BacktestState.STARTUP),
+            "progress": 0,
+            "trade_count": 0,
+        }
+
+    def abort(self, job_id: str) -> None:
+        self._state[("abort", job_id)] = True
+
+    def release(self, job_id: str) -> None:
+        self._state.pop(job_id, None)
+        self._state.pop(("abort", job_id), None)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._manager.shutdown()
@@ -89,6 +89,10 @@ class ApiServer(RPCHandler):
         del ApiServer._rpc
         ApiBG.exchanges = {}
         ApiBG.jobs = {}
+        ApiBG.bt_sessions = None
+        if ApiBG.bt_pool:
+            ApiBG.bt_pool.shutdown()
+            ApiBG.bt_pool = None
         if self._server and not self._standalone:
             logger.info("Stopping API Server")
             # self._server.force_exit, self._server.should_exit = True, True
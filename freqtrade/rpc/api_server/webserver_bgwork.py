@@ -4,6 +4,7 @@ from uuid import uuid4
 from typing_extensions import NotRequired, TypedDict
 
 from freqtrade.exchange.exchange import Exchange
+from freqtrade.rpc.api_server.backtest_sessions import BacktestSessionCache, BacktestWorkerPool
 
 
 class ProgressTask(TypedDict):
@@ -13,7 +14,7 @@ class ProgressTask(TypedDict):
 
 
 class JobsContainer(TypedDict):
-    category: Literal["pairlist", "download_data"]
+    category: Literal["pairlist", "download_data", "backtest"]
     is_running: bool
     status: str
     progress: float | None
@@ -26,12 +27,13 @@ class ApiBG:
     # Backtesting type: Backtesting
     bt: dict[str, Any] = {
         "bt": None,
-        "data": None,
-        "timerange": None,
-        "last_config": {},
         "bt_error": None,
     }
     bgtask_running: bool = False
+    # Warm backtest data, reused by following backtests with the same data settings.
+    bt_sessions: BacktestSessionCache | None = None
+    # Worker processes for concurrent backtest jobs - created on first use.
+    bt_pool: BacktestWorkerPool | None = None
     # Exchange - only available in webserver mode.
     exchanges: dict[str, Exchange] = {}
 
@@ -2,14 +2,20 @@ import logging
 
 from freqtrade.constants import Config
 from freqtrade.enums import RPCMessageType
+from freqtrade.misc import chunks
 from freqtrade.rpc import RPC
 from freqtrade.rpc.webhook import Webhook
 
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of embeds discord accepts per message.
+DISCORD_MAX_EMBEDS = 10
+
 
 class Discord(Webhook):
+    max_batch_size = DISCORD_MAX_EMBEDS
+
     def __init__(self, rpc: "RPC", config: Config):
         self._config = config
         self.rpc = rpc
@@ -30,32 +36,51 @@ class Discord(Webhook):
         """
         pass
 
-    def send_msg(self, msg) -> None:
-        if fields := self._config["discord"].get(msg["type"].value):
-            logger.info(f"Sending discord message: {msg}")
-
-            msg["strategy"] = self.strategy
-            msg["timeframe"] = self.timeframe
-            msg["bot_name"] = self.bot_name
-            color = 0x0000FF
-            if msg["type"] in (RPCMessageType.EXIT, RPCMessageType.EXIT_FILL):
-                profit_ratio = msg.get("profit_ratio")
-                color = 0x00FF00 if profit_ratio > 0 else 0xFF0000
-            title = msg["type"].value
-            if "pair" in msg:
-                title = f"Trade: {msg['pair']} {msg['type'].value}"
-            embeds = [
-                {
-                    "title": title,
-                    "color": color,
-                    "fields": [],
-                }
-            ]
-            for f in fields:
-                for k, v in f.items():
-                    v = v.format(**msg)
-                    embeds[0]["fields"].append({"name": k, "value": v, "inline": True})
+    def _get_embed(self, msg) -> dict | None:
+        """
+        Embed for the message - None if the message type is not configured.
+        """
+        if not (fields := self._config["discord"].get(msg["type"].value)):
+            return None
+        logger.info(f"Sending discord message: {msg}")
 
+        msg["strategy"] = self.strategy
+        msg["timeframe"] = self.timeframe
+        msg["bot_name"] = self.bot_name
+        color = 0x0000FF
+        if msg["type"] in (RPCMessageType.EXIT, RPCMessageType.EXIT_FILL):
+            profit_ratio = msg.get("profit_ratio")
+            color = 0x00FF00 if profit_ratio > 0 else 0xFF0000
+        title = msg["type"].value
+        if "pair" in msg:
+            title = f"Trade: {msg['pair']} {msg['type'].value}"
+        embed: dict = {
+            "title": title,
+            "color": color,
+            "fields": [],
+        }
+        for f in fields:
+            for k, v in f.items():
+                v = v.format(**msg)
+                embed["fields"].append({"name": k, "value": v, "inline": True})
+        return embed
+
+    def send_msg(self, msg) -> None:
+        if embed := self._get_embed(msg):
             # Send the message to discord channel
-            payload = {"embeds": embeds}
+            payload = {"embeds": [embed]}
             self._send_msg(payload)
+
+    def send_batch(self, msgs) -> None:
+        """
+        Send queued messages as embeds of as few discord messages as possible.
+        """
+        embeds = []
+        for msg in msgs:
+            try:
+                if embed := self._get_embed(msg):
+                    embeds.append(embed)
+            except Exception:
+                logger.exception(f"Could not create discord message for {msg['type']}")
+        for batch in chunks(embeds, DISCORD_MAX_EMBEDS):
+            self._send_msg({"embeds": batch})
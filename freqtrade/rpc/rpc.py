@@ -8,11 +8,12 @@ from collections.abc import Generator, Sequence
 from datetime import date, datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import psutil
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzlocal
-from numpy import inf, int64, isnan, mean, nan
-from pandas import DataFrame, NaT
+from numpy import int64, isnan, mean, nan
+from pandas import DataFrame
 from sqlalchemy import func, select
 
 from freqtrade import __version__
@@ -37,6 +38,7 @@ from freqtrade.loggers import bufferHandler
 from freqtrade.persistence import CustomDataWrapper, KeyValueStore, PairLocks, Trade
 from freqtrade.persistence.models import PairLock, custom_data_rpc_wrapper
 from freqtrade.plugins.pairlist.pairlist_helpers import expand_pairlist
+from freqtrade.rpc.analyzed_history import AnalyzedHistory, AnalyzedHistoryCache
 from freqtrade.rpc.fiat_convert import CryptoToFiatConverter
 from freqtrade.rpc.rpc_types import RPCSendMsg
 from freqtrade.util import (
@@ -75,6 +77,11 @@ class RPCException(Exception):
 
 
 class RPCHandler:
+    # Sending blocks (e.g. http calls) - RPCManager sends messages from a background queue.
+    blocking_send: bool = False
+    # Number of queued messages handed to send_batch() at once.
+    max_batch_size: int = 1
+
     def __init__(self, rpc: "RPC", config: Config) -> None:
         """
         Initializes RPCHandlers
@@ -98,6 +105,14 @@ class RPCHandler:
     def send_msg(self, msg: RPCSendMsg) -> None:
         """Sends a message to all registered rpc modules"""
 
+    def send_batch(self, msgs: list[RPCSendMsg]) -> None:
+        """
+        Sends multiple queued messages (up to max_batch_size).
+        Handlers able to combine messages into one request should override this.
+        """
+        for msg in msgs:
+            self.send_msg(msg)
+
 
 class RPC:
     """
@@ -106,6 +121,8 @@ class RPC:
 
     # Bind _fiat_converter if needed
     _fiat_converter: CryptoToFiatConverter | None = None
+    # Analyzed history of stored data, shared by all /pair_history requests
+    _analyzed_history = AnalyzedHistoryCache()
     if TYPE_CHECKING:
         from freqtrade.freqtradebot import FreqtradeBot
 
@@ -1345,6 +1362,29 @@ class RPC:
 
         return {"log_count": len(records), "logs": records}
 
+    @staticmethod
+    def _dataframe_to_columns(dataframe: DataFrame) -> list[list[Any]]:
+        """
+        Convert dataframe columns to lists of python objects.
+        Missing values (NaN, NaT, inf) are replaced with None.
+        """
+        columns = []
+        for _, column in dataframe.items():
+            if isinstance(column.dtype, np.dtype) and column.dtype.kind in "iub":
+                columns.append(column.tolist())
+                continue
+            if isinstance(column.dtype, np.dtype) and column.dtype.kind == "f":
+                values = column.to_numpy()
+                invalid = ~np.isfinite(values)
+            else:
+                values = column.to_numpy(dtype=object)
+                invalid = column.isna().to_numpy()
+            column_list = values.tolist()
+            for idx in np.flatnonzero(invalid):
+                column_list[idx] = None
+            columns.append(column_list)
+        return columns
+
     @staticmethod
     def _convert_dataframe_to_dict(
         strategy: str,
@@ -1354,7 +1394,11 @@ class RPC:
         last_analyzed: datetime,
         selected_cols: list[str] | None,
         annotations: list[AnnotationType],
+        columnar: bool = False,
     ) -> dict[str, Any]:
+        """
+        :param columnar: Return data as list of columns instead of list of rows.
+        """
         has_content = len(dataframe) != 0
         dataframe_columns = list(dataframe.columns)
         signals = {
@@ -1378,16 +1422,7 @@ class RPC:
                     signals[sig_type] = int(mask.sum())
                     dataframe.loc[mask, f"_{sig_type}_signal_close"] = dataframe.loc[mask, "close"]
 
-            # band-aid until this is fixed:
-            # https://github.com/pandas-dev/pandas/issues/45836
-            datetime_types = ["datetime", "datetime64", "datetime64[ns, UTC]"]
-            date_columns = dataframe.select_dtypes(include=datetime_types)
-            for date_column in date_columns:
-                # replace NaT with `None`
-                dataframe[date_column] = dataframe[date_column].astype(object).replace({NaT: None})
-
-            dataframe = dataframe.replace({inf: None, -inf: None, nan: None})
-
+        columns = RPC._dataframe_to_columns(dataframe)
         res = {
             "pair": pair,
             "timeframe": timeframe,
@@ -1395,7 +1430,8 @@ class RPC:
             "strategy": strategy,
             "all_columns": dataframe_columns,
             "columns": list(dataframe.columns),
-            "data": dataframe.values.tolist(),
+            "data": columns if columnar else [list(row) for row in zip(*columns, strict=True)],
+            "columnar": columnar,
             "length": len(dataframe),
             "buy_signals": signals["enter_long"],  # Deprecated
             "sell_signals": signals["exit_long"],  # Deprecated
@@ -1497,21 +1533,36 @@ class RPC:
         exchange: Exchange,
         selected_cols: list[str] | None,
         live: bool,
+        columnar: bool = False,
     ) -> dict[str, Any]:
         timerange_parsed = TimeRange.parse_timerange(config.get("timerange"))
 
         from freqtrade.data.converter import trim_dataframe
         from freqtrade.data.dataprovider import DataProvider
+        from freqtrade.optimize.backtest_caching import get_strategy_run_id
         from freqtrade.resolvers.strategy_resolver import StrategyResolver
 
         strategy_name = ""
         startup_candles = 0
+        cache_key = None
+        cached = None
         if config.get("strategy"):
             strategy = StrategyResolver.load_strategy(config)
             startup_candles = strategy.startup_candle_count
             strategy_name = strategy.get_strategy_name()
+            if not live:
+                # Analysis of stored data only depends on strategy, config and timerange.
+                cache_key = (
+                    get_strategy_run_id(strategy, ignored_keys=("timerange",)),
+                    pair,
+                    timeframe,
+                    config.get("candle_type_def", CandleType.SPOT),
+                )
+                cached = RPC._analyzed_history.get(cache_key, timerange_parsed)
 
-        if live:
+        if cached is not None:
+            data = cached.dataframe
+        elif live:
             data = exchange.get_historic_ohlcv(
                 pair=pair,
                 timeframe=timeframe,
@@ -1539,14 +1590,24 @@ class RPC:
             data = _data[pair]
 
         annotations = []
+        last_analyzed = dt_now()
         if config.get("strategy"):
             strategy.dp = DataProvider(config, exchange=exchange, pairlists=None)
             strategy.ft_bot_start()
 
-            df_analyzed = strategy.analyze_ticker(data, {"pair": pair})
-            df_analyzed = trim_dataframe(
-                df_analyzed, timerange_parsed, startup_candles=startup_candles
-            )
+            if cached is not None:
+                df_analyzed = cached.slice(timerange_parsed)
+                last_analyzed = cached.analyzed_at
+            else:
+                df_full = strategy.analyze_ticker(data, {"pair": pair})
+                if cache_key is not None:
+                    RPC._analyzed_history.put(
+                        cache_key,
+                        AnalyzedHistory(df_full, timerange_parsed, startup_candles, last_analyzed),
+                    )
+                df_analyzed = trim_dataframe(
+                    df_full, timerange_parsed, startup_candles=startup_candles
+                )
             annotations = strategy.ft_plot_annotations(pair=pair, dataframe=df_analyzed)
 
         else:
@@ -1557,9 +1618,10 @@ class RPC:
             pair,
             timeframe,
             df_analyzed.copy(),
-            dt_now(),
+            last_analyzed,
             selected_cols,
             annotations,
+            columnar=columnar,
         )
 
     def _rpc_plot_config(self) -> dict[str, Any]:
@@ -4,16 +4,22 @@ This module contains class to manage RPC communications (Telegram, API, ...)
 
 import logging
 from collections import deque
+from functools import partial
 
 from freqtrade.constants import Config
 from freqtrade.enums import NO_ECHO_MESSAGES, RPCMessageType
 from freqtrade.rpc import RPC, RPCHandler
 from freqtrade.rpc.rpc_types import RPCSendMsg
+from freqtrade.rpc.send_queue import SendQueue
 
 
 logger = logging.getLogger(__name__)
 
 
+def _dropped_message(count: int) -> RPCSendMsg:
+    return {"type": RPCMessageType.WARNING, "status": f"Notifications dropped: {count}"}
+
+
 class RPCManager:
     """
     Class to manage RPC objects (Telegram, API, ...)
@@ -54,9 +60,25 @@ class RPCManager:
             apiserver.add_rpc_handler(self._rpc)
             self.registered_modules.append(apiserver)
 
+        # Modules with blocking sends are sent to from a background queue each,
+        # so the bot loop doesn't wait for them.
+        self._send_queues: dict[str, SendQueue[RPCSendMsg]] = {
+            mod.name: SendQueue(
+                mod.name,
+                partial(self._forward_batch, mod),
+                max_batch=mod.max_batch_size,
+                summarize=_dropped_message,
+            )
+            for mod in self.registered_modules
+            if mod.blocking_send
+        }
+
     def cleanup(self) -> None:
         """Stops all enabled rpc modules"""
         logger.info("Cleaning up rpc modules ...")
+        # Send pending messages first
+        for send_queue in self._send_queues.values():
+            send_queue.close()
         while self.registered_modules:
             mod = self.registered_modules.pop()
             logger.info("Cleaning up rpc.%s ...", mod.name)
@@ -75,13 +97,36 @@ class RPCManager:
         if msg.get("type") not in NO_ECHO_MESSAGES:
             logger.info("Sending rpc message: %s", msg)
         for mod in self.registered_modules:
-            logger.debug("Forwarding message to rpc.%s", mod.name)
-            try:
-                mod.send_msg(msg)
-            except NotImplementedError:
-                logger.error(f"Message type '{msg['type']}' not implemented by handler {mod.name}.")
-            except Exception:
-                logger.exception("Exception occurred within RPC module %s", mod.name)
+            if send_queue := self._send_queues.get(mod.name):
+                # Handlers may modify the message - which is sent later on.
+                send_queue.put(msg.copy())
+            else:
+                self._forward(mod, msg)
+
+    def _forward(self, mod: RPCHandler, msg: RPCSendMsg) -> None:
+        logger.debug("Forwarding message to rpc.%s", mod.name)
+        try:
+            mod.send_msg(msg)
+        except NotImplementedError:
+            logger.error(f"Message type '{msg['type']}' not implemented by handler {mod.name}.")
+        except Exception:
+            logger.exception("Exception occurred within RPC module %s", mod.name)
+
+    def _forward_batch(self, mod: RPCHandler, msgs: list[RPCSendMsg]) -> None:
+        """
+        Send messages queued for mod - called from the background queue.
+        Messages are forwarded one by one (so failures don't affect other messages),
+        unless mod combines multiple messages into one request.
+        """
+        if len(msgs) == 1 or mod.max_batch_size == 1:
+            for msg in msgs:
+                self._forward(mod, msg)
+            return
+        logger.debug("Forwarding %s messages to rpc.%s", len(msgs), mod.name)
+        try:
+            mod.send_batch(msgs)
+        except Exception:
+            logger.exception("Exception occurred within RPC module %s", mod.name)
 
     def process_msg_queue(self, queue: deque) -> None:
         """
@@ -92,12 +137,14 @@ class RPCManager:
             logger.info("Sending rpc strategy_msg: %s", msg)
             for mod in self.registered_modules:
                 if mod._config.get(mod.name, {}).get("allow_custom_messages", False):
-                    mod.send_msg(
-                        {
-                            "type": RPCMessageType.STRATEGY_MSG,
-                            "msg": msg,
-                        }
-                    )
+                    strategy_msg: RPCSendMsg = {
+                        "type": RPCMessageType.STRATEGY_MSG,
+                        "msg": msg,
+                    }
+                    if send_queue := self._send_queues.get(mod.name):
+                        send_queue.put(strategy_msg)
+                    else:
+                        mod.send_msg(strategy_msg)
 
     def startup_messages(self, config: Config, pairlist, protections) -> None:
         if config["dry_run"]:
@@ -0,0 +1,116 @@
+"""
+Bounded outbound message queue, sending from a background thread.
+Used by RPCManager for rpc handlers with blocking I/O (webhooks) - so the bot loop
+never waits for notifications to be sent.
+"""
+
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of messages waiting to be sent - the oldest ones are dropped beyond that.
+SEND_QUEUE_SIZE = 1000
+# Time (in seconds) to wait for pending messages on shutdown.
+SEND_QUEUE_FLUSH_TIMEOUT = 10
+
+T = TypeVar("T")
+
+
+class SendQueue(Generic[T]):
+    """
+    Messages are sent in order by a background thread, in batches of up to max_batch messages
+    (all messages which queued up while the previous batch was sent).
+    If the queue is full, the oldest message is dropped. The number of dropped messages is
+    logged - and sent as message created by summarize (if given) with the next batch.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        send: Callable[[list[T]], None],
+        *,
+        maxsize: int = SEND_QUEUE_SIZE,
+        max_batch: int = 1,
+        summarize: Callable[[int], T] | None = None,
+    ):
+        self.name = name
+        self._send = send
+        self._max_batch = max_batch
+        self._summarize = summarize
+        self._queue: deque[T] = deque(maxlen=maxsize)
+        self._dropped = 0
+        self._sending = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def put(self, msg: T) -> None:
+        """
+        Queue a message - never blocks.
+        """
+        with self._cond:
+            if self._closed:
+                logger.warning(f"Send queue {self.name} closed - message not sent.")
+                return
+            if len(self._queue) == self._queue.maxlen:
+                self._dropped += 1
+            self._queue.append(msg)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"ft_send_{self.name}", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+    def _next_batch(self) -> list[T] | None:
+        with self._cond:
+            self._sending = False
+            self._cond.notify_all()
+            while not self._queue and not self._closed:
+                self._cond.wait()
+            if not self._queue:
+                return None
+            batch = [self._queue.popleft() for _ in range(min(self._max_batch, len(self._queue)))]
+            dropped, self._dropped = self._dropped, 0
+            self._sending = True
+        if dropped:
+            logger.warning(f"Send queue {self.name} full - dropped {dropped} messages.")
+            if self._summarize:
+                batch.insert(0, self._summarize(dropped))
+        return batch
+
+    def _run(self) -> None:
+        while (batch := self._next_batch()) is not None:
+            try:
+                self._send(batch)
+            except Exception:
+                logger.exception(f"Exception while sending messages from queue {self.name}")
+
+    def flush(self, timeout: float = SEND_QUEUE_FLUSH_TIMEOUT) -> bool:
+        """
+        Wait until all queued messages have been sent.
+        :return: False if messages are still pending after timeout
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._queue and not self._sending, timeout)
+
+    def close(self, timeout: float = SEND_QUEUE_FLUSH_TIMEOUT) -> None:
+        """
+        Send pending messages (waiting up to timeout) and stop the background thread.
+        """
+        if not self.flush(timeout):
+            logger.warning(f"Send queue {self.name}: {len(self._queue)} messages not sent.")
+        with self._cond:
+            self._closed = True
+            self._queue.clear()
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
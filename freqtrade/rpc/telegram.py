@@ -8,6 +8,7 @@ import asyncio
 import json
 import logging
 import re
+from collections import deque
 from collections.abc import Callable, Coroutine
 from copy import deepcopy
 from dataclasses import dataclass
@@ -16,7 +17,7 @@ from functools import partial, wraps
 from html import escape
 from itertools import chain
 from math import isnan
-from threading import Thread
+from threading import Lock, Thread
 from typing import Any, Literal
 
 from tabulate import tabulate
@@ -30,7 +31,7 @@ from telegram import (
     Update,
 )
 from telegram.constants import MessageLimit, ParseMode
-from telegram.error import BadRequest, NetworkError, TelegramError
+from telegram.error import BadRequest, NetworkError, RetryAfter, TelegramError
 from telegram.ext import Application, CallbackContext, CallbackQueryHandler, CommandHandler
 from telegram.helpers import escape_markdown
 
@@ -53,6 +54,12 @@ from freqtrade.util import (
 
 
 MAX_MESSAGE_LENGTH = MessageLimit.MAX_TEXT_LENGTH
+# Notifications sent at the same time - further notifications wait in the outbox,
+# and are joined into as few messages as possible once a send finished.
+TELEGRAM_MAX_PENDING = 10
+TELEGRAM_OUTBOX_SIZE = 200
+# Longest wait (in seconds) when telegram asks to retry later due to flood control.
+TELEGRAM_MAX_RETRY_AFTER = 60
 
 
 logger = logging.getLogger(__name__)
@@ -152,6 +159,10 @@ class Telegram(RPCHandler):
 
         self._app: Application
         self._loop: asyncio.AbstractEventLoop
+        self._send_lock = Lock()
+        self._pending_sends = 0
+        self._outbox: deque[tuple[str, bool]] = deque(maxlen=TELEGRAM_OUTBOX_SIZE)
+        self._outbox_dropped = 0
         self._init_keyboard()
         self._start_thread()
 
@@ -607,9 +618,51 @@ class Telegram(RPCHandler):
 
         message = self.compose_message(deepcopy(msg))
         if message:
-            asyncio.run_coroutine_threadsafe(
-                self._send_msg(message, disable_notification=(noti == "silent")), self._loop
-            )
+            self._queue_message(message, silent=(noti == "silent"))
+
+    def _queue_message(self, message: str, silent: bool) -> None:
+        """
+        Send message without waiting for it - or keep it in the outbox
+        while TELEGRAM_MAX_PENDING notifications are being sent.
+        """
+        with self._send_lock:
+            if self._pending_sends >= TELEGRAM_MAX_PENDING:
+                if len(self._outbox) == self._outbox.maxlen:
+                    self._outbox_dropped += 1
+                self._outbox.append((message, silent))
+                return
+            self._pending_sends += 1
+        self._schedule_send(message, silent)
+
+    def _schedule_send(self, message: str, silent: bool) -> None:
+        future = asyncio.run_coroutine_threadsafe(
+            self._send_msg(message, disable_notification=silent), self._loop
+        )
+        future.add_done_callback(self._message_sent)
+
+    def _message_sent(self, _future) -> None:
+        """
+        Send the next messages of the outbox (joined) in place of the finished one.
+        """
+        with self._send_lock:
+            if not self._outbox:
+                self._pending_sends -= 1
+                return
+            message, silent = self._outbox.popleft()
+            while self._outbox:
+                next_message, next_silent = self._outbox[0]
+                if (
+                    next_silent != silent
+                    or len(message) + len(next_message) + 2 > MAX_MESSAGE_LENGTH
+                ):
+                    break
+                message += f"\n\n{next_message}"
+                self._outbox.popleft()
+            if self._outbox_dropped:
+                logger.warning(f"Telegram outbox full - dropped {self._outbox_dropped} messages.")
+                message = f"Notifications dropped: {self._outbox_dropped}\n\n{message}"
+                self._outbox_dropped = 0
+        self._schedule_send(message, silent)
 
     def _get_exit_emoji(self, msg):
         """
@@ -2075,6 +2128,25 @@ class Telegram(RPCHandler):
                     disable_notification=disable_notification,
                     message_thread_id=self._config["telegram"].get("topic_id"),
                 )
+            except RetryAfter as retry_err:
+                # Flood control - wait as long as telegram asks us to before trying again.
+                retry_after = retry_err.retry_after
+                delay: float = (
+                    retry_after.total_seconds()
+                    if isinstance(retry_after, timedelta)
+                    else float(retry_after)
+                )
+                delay = min(delay, TELEGRAM_MAX_RETRY_AFTER)
+                logger.warning("Telegram flood control! Retrying in %s seconds.", delay)
+                await asyncio.sleep(delay)
+                await self._app.bot.send_message(
+                    self._config["telegram"]["chat_id"],
+                    text=msg,
+                    parse_mode=parse_mode,
+                    reply_markup=reply_markup,
+                    disable_notification=disable_notification,
+                    message_thread_id=self._config["telegram"].get("topic_id"),
+                )
             except NetworkError as network_err:
                 # Sometimes the telegram server resets the current connection,
                 # if this is the case we send the message again.
@@ -6,7 +6,7 @@ import logging
 import time
 from typing import Any
 
-from requests import RequestException, post
+from requests import RequestException, Response, post
 
 from freqtrade.constants import Config
 from freqtrade.enums import RPCMessageType
@@ -18,10 +18,15 @@ logger = logging.getLogger(__name__)
 
 logger.debug("Included module rpc.webhook ...")
 
+# Longest wait (in seconds) before retrying a rate limited call.
+WEBHOOK_MAX_RETRY_AFTER = 60
+
 
 class Webhook(RPCHandler):
     """This class handles all webhook communication"""
 
+    blocking_send = True
+
     def __init__(self, rpc: RPC, config: Config) -> None:
         """
         Init the Webhook class, and init the super class RPCHandler
@@ -103,13 +108,15 @@ class Webhook(RPCHandler):
 
         success = False
         attempts = 0
+        retry_delay = self._retry_delay
         while not success and attempts <= self._retries:
             if attempts:
-                if self._retry_delay:
-                    time.sleep(self._retry_delay)
+                if retry_delay:
+                    time.sleep(retry_delay)
                 logger.info("Retrying webhook...")
 
             attempts += 1
+            retry_delay = self._retry_delay
 
             try:
                 if self._format == "form":
@@ -126,9 +133,21 @@ class Webhook(RPCHandler):
                 else:
                     raise NotImplementedError(f"Unknown format: {self._format}")
 
+                if response.status_code == 429:
+                    retry_delay = self._get_retry_after(response)
                 # Throw a RequestException if the post was not successful
                 response.raise_for_status()
                 success = True
 
             except RequestException as exc:
                 logger.warning("Could not call webhook url. Exception: %s", exc)
+
+    def _get_retry_after(self, response: Response) -> float:
+        """
+        Delay requested by a rate limited response (Retry-After header, in seconds)
+        """
+        try:
+            retry_after = float(response.headers.get("Retry-After", ""))
+        except ValueError:
+            return self._retry_delay
+        return min(max(retry_after, 0), WEBHOOK_MAX_RETRY_AFTER)
@@ -0,0 +1,138 @@
+"""
+Memoization of indicators which depend on hyperoptable parameters.
+Used by hyperopt with --analyze-per-epoch - so an indicator is only recalculated
+if one of the parameters it depends on changed since a previous epoch.
+"""
+
+import logging
+import sys
+from collections.abc import Callable, Sequence
+from threading import Lock
+from typing import Any
+
+import numpy as np
+from cachetools import LRUCache
+from pandas import DataFrame, Series
+
+from freqtrade.strategy.parameters import BaseParameter, trace_parameters
+
+
+logger = logging.getLogger(__name__)
+
+# Memory budget (in MB) for memoized indicators - applies per (hyperopt worker) process.
+INDICATOR_CACHE_MB = 512
+
+IndicatorKey = tuple[Any, ...]
+
+
+def _size(value: Any) -> int:
+    if isinstance(value, DataFrame):
+        return int(value.memory_usage(index=True).sum())
+    if isinstance(value, Series):
+        return int(value.memory_usage(index=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, tuple | list):
+        return sum(_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def _copy(value: Any) -> Any:
+    """
+    Memoized results are shared between epochs - return copies, so they can't be modified.
+    """
+    if isinstance(value, DataFrame | Series | np.ndarray):
+        return value.copy()
+    if isinstance(value, tuple | list):
+        return type(value)(_copy(v) for v in value)
+    return value
+
+
+class IndicatorCache:
+    """
+    Indicator results by indicator key and the values of the parameters the indicator
+    depends on. Dependencies are either declared, or detected by tracing which parameters
+    are read while calculating the indicator.
+    Least recently used results are dropped once the cache exceeds max_bytes.
+    """
+
+    def __init__(self, max_bytes: int = INDICATOR_CACHE_MB * 1024 * 1024):
+        self._cache: LRUCache = LRUCache(maxsize=max_bytes, getsizeof=lambda entry: entry[1])
+        # Parameters each indicator depended on during its latest calculation
+        self._dependencies: dict[IndicatorKey, tuple[str, ...]] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get_or_calculate(
+        self,
+        key: IndicatorKey,
+        strategy: Any,
+        func: Callable[[], Any],
+        depends_on: Sequence[BaseParameter] | None = None,
+    ) -> Any:
+        """
+        Get the memoized result of func - or calculate (and memoize) it.
+        :param key: Identifies the indicator and the candles it's calculated on.
+        :param strategy: Strategy the (traced) parameters belong to.
+        :param depends_on: Parameters func depends on. Traced if not given.
+        """
+        if depends_on is not None:
+            names = tuple(p.name for p in depends_on)
+            values = tuple(p.value for p in depends_on)
+        else:
+            names = self._dependencies.get(key, ())
+            values = tuple(getattr(strategy, name).value for name in names)
+
+        if depends_on is not None or key in self._dependencies:
+            with self._lock:
+                entry = self._cache.get((key, names, values))
+            if entry is not None:
+                self.hits += 1
+                return _copy(entry[0])
+
+        self.misses += 1
+        with trace_parameters() as used:
+            result = func()
+        if depends_on is None:
+            if None in used:
+                # Parameters which are not part of the strategy can't be looked up again.
+                logger.debug(f"Not memoizing {key} - depends on an unnamed parameter.")
+                return result
+            names = tuple(sorted(used))  # type: ignore[arg-type]
+            values = tuple(used[name] for name in names)
+            self._dependencies[key] = names
+
+        size = _size(result)
+        if size <= self._cache.maxsize:
+            with self._lock:
+                self._cache[(key, names, values)] = (_copy(result), size)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._dependencies.clear()
+
+
+# Cache of this process - only enabled by hyperopt with --analyze-per-epoch,
+# where every epoch analyzes the same candles.
+_indicator_cache: IndicatorCache | None = None
+
+
+def enable_indicator_cache(max_bytes: int = INDICATOR_CACHE_MB * 1024 * 1024) -> None:
+    global _indicator_cache
+    if _indicator_cache is None:
+        _indicator_cache = IndicatorCache(max_bytes)
+
+
+def disable_indicator_cache() -> None:
+    global _indicator_cache
+    _indicator_cache = None
+
+
+def get_indicator_cache() -> IndicatorCache | None:
+    return _indicator_cache
@@ -5,8 +5,12 @@ This module defines the interface to apply for strategies
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
 from datetime import datetime, timedelta, timezone
+from functools import cached_property
 from math import isinf, isnan
+from typing import Any
 
 from pandas import DataFrame
 from pydantic import ValidationError
@@ -32,12 +36,14 @@ from freqtrade.ft_types import AnnotationType
 from freqtrade.misc import remove_entry_exit_signals
 from freqtrade.persistence import Order, PairLocks, Trade
 from freqtrade.strategy.hyper import HyperStrategyMixin
+from freqtrade.strategy.indicator_cache import get_indicator_cache
 from freqtrade.strategy.informative_decorator import (
     InformativeData,
     PopulateIndicators,
     _create_and_merge_informative_pair,
     _format_pair_name,
 )
+from freqtrade.strategy.parameters import BaseParameter
 from freqtrade.strategy.strategy_validation import StrategyResultValidator
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
 from freqtrade.util import dt_now
@@ -46,6 +52,26 @@ from freqtrade.wallets import Wallets
 
 logger = logging.getLogger(__name__)
 
+# Optional callbacks, which don't have an effect unless implemented by the strategy -
+# with the (legacy) methods their default implementation delegates to.
+OPTIONAL_CALLBACKS: dict[str, tuple[str, ...]] = {
+    "bot_loop_start": (),
+    "check_entry_timeout": ("check_buy_timeout",),
+    "check_exit_timeout": ("check_sell_timeout",),
+    "confirm_trade_entry": (),
+    "confirm_trade_exit": (),
+    "order_filled": (),
+    "custom_entry_price": (),
+    "custom_exit_price": (),
+    "custom_stake_amount": (),
+    "custom_exit": ("custom_sell",),
+    "adjust_order_price": ("adjust_entry_price", "adjust_exit_price"),
+    "leverage": (),
+}
+_OPTIONAL_CALLBACK_METHODS = frozenset(
+    method for name, legacy in OPTIONAL_CALLBACKS.items() for method in (name, *legacy)
+)
+
 
 class IStrategy(ABC, HyperStrategyMixin):
     """
@@ -223,6 +249,35 @@ class IStrategy(ABC, HyperStrategyMixin):
         """
         self.freqai.shutdown()
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _OPTIONAL_CALLBACK_METHODS:
+            # Callback replaced on the instance - detect implemented callbacks again.
+            self.__dict__.pop("_ft_implemented_callbacks", None)
+
+    def ft_overrides(self, method: str) -> bool:
+        """
+        Check if a method is implemented by the strategy (class or instance).
+        """
+        return getattr(getattr(self, method), "__func__", None) is not getattr(IStrategy, method)
+
+    @cached_property
+    def _ft_implemented_callbacks(self) -> frozenset[str]:
+        return frozenset(
+            name
+            for name, legacy in OPTIONAL_CALLBACKS.items()
+            if any(self.ft_overrides(method) for method in (name, *legacy))
+        )
+
+    def ft_has_callback(self, name: str) -> bool:
+        """
+        Check if an optional callback (see OPTIONAL_CALLBACKS) is implemented by the strategy.
+        Calls to callbacks which are not implemented can be skipped - the default
+        implementation returns the default value.
+        Detected once - and again after a callback was replaced on the instance.
+        """
+        return name in self._ft_implemented_callbacks
+
     @abstractmethod
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
@@ -1181,6 +1236,42 @@ class IStrategy(ABC, HyperStrategyMixin):
             lock_time = timeframe_to_next_date(self.timeframe, candle_date)
             return PairLocks.is_pair_locked(pair, lock_time, side=side)
 
+    def cached_indicator(
+        self,
+        dataframe: DataFrame,
+        metadata: dict,
+        name: str,
+        func: Callable[[DataFrame], Any],
+        depends_on: Sequence[BaseParameter] | None = None,
+    ) -> Any:
+        """
+        Calculate an indicator depending on hyperoptable parameters, for example
+        `self.cached_indicator(dataframe, metadata, "ema", lambda df: ta.EMA(df, self.p.value))`.
+        During hyperopt with `--analyze-per-epoch`, results are memoized by the values of the
+        parameters the indicator depends on - and only recalculated if one of them changed.
+        Otherwise this simply returns `func(dataframe)`.
+        func must only depend on the candle data and on parameters - not on other indicators
+        which depend on parameters, unless these parameters are part of depends_on.
+        :param dataframe: Dataframe to calculate the indicator on
+        :param metadata: Metadata dictionary passed to populate_indicators
+        :param name: Name of the indicator - unique within the strategy
+        :param func: Function calculating the indicator from dataframe
+        :param depends_on: Parameters the indicator depends on.
+            Detected by tracing the parameter values func reads if not given.
+        :return: Result of func
+        """
+        cache = get_indicator_cache()
+        if cache is None or dataframe.empty:
+            return func(dataframe)
+        key = (
+            metadata.get("pair"),
+            name,
+            len(dataframe),
+            dataframe["date"].iloc[0] if "date" in dataframe else None,
+            dataframe["date"].iloc[-1] if "date" in dataframe else None,
+        )
+        return cache.get_or_calculate(key, self, lambda: func(dataframe), depends_on)
+
     def analyze_ticker(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         Parses the given candle (OHLCV) data and returns a populated DataFrame
@@ -1459,7 +1550,7 @@ class IStrategy(ABC, HyperStrategyMixin):
         if self.use_exit_signal:
             if exit_ and not enter:
                 exit_signal = ExitType.EXIT_SIGNAL
-            else:
+            elif self.ft_has_callback("custom_exit"):
                 reason_cust = strategy_safe_wrapper(self.custom_exit, default_retval=False)(
                     pair=trade.pair,
                     trade=trade,
@@ -1721,16 +1812,23 @@ class IStrategy(ABC, HyperStrategyMixin):
             if timedout:
                 return True
         time_method = (
-            self.check_exit_timeout
+            "check_exit_timeout"
             if order.ft_order_side == trade.exit_side
-            else self.check_entry_timeout
+            else "check_entry_timeout"
         )
+        if not self.ft_has_callback(time_method):
+            return False
 
-        return strategy_safe_wrapper(time_method, default_retval=False)(
+        return strategy_safe_wrapper(getattr(self, time_method), default_retval=False)(
             pair=trade.pair, trade=trade, order=order, current_time=current_time
         )
 
-    def advise_all_indicators(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
+    def advise_all_indicators(
+        self,
+        data: dict[str, DataFrame],
+        executor: Executor | None = None,
+        copy: bool = True,
+    ) -> dict[str, DataFrame]:
         """
         Populates indicators for given candle (OHLCV) data (for multiple pairs)
         Does not run advise_entry or advise_exit!
@@ -1739,15 +1837,25 @@ class IStrategy(ABC, HyperStrategyMixin):
         Also copy on output to avoid PerformanceWarnings pandas 1.3.0 started to show.
         Has positive effects on memory usage for whatever reason - also when
         using only one strategy.
+        :param data: Dictionary with format {pair: dataframe}
+        :param executor: Executor to analyze pairs concurrently. Analyzes pairs one by one if None.
+        :param copy: Copy the input dataframes. Can be disabled if `data` is not used afterwards.
+        :return: Dictionary with analyzed dataframes, in the order of `data`
         """
-        res = {}
-        for pair, pair_data in data.items():
+
+        def analyze_pair(pair: str, pair_data: DataFrame) -> DataFrame:
             validator = StrategyResultValidator(
                 pair_data, warn_only=not self.disable_dataframe_checks
             )
-            res[pair] = self.advise_indicators(pair_data.copy(), {"pair": pair}).copy()
-            validator.assert_df(res[pair])
-        return res
+            res = self.advise_indicators(pair_data.copy() if copy else pair_data, {"pair": pair})
+            res = res.copy()
+            validator.assert_df(res)
+            return res
+
+        if executor is None:
+            return {pair: analyze_pair(pair, pair_data) for pair, pair_data in data.items()}
+        results = executor.map(analyze_pair, data.keys(), data.values())
+        return dict(zip(data.keys(), results, strict=True))
 
     def ft_advise_signals(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
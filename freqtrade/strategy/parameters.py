@@ -4,9 +4,10 @@ This module defines a base class for auto-hyperoptable strategies.
 """
 
 import logging
+import threading
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
-from contextlib import suppress
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager, suppress
 from typing import Any, Union
 
 from freqtrade.enums import HyperoptState
@@ -26,6 +27,26 @@ from freqtrade.exceptions import OperationalException
 
 logger = logging.getLogger(__name__)
 
+# Per thread stack of parameter reads (name -> value), see trace_parameters().
+_tracing = threading.local()
+
+
+@contextmanager
+def trace_parameters() -> Iterator[dict[str | None, Any]]:
+    """
+    Record the parameters (name -> value) whose value is read within this context.
+    Reads within nested contexts are recorded in the outer context, too.
+    """
+    stack: list[dict[str | None, Any]] = _tracing.__dict__.setdefault("stack", [])
+    used: dict[str | None, Any] = {}
+    stack.append(used)
+    try:
+        yield used
+    finally:
+        stack.pop()
+        if stack:
+            stack[-1].update(used)
+
 
 class BaseParameter(ABC):
     """
@@ -34,7 +55,6 @@ class BaseParameter(ABC):
 
     category: str | None
     default: Any
-    value: Any
     in_space: bool = False
     name: str
 
@@ -70,6 +90,17 @@ class BaseParameter(ABC):
     def __repr__(self):
         return f"{self.__class__.__name__}({self.value})"
 
+    @property
+    def value(self) -> Any:
+        stack = getattr(_tracing, "stack", None)
+        if stack:
+            stack[-1][getattr(self, "name", None)] = self._value
+        return self._value
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self._value = value
+
     @abstractmethod
     def get_space(self, name: str) -> Union["Integer", "Real", "SKDecimal", "Categorical"]:
         """
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from freqtrade.exchange import timeframe_to_minutes
@@ -39,28 +40,27 @@ def merge_informative_pair(
     :return: Merged dataframe
     :raise: ValueError if the secondary timeframe is shorter than the dataframe timeframe
     """
-    informative = informative.copy()
     minutes_inf = timeframe_to_minutes(timeframe_inf)
     minutes = timeframe_to_minutes(timeframe)
     if minutes == minutes_inf:
         # No need to forwardshift if the timeframes are identical
-        informative["date_merge"] = informative[date_column]
+        merge_dates = informative[date_column]
     elif minutes < minutes_inf:
         # Subtract "small" timeframe so merging is not delayed by 1 small candle
         # Detailed explanation in https://github.com/freqtrade/freqtrade/issues/4073
         if not informative.empty:
             if timeframe_inf == "1M":
-                informative["date_merge"] = (
+                merge_dates = (
                     informative[date_column] + pd.offsets.MonthBegin(1)
                 ) - pd.to_timedelta(minutes, "m")
             else:
-                informative["date_merge"] = (
+                merge_dates = (
                     informative[date_column]
                     + pd.to_timedelta(minutes_inf, "m")
                     - pd.to_timedelta(minutes, "m")
                 )
         else:
-            informative["date_merge"] = informative[date_column]
+            merge_dates = informative[date_column]
     else:
         raise ValueError(
             "Tried to merge a faster timeframe to a slower timeframe."
@@ -69,18 +69,35 @@ def merge_informative_pair(
 
     # Rename columns to be unique
     date_merge = "date_merge"
+    columns = list(informative.columns)
     if suffix and append_timeframe:
         raise ValueError("You can not specify `append_timeframe` as True and a `suffix`.")
     elif append_timeframe:
         date_merge = f"date_merge_{timeframe_inf}"
-        informative.columns = [f"{col}_{timeframe_inf}" for col in informative.columns]
+        columns = [f"{col}_{timeframe_inf}" for col in columns]
 
     elif suffix:
         date_merge = f"date_merge_{suffix}"
-        informative.columns = [f"{col}_{suffix}" for col in informative.columns]
+        columns = [f"{col}_{suffix}" for col in columns]
 
     # Combine the 2 dataframes
     # all indicators on the informative sample MUST be calculated before this point
+    indexer = _informative_indexer(dataframe, merge_dates, columns, ffill)
+    if indexer is not None:
+        # Gather the informative rows by position - no merge required.
+        informative = informative.reset_index(drop=True)
+        if (indexer < 0).any():
+            # Rows without informative candle (yet) - missing values, as with a left merge
+            informative = informative.reindex(indexer)
+        else:
+            informative = informative.take(indexer)
+        informative.columns = columns
+        informative.index = pd.RangeIndex(len(indexer))
+        return pd.concat([dataframe.reset_index(drop=True), informative], axis=1)
+
+    informative = informative.copy()
+    informative.columns = columns
+    informative[date_merge] = merge_dates
     if ffill:
         # https://pandas.pydata.org/docs/user_guide/merging.html#timeseries-friendly-merging
         # merge_ordered - ffill method is 2.5x faster than separate ffill()
@@ -101,6 +118,41 @@ def merge_informative_pair(
     return dataframe
 
 
+def _informative_indexer(
+    dataframe: pd.DataFrame, merge_dates: pd.Series, columns: list[str], ffill: bool
+) -> np.ndarray | None:
+    """
+    Position of the informative row for each row of dataframe (-1 if there is none),
+    using binary search over the int64 timestamps.
+    Results are identical to merging on the date (with forward-fill of the last matched row).
+    :return: Indexer, or None if the data is not suitable (unsorted / duplicate dates,
+             overlapping columns, ...) - in which case the regular merge must be used.
+    """
+    if dataframe.empty or merge_dates.empty or "date" not in dataframe.columns:
+        return None
+    dates = dataframe["date"]
+    if (
+        not pd.api.types.is_datetime64_any_dtype(dates)
+        or str(dates.dtype) != str(merge_dates.dtype)
+        or len(set(columns)) != len(columns)
+        or not dataframe.columns.intersection(columns).empty
+        or dates.hasnans
+        or merge_dates.hasnans
+    ):
+        return None
+    left = pd.DatetimeIndex(dates).asi8
+    right = pd.DatetimeIndex(merge_dates).asi8
+    if (np.diff(right) <= 0).any() or (ffill and (np.diff(left) < 0).any()):
+        return None
+
+    pos = np.minimum(np.searchsorted(right, left, side="left"), len(right) - 1)
+    indexer = np.where(right[pos] == left, pos, -1)
+    if ffill:
+        # Matched positions are ascending - so this forward-fills the last matched row
+        indexer = np.maximum.accumulate(indexer)
+    return indexer
+
+
 def stoploss_from_open(
     open_relative_stop: float, current_profit: float, is_short: bool = False, leverage: float = 1.0
 ) -> float:
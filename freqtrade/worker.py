@@ -186,10 +186,13 @@ class Worker:
         self._sleep(sleep_duration)
         return result
 
-    @staticmethod
-    def _sleep(sleep_duration: float) -> None:
-        """Local sleep method - to improve testability"""
-        time.sleep(sleep_duration)
+    def _sleep(self, sleep_duration: float) -> None:
+        """
+        Local sleep method - to improve testability.
+        Returns early if the bot requests a wakeup (e.g. on candle close).
+        """
+        self.freqtrade.wakeup_event.wait(sleep_duration)
+        self.freqtrade.wakeup_event.clear()
 
     def _process_stopped(self) -> None:
         self.freqtrade.process_stopped()
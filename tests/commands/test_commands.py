@@ -1200,11 +1200,13 @@ def test_hyperopt_list(mocker, capsys, caplog, tmp_path):
         return_value=True,
     )
 
-    def fake_iterator(*args, **kwargs):
-        yield from [saved_hyperopt_results]
-
     mocker.patch(
-        "freqtrade.optimize.hyperopt_tools.HyperoptTools._read_results", side_effect=fake_iterator
+        "freqtrade.optimize.hyperopt_tools.HyperoptTools._read_results_index",
+        return_value=saved_hyperopt_results,
+    )
+    mocker.patch(
+        "freqtrade.optimize.hyperopt_tools.HyperoptTools.load_epochs",
+        side_effect=lambda _, epochs: epochs,
     )
 
     args = [
@@ -1566,18 +1568,20 @@ def test_hyperopt_list(mocker, capsys, caplog, tmp_path):
     csv_file.unlink()
 
 
-def test_hyperopt_show(mocker, capsys):
+def test_hyperopt_show(mocker, capsys, caplog):
     saved_hyperopt_results = hyperopt_test_result()
     mocker.patch(
         "freqtrade.optimize.hyperopt_tools.HyperoptTools._test_hyperopt_results_exist",
         return_value=True,
     )
 
-    def fake_iterator(*args, **kwargs):
-        yield from [saved_hyperopt_results]
-
     mocker.patch(
-        "freqtrade.optimize.hyperopt_tools.HyperoptTools._read_results", side_effect=fake_iterator
+        "freqtrade.optimize.hyperopt_tools.HyperoptTools._read_results_index",
+        return_value=saved_hyperopt_results,
+    )
+    mocker.patch(
+        "freqtrade.optimize.hyperopt_tools.HyperoptTools.load_epochs",
+        side_effect=lambda _, epochs: epochs,
     )
     mocker.patch("freqtrade.optimize.optimize_reports.show_backtest_result")
 
@@ -1618,6 +1622,22 @@ def test_hyperopt_show(mocker, capsys):
     captured = capsys.readouterr()
     assert " 10/12" in captured.out
 
+    # Epoch with lightweight metrics only
+    show_mock = mocker.patch("freqtrade.optimize.optimize_reports.show_backtest_result")
+    export_mock = mocker.patch("freqtrade.optimize.hyperopt_tools.HyperoptTools.try_export_params")
+    args = ["hyperopt-show", "-n", "1"]
+    pargs = get_args(args)
+    pargs["config"] = None
+    start_hyperopt_show(pargs)
+    assert show_mock.call_count == 0
+    assert export_mock.call_count == 1
+    assert log_has_re(r"Detailed backtest results are not available for this epoch\..*", caplog)
+
+    saved_hyperopt_results[0]["results_metrics"]["trades"] = []
+    start_hyperopt_show(pargs)
+    assert show_mock.call_count == 1
+    assert export_mock.call_count == 2
+
     args = ["hyperopt-show", "--best", "-n", "-4"]
     pargs = get_args(args)
     pargs["config"] = None
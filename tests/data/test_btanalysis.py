@@ -5,17 +5,22 @@ from zipfile import ZipFile
 
 import pytest
 from pandas import DataFrame, DateOffset, Timestamp, to_datetime
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import LAST_BT_RESULT_FN
+from freqtrade.constants import BT_RESULT_INDEX_FN, LAST_BT_RESULT_FN
 from freqtrade.data.btanalysis import (
     BT_DATA_COLUMNS,
     analyze_trade_parallelism,
+    bt_fileutils,
+    delete_backtest_result,
     extract_trades_of_period,
+    get_backtest_resultlist,
     get_latest_backtest_filename,
     get_latest_hyperopt_file,
     load_backtest_data,
     load_backtest_metadata,
+    load_backtest_stats,
     load_file_from_zip,
     load_trades,
     load_trades_from_db,
@@ -28,6 +33,7 @@ from freqtrade.data.metrics import (
     calculate_expectancy,
     calculate_market_change,
     calculate_max_drawdown,
+    calculate_max_drawdowns,
     calculate_sharpe,
     calculate_sortino,
     calculate_sqn,
@@ -37,6 +43,8 @@ from freqtrade.data.metrics import (
     create_cum_profit,
 )
 from freqtrade.exceptions import OperationalException
+from freqtrade.misc import json_load
+from freqtrade.optimize.optimize_reports import store_backtest_results
 from freqtrade.util import dt_utc
 from tests.conftest import CURRENT_TEST_STRATEGY, create_mock_trades
 from tests.conftest_trades import MOCK_TRADE_COUNT
@@ -144,6 +152,65 @@ def test_load_backtest_data_multi(testdatadir):
         load_backtest_data(filename)
 
 
+def test_load_backtest_data_zip_parquet(testdatadir, tmp_path):
+    filename = testdatadir / "backtest_results/backtest-result_multistrat.json"
+    stats = load_backtest_stats(filename)
+    config = {"exportfilename": tmp_path, "original_config": {}}
+    zip_file = store_backtest_results(config, stats, "2024-01-01_15-05-25")
+    stem = zip_file.stem
+
+    with ZipFile(zip_file) as zipf:
+        assert f"{stem}_StrategyTestV2_trades.parquet" in zipf.namelist()
+        assert f"{stem}_TestStrategy_trades.parquet" in zipf.namelist()
+        with zipf.open(f"{stem}.json") as summary_file:
+            summary = json_load(summary_file)
+    # Summary does not contain trades
+    assert "trades" not in summary["strategy"]["StrategyTestV2"]
+    assert "profit_total" in summary["strategy"]["StrategyTestV2"]
+
+    stats_nt = load_backtest_stats(zip_file, include_trades=False)
+    assert "trades" not in stats_nt["strategy"]["TestStrategy"]
+    assert stats_nt["metadata"]["TestStrategy"]["run_id"]
+
+    stats_zip = load_backtest_stats(zip_file)
+    for strategy in ("StrategyTestV2", "TestStrategy"):
+        trades = stats_zip["strategy"][strategy]["trades"]
+        assert len(trades) == len(stats["strategy"][strategy]["trades"])
+        assert isinstance(trades[0]["open_date"], str)
+
+        bt_data = load_backtest_data(filename, strategy=strategy)
+        bt_data_zip = load_backtest_data(zip_file, strategy=strategy)
+        assert len(bt_data_zip) == 179
+        assert_frame_equal(bt_data, bt_data_zip, check_dtype=False)
+
+
+def test_get_backtest_resultlist_index(testdatadir, tmp_path, mocker):
+    filename = testdatadir / "backtest_results/backtest-result_multistrat.json"
+    stats = load_backtest_stats(filename)
+    config = {"exportfilename": tmp_path, "original_config": {}}
+    zip1 = store_backtest_results(config, stats, "2024-01-01_15-05-25")
+    zip2 = store_backtest_results(config, stats, "2024-01-02_15-05-25")
+
+    extract_mock = mocker.spy(bt_fileutils, "_extract_backtest_result")
+    res = get_backtest_resultlist(tmp_path)
+    assert len(res) == 4
+    assert res[0]["filename"] == zip2.stem
+    assert (tmp_path / BT_RESULT_INDEX_FN).is_file()
+    assert extract_mock.call_count == 2
+
+    # Second call is served from the index
+    extract_mock.reset_mock()
+    assert get_backtest_resultlist(tmp_path) == res
+    assert extract_mock.call_count == 0
+
+    # Deleting a result updates the index
+    delete_backtest_result(zip1)
+    res = get_backtest_resultlist(tmp_path)
+    assert len(res) == 2
+    assert all(r["filename"] == zip2.stem for r in res)
+    assert extract_mock.call_count == 0
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize("is_short", [False, True])
 def test_load_trades_from_db(default_conf, fee, is_short, mocker):
@@ -376,6 +443,21 @@ def test_calculate_max_drawdown(testdatadir):
         calculate_underwater(DataFrame())
 
 
+def test_calculate_max_drawdowns(testdatadir):
+    filename = testdatadir / "backtest_results/backtest-result.json"
+    bt_data = load_backtest_data(filename)
+    drawdown, underwater = calculate_max_drawdowns(
+        bt_data, value_col="profit_abs", starting_balance=0.1
+    )
+    assert drawdown == calculate_max_drawdown(bt_data, value_col="profit_abs", starting_balance=0.1)
+    assert underwater == calculate_max_drawdown(
+        bt_data, value_col="profit_abs", starting_balance=0.1, relative=True
+    )
+
+    with pytest.raises(ValueError, match="Trade dataframe empty."):
+        calculate_max_drawdowns(DataFrame())
+
+
 def test_calculate_csum(testdatadir):
     filename = testdatadir / "backtest_results/backtest-result.json"
     bt_data = load_backtest_data(filename)
@@ -9,15 +9,18 @@ from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration.timerange import TimeRange
 from freqtrade.data.converter import (
+    clean_ohlcv_dataframe,
     convert_ohlcv_format,
     convert_trades_format,
     convert_trades_to_ohlcv,
+    converter,
     ohlcv_fill_up_missing_data,
     ohlcv_to_dataframe,
     reduce_dataframe_footprint,
     trades_df_remove_duplicates,
     trades_dict_to_list,
     trades_to_ohlcv,
+    trades_to_ohlcv_multi,
     trim_dataframe,
 )
 from freqtrade.data.history import (
@@ -29,7 +32,13 @@ from freqtrade.data.history import (
 from freqtrade.data.history.datahandlers import IDataHandler
 from freqtrade.enums import CandleType
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_seconds
-from tests.conftest import generate_test_data, generate_trades_history, log_has, log_has_re
+from tests.conftest import (
+    generate_test_data,
+    generate_test_data_raw,
+    generate_trades_history,
+    log_has,
+    log_has_re,
+)
 from tests.data.test_history import _clean_test_file
 
 
@@ -109,6 +118,20 @@ def test_trades_to_ohlcv_multi(timeframe, rows, days, candles, start, end, weekd
         assert df.iloc[-1, :]["date"].day_name() == weekday
 
 
+def test_trades_to_ohlcv_multi_timeframe():
+    trades_history = generate_trades_history(n_rows=20_000, days=100)
+    timeframes = ["1s", "1m", "5m", "15m", "1h", "3h", "4h", "1d", "3d", "1w", "1M", "3M", "1y"]
+    with pytest.raises(ValueError, match="Trade-list empty."):
+        trades_to_ohlcv_multi(pd.DataFrame(columns=trades_history.columns), timeframes)
+
+    res = trades_to_ohlcv_multi(trades_history, timeframes[::-1])
+    assert list(res.keys()) == timeframes
+    for timeframe in timeframes:
+        assert_frame_equal(
+            res[timeframe], trades_to_ohlcv(trades_history, timeframe), check_exact=True
+        )
+
+
 def test_ohlcv_fill_up_missing_data(testdatadir, caplog):
     data = load_pair_history(
         datadir=testdatadir, timeframe="1m", pair="UNITTEST/BTC", fill_up_missing=False
@@ -231,6 +254,50 @@ def test_ohlcv_to_dataframe_multi(timeframe):
         assert dfs.equals(df1)
 
 
+def test_clean_ohlcv_dataframe_fast_path(mocker):
+    fill_mock = mocker.spy(converter, "ohlcv_fill_up_missing_data")
+    data = generate_test_data("5m", 100)
+
+    # Sorted, unique and complete - returned as is
+    res = clean_ohlcv_dataframe(
+        data, "5m", "UNITTEST/USDT", fill_missing=True, drop_incomplete=False
+    )
+    assert fill_mock.call_count == 0
+    assert res.equals(data)
+    assert res is not data
+
+    res = clean_ohlcv_dataframe(
+        data, "5m", "UNITTEST/USDT", fill_missing=True, drop_incomplete=True
+    )
+    assert fill_mock.call_count == 0
+    assert res.equals(data.iloc[:-1])
+    # Input is not modified
+    assert len(data) == 100
+
+    # Duplicate candle - grouped
+    data_dup = pd.concat([data, data.iloc[[50]]]).reset_index(drop=True)
+    res = clean_ohlcv_dataframe(
+        data_dup, "5m", "UNITTEST/USDT", fill_missing=True, drop_incomplete=False
+    )
+    assert fill_mock.call_count == 1
+    assert_frame_equal(res, data, check_dtype=False)
+
+    # Missing candle - filled up
+    fill_mock.reset_mock()
+    data_gap = data.drop(index=50).reset_index(drop=True)
+    res = clean_ohlcv_dataframe(
+        data_gap, "5m", "UNITTEST/USDT", fill_missing=True, drop_incomplete=False
+    )
+    assert fill_mock.call_count == 1
+    assert len(res) == 100
+    assert res.iloc[50]["volume"] == 0
+
+    # Same data, as list of candles
+    ticks = generate_test_data_raw("5m", 100)
+    res = ohlcv_to_dataframe(ticks, "5m", "UNITTEST/USDT", drop_incomplete=False)
+    assert_frame_equal(res, data, check_dtype=False)
+
+
 def test_ohlcv_to_dataframe_1M():
     # Monthly ticks from 2019-09-01 to 2023-07-01
     ticks = [
@@ -588,3 +655,23 @@ def test_convert_trades_to_ohlcv(testdatadir, tmp_path, caplog):
         candle_type=CandleType.SPOT,
     )
     assert log_has(msg, caplog)
+
+    # Multiple pairs are converted in parallel
+    file1.unlink()
+    file5.unlink()
+    convert_trades_to_ohlcv(
+        [pair, "NoDatapair"],
+        timeframes=["1m", "5m"],
+        data_format_trades="jsongz",
+        datadir=tmp_path,
+        timerange=tr,
+        erase=True,
+        data_format_ohlcv="feather",
+        candle_type=CandleType.SPOT,
+    )
+    assert_frame_equal(
+        dfbak_1m, load_pair_history(datadir=tmp_path, timeframe="1m", pair=pair), check_exact=True
+    )
+    assert_frame_equal(
+        dfbak_5m, load_pair_history(datadir=tmp_path, timeframe="5m", pair=pair), check_exact=True
+    )
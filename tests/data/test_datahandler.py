@@ -433,6 +433,33 @@ def test_datahandler_trades_store(testdatadir, tmp_path, datahandler):
     assert len(trades_new) == len(trades)
 
 
+@pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet"])
+def test_datahandler_trades_writer(testdatadir, tmp_path, datahandler):
+    dh = get_datahandler(testdatadir, datahandler)
+    trades = dh.trades_load("XRP/ETH", TradingMode.SPOT)
+
+    dh1 = get_datahandler(tmp_path, datahandler)
+    file = tmp_path / f"XRP_NEW-trades.{dh1._get_file_extension()}"
+    with dh1.trades_writer("XRP/NEW", TradingMode.SPOT) as write:
+        write(trades.iloc[:100])
+        write(trades.iloc[100:])
+
+    assert file.is_file()
+    assert not file.with_name(f"{file.name}.tmp").exists()
+    trades_new = dh1.trades_load("XRP/NEW", TradingMode.SPOT)
+    assert_frame_equal(trades, trades_new, check_exact=True)
+
+    # Failures keep the existing data untouched
+    with pytest.raises(ValueError, match="Download failed"):
+        with dh1.trades_writer("XRP/NEW", TradingMode.SPOT) as write:
+            write(trades.iloc[:10])
+            raise ValueError("Download failed")
+
+    assert not file.with_name(f"{file.name}.tmp").exists()
+    trades_new = dh1.trades_load("XRP/NEW", TradingMode.SPOT)
+    assert len(trades_new) == len(trades)
+
+
 @pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet"])
 def test_datahandler_trades_purge(mocker, testdatadir, datahandler):
     mocker.patch.object(Path, "exists", MagicMock(return_value=False))
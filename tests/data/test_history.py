@@ -1,5 +1,6 @@
 # pragma pylint: disable=missing-docstring, protected-access, C0103
 
+import asyncio
 import json
 import logging
 import uuid
@@ -14,7 +15,7 @@ from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DATETIME_PRINT_FORMAT
-from freqtrade.data.converter import ohlcv_to_dataframe
+from freqtrade.data.converter import ohlcv_to_dataframe, trades_list_to_df
 from freqtrade.data.history import get_datahandler
 from freqtrade.data.history.datahandlers.jsondatahandler import JsonDataHandler, JsonGzDataHandler
 from freqtrade.data.history.history_utils import (
@@ -543,7 +544,9 @@ def test_refresh_backtest_ohlcv_data(
     mocker, default_conf, markets, caplog, testdatadir, trademode, callcount
 ):
     caplog.set_level(logging.DEBUG)
-    dl_mock = mocker.patch("freqtrade.data.history.history_utils._download_pair_history")
+    dl_mock = mocker.patch(
+        "freqtrade.data.history.history_utils._async_download_pair_history", return_value=True
+    )
     mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=markets))
 
     mocker.patch.object(Path, "exists", MagicMock(return_value=True))
@@ -571,9 +574,45 @@ def test_refresh_backtest_ohlcv_data(
         assert log_has_re(r"Downloading pair ETH/BTC, mark, interval 4h\.", caplog)
 
 
+def test_refresh_backtest_ohlcv_data_concurrent(
+    mocker, default_conf, markets, ohlcv_history, tmp_path
+):
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=markets))
+    ex = get_patched_exchange(mocker, default_conf)
+    running = 0
+    max_running = 0
+
+    async def get_historic_ohlcv_async(pair, timeframe, since_ms, candle_type, **kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return ohlcv_history
+
+    hist_mock = mocker.patch.object(
+        ex, "get_historic_ohlcv_async", side_effect=get_historic_ohlcv_async
+    )
+    pairs = ["ETH/BTC", "XRP/BTC", "LTC/BTC", "NEO/BTC", "TKN/BTC"]
+    unav_pairs = refresh_backtest_ohlcv_data(
+        exchange=ex,
+        pairs=pairs + ["NOPE/BTC"],
+        timeframes=["1m", "5m"],
+        datadir=tmp_path,
+        trading_mode="spot",
+    )
+    assert unav_pairs == ["NOPE/BTC: Pair not available on exchange."]
+    assert hist_mock.call_count == 10
+    # Downloads overlap
+    assert max_running > 1
+    for pair in pairs:
+        for tf in ("1m", "5m"):
+            assert (tmp_path / f"{pair.replace('/', '_')}-{tf}.feather").is_file()
+
+
 def test_download_data_no_markets(mocker, default_conf, caplog, testdatadir):
     dl_mock = mocker.patch(
-        "freqtrade.data.history.history_utils._download_pair_history", MagicMock()
+        "freqtrade.data.history.history_utils._async_download_pair_history", MagicMock()
     )
 
     ex = get_patched_exchange(mocker, default_conf)
@@ -698,3 +737,25 @@ def test_download_trades_history(
     assert ght_mock.call_count == 0
 
     _clean_test_file(file2)
+
+
+def test_download_trades_history_sink(trades_history, mocker, default_conf, tmp_path, caplog):
+    def ght(pair, *args, sink, **kwargs):
+        # Bulk data goes to the sink, the overlapping remainder is returned.
+        sink(trades_list_to_df(trades_history[:2], convert=False))
+        sink(trades_list_to_df(trades_history[1:4], convert=False))
+        return pair, trades_history[3:]
+
+    ght_mock = MagicMock(side_effect=ght)
+    mocker.patch(f"{EXMS}.get_historic_trades", ght_mock)
+    exchange = get_patched_exchange(mocker, default_conf)
+    data_handler = get_datahandler(tmp_path, data_format="feather")
+
+    assert _download_trades_history(
+        data_handler=data_handler, exchange=exchange, pair="ETH/BTC", trading_mode=TradingMode.SPOT
+    )
+    assert ght_mock.call_count == 1
+    assert log_has("New Amount of trades: 6", caplog)
+    trades = data_handler.trades_load("ETH/BTC", TradingMode.SPOT)
+    assert len(trades) == 6
+    assert trades["id"].tolist() == [str(t[1]) for t in trades_history]
@@ -12,7 +12,7 @@ from freqtrade.exceptions import DependencyException, InvalidOrderException, Ope
 from freqtrade.exchange.exchange_utils_timeframe import timeframe_to_seconds
 from freqtrade.persistence import Trade
 from freqtrade.util.datetime_helpers import dt_from_ts, dt_ts, dt_utc
-from tests.conftest import EXMS, get_patched_exchange
+from tests.conftest import EXMS, get_mock_coro, get_patched_exchange
 from tests.exchange.test_exchange import ccxt_exceptionhandlers
 
 
@@ -782,7 +782,7 @@ def patch_binance_vision_ohlcv(mocker, start, archive_end, api_end, timeframe):
         ]
 
     candle_mock = mocker.patch(f"{EXMS}._async_get_candle_history", return_value=candle_history)
-    api_mock = mocker.patch(f"{EXMS}.get_historic_ohlcv", side_effect=get_historic_ohlcv)
+    api_mock = mocker.patch(f"{EXMS}.get_historic_ohlcv_async", side_effect=get_historic_ohlcv)
     archive_mock = mocker.patch(
         "freqtrade.exchange.binance.download_archive_ohlcv", side_effect=download_archive_ohlcv
     )
@@ -1108,3 +1108,32 @@ async def test__async_get_trade_history_id_binance_fast(
 
     # Clean up event loop to avoid warnings
     exchange.close()
+
+
+async def test__async_get_trade_history_id_binance_fast_sink(
+    default_conf_usdt, mocker, fetch_trades_result
+):
+    default_conf_usdt["exchange"]["only_from_ccxt"] = False
+    exchange = get_patched_exchange(mocker, default_conf_usdt, exchange="binance")
+    pair = "ETH/BTC"
+    last_trade = fetch_trades_result[-1]
+    exchange._api_async.fetch_trades = get_mock_coro(fetch_trades_result[:1])
+    stream_mock = mocker.patch(
+        "freqtrade.exchange.binance.stream_archive_trades",
+        return_value=(last_trade["timestamp"], last_trade["id"]),
+    )
+    dl_mock = mocker.patch("freqtrade.exchange.binance.download_archive_trades")
+    sink = MagicMock()
+
+    ret = await exchange._async_get_trade_history(
+        pair,
+        since=fetch_trades_result[0]["timestamp"],
+        until=last_trade["timestamp"] - 1,
+        sink=sink,
+    )
+    assert ret == (pair, [])
+    assert dl_mock.call_count == 0
+    assert stream_mock.call_count == 1
+    assert stream_mock.call_args[1]["sink"] is sink
+
+    exchange.close()
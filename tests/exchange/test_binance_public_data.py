@@ -5,11 +5,13 @@ import re
 import sys
 import zipfile
 from datetime import timedelta
+from unittest.mock import MagicMock
 
 import aiohttp
 import pandas as pd
 import pytest
 
+from freqtrade.constants import DEFAULT_TRADES_COLUMNS
 from freqtrade.enums import CandleType
 from freqtrade.exchange.binance_public_data import (
     BadHttpStatus,
@@ -20,6 +22,7 @@ from freqtrade.exchange.binance_public_data import (
     download_archive_trades,
     get_daily_ohlcv,
     get_daily_trades,
+    stream_archive_trades,
 )
 from freqtrade.util.datetime_helpers import dt_ts, dt_utc
 from ft_client.test_client.test_rest_client import log_has_re
@@ -424,6 +427,75 @@ async def test_download_archive_trades_exception(mocker, caplog):
     assert log_has_re("An exception occurred during fast trades download", caplog)
 
 
+async def test_stream_archive_trades(mocker, caplog):
+    pair = "BTC/USDT"
+
+    since_ms = dt_ts(dt_utc(2020, 1, 1))
+    until_ms = dt_ts(dt_utc(2020, 1, 3))
+    markets = {"BTC/USDT": {"id": "BTCUSDT"}, "BTC/USDT:USDT": {"id": "BTCUSDT"}}
+
+    def daily_trades(ts: int, trade_id: int):
+        return pd.DataFrame(
+            [[ts, str(trade_id), None, "buy", 1.0, 2.0, 2.0]], columns=DEFAULT_TRADES_COLUMNS
+        )
+
+    mocker.patch(
+        "freqtrade.exchange.binance_public_data.get_daily_trades_df",
+        side_effect=[
+            daily_trades(since_ms, 1),
+            pd.DataFrame(columns=DEFAULT_TRADES_COLUMNS),
+            daily_trades(until_ms, 3),
+        ],
+    )
+    sink = MagicMock()
+
+    res = await stream_archive_trades(
+        CandleType.SPOT, pair, since_ms=since_ms, until_ms=until_ms, markets=markets, sink=sink
+    )
+    assert res == (until_ms, "3")
+    # Days without trades are skipped
+    assert sink.call_count == 2
+    assert sink.call_args_list[0][0][0]["id"].tolist() == ["1"]
+    assert sink.call_args_list[1][0][0]["id"].tolist() == ["3"]
+
+    # Stop on day 2, keep what was passed to the sink
+    sink.reset_mock()
+    mocker.patch(
+        "freqtrade.exchange.binance_public_data.get_daily_trades_df",
+        side_effect=[
+            daily_trades(since_ms, 1),
+            Http404("xxx", dt_utc(2020, 1, 2), "http://example.com/something"),
+            daily_trades(until_ms, 3),
+        ],
+    )
+    res = await stream_archive_trades(
+        CandleType.SPOT, pair, since_ms=since_ms, until_ms=until_ms, markets=markets, sink=sink
+    )
+    assert res == (since_ms, "1")
+    assert sink.call_count == 1
+    assert log_has_re(r"Binance fast download .*stopped", caplog)
+
+    # Nothing downloaded
+    sink.reset_mock()
+    res = await stream_archive_trades(
+        CandleType.SPOT, "XRP/USDT", since_ms=since_ms, until_ms=None, markets=markets, sink=sink
+    )
+    assert res is None
+    assert sink.call_count == 0
+    assert log_has_re("An exception occurred during fast trades download", caplog)
+
+    # Exceptions in the sink are not swallowed
+    mocker.patch(
+        "freqtrade.exchange.binance_public_data.get_daily_trades_df",
+        return_value=daily_trades(since_ms, 1),
+    )
+    sink = MagicMock(side_effect=OSError("Disk full"))
+    with pytest.raises(OSError, match="Disk full"):
+        await stream_archive_trades(
+            CandleType.SPOT, pair, since_ms=since_ms, until_ms=until_ms, markets=markets, sink=sink
+        )
+
+
 async def test_binance_vision_trades_zip_url():
     url = binance_vision_trades_zip_url("BTCUSDT", CandleType.SPOT, dt_utc(2023, 10, 27))
     assert (
@@ -1,5 +1,8 @@
+import asyncio
 import copy
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from random import randint
@@ -36,6 +39,7 @@ from freqtrade.exchange.common import (
     API_RETRY_COUNT,
     calculate_backoff,
 )
+from freqtrade.misc import file_dump_json
 from freqtrade.resolvers.exchange_resolver import ExchangeResolver
 from freqtrade.util import dt_now, dt_ts
 from tests.conftest import (
@@ -215,6 +219,41 @@ def test_destroy(default_conf, mocker, caplog):
     assert log_has("Exchange object destroyed, closing async loop", caplog)
 
 
+def test_run_async_concurrent(default_conf, mocker):
+    ex = get_patched_exchange(mocker, default_conf)
+    event = asyncio.Event()
+
+    async def wait_for_event():
+        await asyncio.wait_for(event.wait(), timeout=5)
+        return "waited"
+
+    async def set_event():
+        event.set()
+        return "set"
+
+    # Submit from a different thread - both coroutines must run at the same time.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        waiting = executor.submit(ex.run_async, wait_for_event())
+        time.sleep(0.05)
+        assert ex.run_async(set_event()) == "set"
+        assert waiting.result(timeout=5) == "waited"
+
+    loop_thread = ex._loop_thread
+    assert loop_thread is not None
+    assert loop_thread.is_alive()
+
+    async def raise_error():
+        raise ValueError("Something failed")
+
+    with pytest.raises(ValueError, match="Something failed"):
+        ex.run_async(raise_error())
+
+    ex.close()
+    assert ex._loop_thread is None
+    assert not loop_thread.is_alive()
+    assert ex.loop.is_closed()
+
+
 def test_init_exception(default_conf, mocker):
     default_conf["exchange"]["name"] = "wrong_exchange_name"
 
@@ -2594,6 +2633,71 @@ def test_refresh_latest_ohlcv_cache(mocker, default_conf, candle_type, time_mach
     assert res[pair2].at[0, "open"]
 
 
+def test_refresh_latest_ohlcv_ws_ingest_all(mocker, default_conf, time_machine, caplog) -> None:
+    start = datetime(2021, 8, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+    ohlcv = generate_test_data_raw("5m", 103, start.strftime("%Y-%m-%d"))
+    time_machine.move_to(start + timedelta(minutes=99 * 5 + 2), tick=False)
+    default_conf["exchange"]["ws_ingest_all"] = True
+
+    exchange = get_patched_exchange(mocker, default_conf)
+    mocker.patch(f"{EXMS}.ohlcv_candle_limit", return_value=100)
+    exchange._api_async.fetch_ohlcv = get_mock_coro(ohlcv[:100])
+    ws_candles = ohlcv[:101]
+
+    async def get_ohlcv(pair, timeframe, candle_type, candle_ts, since_ms):
+        return pair, timeframe, candle_type, [c for c in ws_candles if c[0] >= since_ms], True
+
+    exchange_ws = MagicMock()
+    exchange_ws.ohlcvs = MagicMock(
+        side_effect=lambda pair, timeframe, since_ms: [c for c in ws_candles if c[0] >= since_ms]
+    )
+    exchange_ws.get_ohlcv = MagicMock(side_effect=get_ohlcv)
+    exchange._exchange_ws = exchange_ws
+    pair = ("ETH/BTC", "5m", CandleType.SPOT)
+
+    # Initial load from REST api
+    res = exchange.refresh_latest_ohlcv([pair])
+    assert exchange._api_async.fetch_ohlcv.call_count == 1
+    assert len(res[pair]) == 99
+    assert exchange_ws.schedule_ohlcv.call_count == 1
+    exchange._api_async.fetch_ohlcv.reset_mock()
+
+    # Pair is kept subscribed, even if no refresh is necessary
+    res = exchange.refresh_latest_ohlcv([pair])
+    assert exchange._api_async.fetch_ohlcv.call_count == 0
+    assert exchange_ws.schedule_ohlcv.call_count == 2
+
+    # New candle - only the new candles are copied from the websocket cache
+    time_machine.move_to(start + timedelta(minutes=100 * 5, seconds=1), tick=False)
+    exchange_ws.klines_last_refresh = {pair: dt_ts()}
+    res = exchange.refresh_latest_ohlcv([pair])
+    assert exchange._api_async.fetch_ohlcv.call_count == 0
+    exchange_ws.ohlcvs.assert_called_once_with("ETH/BTC", "5m", ohlcv[98][0])
+    assert exchange_ws.get_ohlcv.call_args[0][4] == ohlcv[98][0]
+    assert len(res[pair]) == 100
+    assert res[pair].iloc[-1]["date"] == to_datetime(ohlcv[99][0], unit="ms", utc=True)
+
+    # Websocket data doesn't connect to the cached candles - fall back to REST api
+    ws_candles = ohlcv[101:103]
+    exchange._api_async.fetch_ohlcv = get_mock_coro(ohlcv[3:103])
+    time_machine.move_to(start + timedelta(minutes=102 * 5, seconds=1), tick=False)
+    exchange_ws.klines_last_refresh = {pair: dt_ts()}
+    res = exchange.refresh_latest_ohlcv([pair])
+    assert log_has_re(r"Gap between cached and websocket candles for ETH/BTC, 5m.*", caplog)
+    assert exchange._api_async.fetch_ohlcv.call_count == 1
+    assert res[pair].iloc[-1]["date"] == to_datetime(ohlcv[101][0], unit="ms", utc=True)
+    exchange._api_async.fetch_ohlcv.reset_mock()
+
+    # Periodic reconciliation via REST api
+    caplog.clear()
+    caplog.set_level(logging.DEBUG)
+    time_machine.move_to(start + timedelta(minutes=102 * 5 + 61), tick=False)
+    exchange_ws.klines_last_refresh = {pair: dt_ts()}
+    exchange.refresh_latest_ohlcv([pair])
+    assert log_has_re(r"Reconciling websocket candles for .*", caplog)
+    assert exchange._api_async.fetch_ohlcv.call_count == 1
+
+
 def test_refresh_ohlcv_with_cache(mocker, default_conf, time_machine) -> None:
     start = datetime(2021, 8, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
     ohlcv = generate_test_data_raw("1h", 100, start.strftime("%Y-%m-%d"))
@@ -5794,6 +5898,51 @@ def test_load_leverage_tiers(mocker, default_conf, exchange_name):
     )
 
 
+def test_cached_leverage_tiers(mocker, default_conf, tmp_path, caplog, time_machine):
+    start_dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    time_machine.move_to(start_dt, tick=False)
+    default_conf["datadir"] = tmp_path
+    exchange = get_patched_exchange(mocker, default_conf)
+    tiers_btc = [{"minNotional": 0, "maxNotional": 100, "maxLeverage": 10}]
+    tiers_eth = [{"minNotional": 0, "maxNotional": 50, "maxLeverage": 20}]
+
+    assert exchange.load_cached_leverage_tiers("USDT") is None
+    exchange.cache_leverage_tiers({"BTC/USDT:USDT": tiers_btc}, "USDT")
+    filename = tmp_path / "futures" / "leverage_tiers_USDT.json"
+    assert filename.is_file()
+
+    # ETH is added 3 weeks later - BTC keeps its initial update time
+    time_machine.move_to(start_dt + timedelta(weeks=3), tick=False)
+    tiers = exchange.load_cached_leverage_tiers("USDT")
+    assert tiers == {"BTC/USDT:USDT": tiers_btc}
+    tiers["ETH/USDT:USDT"] = tiers_eth
+    exchange.cache_leverage_tiers(tiers, "USDT")
+
+    time_machine.move_to(start_dt + timedelta(weeks=5), tick=False)
+    # Only BTC is outdated
+    assert exchange.load_cached_leverage_tiers("USDT") == {"ETH/USDT:USDT": tiers_eth}
+    assert log_has("Cached leverage tiers are outdated. Will update.", caplog)
+
+    time_machine.move_to(start_dt + timedelta(weeks=8), tick=False)
+    assert exchange.load_cached_leverage_tiers("USDT") is None
+
+    # Files without per-symbol update time (version 1)
+    caplog.clear()
+    file_dump_json(filename, {"updated": start_dt, "data": {"BTC/USDT:USDT": tiers_btc}})
+    assert exchange.load_cached_leverage_tiers("USDT", timedelta(weeks=10)) == {
+        "BTC/USDT:USDT": tiers_btc
+    }
+    assert exchange.load_cached_leverage_tiers("USDT") is None
+    assert log_has("Cached leverage tiers are outdated. Will update.", caplog)
+
+    # Unknown (newer) versions are ignored
+    file_dump_json(
+        filename, {"version": 99, "updated": start_dt, "data": {"BTC/USDT:USDT": tiers_btc}}
+    )
+    assert exchange.load_cached_leverage_tiers("USDT", timedelta(weeks=10)) is None
+    assert log_has("Cached leverage tiers use an unknown format. Will update.", caplog)
+
+
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 async def test_get_market_leverage_tiers(mocker, default_conf, exchange_name):
     default_conf["exchange"]["name"] = exchange_name
@@ -5,7 +5,7 @@ from datetime import timedelta
 from time import sleep
 from unittest.mock import AsyncMock, MagicMock
 
-from ccxt import NotSupported
+from ccxt import ExchangeClosedByUser, NotSupported
 
 from freqtrade.enums import CandleType
 from freqtrade.exchange.exchange_ws import ExchangeWS
@@ -197,3 +197,65 @@ async def test_exchangews_get_ohlcv(mocker, caplog):
     assert log_has_re(msg, caplog)
 
     exchange_ws.cleanup()
+
+
+def test_exchangews_ohlcvs_since(mocker):
+    config = MagicMock()
+    ccxt_object = MagicMock()
+    candles = [
+        [1635840000000, 100, 200, 300, 400, 500],
+        [1635840060000, 101, 201, 301, 401, 501],
+        [1635840120000, 102, 202, 302, 402, 502],
+    ]
+    ccxt_object.ohlcvs = {"ETH/USDT": {"1m": candles}}
+    mocker.patch("freqtrade.exchange.exchange_ws.ExchangeWS._start_forever", MagicMock())
+
+    exchange_ws = ExchangeWS(config, ccxt_object)
+    res = exchange_ws.ohlcvs("ETH/USDT", "1m")
+    assert res == candles
+    assert res[0] is not candles[0]
+
+    assert exchange_ws.ohlcvs("ETH/USDT", "1m", 1635840060000) == candles[1:]
+    assert exchange_ws.ohlcvs("ETH/USDT", "1m", 1635840180000) == []
+    assert exchange_ws.ohlcvs("ETH/USDT", "5m", 1635840060000) == []
+
+    exchange_ws.cleanup()
+
+
+async def test_exchangews_candle_close_callback(mocker, caplog):
+    config = MagicMock()
+    ccxt_object = MagicMock()
+    ccxt_object.watch_ohlcv = AsyncMock(
+        side_effect=[
+            [[1635840000000, 100, 200, 300, 400, 500]],
+            [[1635840000000, 100, 200, 300, 400, 501]],
+            [[1635840060000, 101, 201, 301, 401, 10]],
+            [[1635840060000, 101, 201, 301, 401, 11]],
+            ExchangeClosedByUser(),
+        ]
+    )
+    mocker.patch("freqtrade.exchange.exchange_ws.ExchangeWS._start_forever", MagicMock())
+
+    exchange_ws = ExchangeWS(config, ccxt_object)
+    callback = MagicMock()
+    exchange_ws.candle_close_callback = callback
+    exchange_ws._klines_watching.add(("ETH/USDT", "1m", CandleType.SPOT))
+
+    await exchange_ws._continuously_async_watch_ohlcv("ETH/USDT", "1m", CandleType.SPOT)
+    assert ccxt_object.watch_ohlcv.call_count == 5
+    callback.assert_called_once_with("ETH/USDT", "1m", CandleType.SPOT)
+
+    # Exceptions in the callback don't stop the watch loop
+    ccxt_object.watch_ohlcv.reset_mock(side_effect=True)
+    ccxt_object.watch_ohlcv.side_effect = [
+        [[1635840000000, 100, 200, 300, 400, 500]],
+        [[1635840060000, 101, 201, 301, 401, 10]],
+        ExchangeClosedByUser(),
+    ]
+    exchange_ws.candle_close_callback = MagicMock(side_effect=ValueError("Test"))
+    exchange_ws._klines_watching.add(("ETH/USDT", "1m", CandleType.SPOT))
+    await exchange_ws._continuously_async_watch_ohlcv("ETH/USDT", "1m", CandleType.SPOT)
+    assert ccxt_object.watch_ohlcv.call_count == 3
+    assert log_has_re("Exception in candle close callback for ETH/USDT, 1m", caplog)
+
+    exchange_ws.cleanup()
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from freqtrade.exchange.funding_fees import FundingFeeIndex
+from tests.conftest import get_patched_exchange
+
+
+def _funding_df(rows: int, start: datetime) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "date": pd.date_range(start, periods=rows, freq="8h", tz="UTC"),
+            "open_fund": rng.normal(0, 0.0001, rows),
+            "open_mark": rng.uniform(1.5, 3.0, rows),
+        }
+    )
+
+
+def test_funding_fee_index(default_conf, mocker):
+    exchange = get_patched_exchange(mocker, default_conf)
+    start = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    df = _funding_df(200, start)
+    index = FundingFeeIndex(df)
+    assert len(index) == 200
+
+    periods = [
+        (start, start),
+        (start - timedelta(days=1), start + timedelta(hours=7, minutes=59)),
+        (start + timedelta(hours=8), start + timedelta(days=10)),
+        (start + timedelta(hours=3), start + timedelta(days=30, seconds=1)),
+        (start + timedelta(days=10), start + timedelta(days=1000)),
+        (start + timedelta(days=100), start + timedelta(days=101)),
+        (start + timedelta(days=5), start + timedelta(days=4)),
+    ]
+    for open_date, close_date in periods:
+        for is_short in (True, False):
+            expected = exchange.calculate_funding_fees(
+                df, amount=30, is_short=is_short, open_date=open_date, close_date=close_date
+            )
+            result = exchange.calculate_funding_fees(
+                index, amount=30, is_short=is_short, open_date=open_date, close_date=close_date
+            )
+            assert pytest.approx(result, abs=1e-15) == expected
+
+    # Missing rates are ignored, as in the dataframe based calculation
+    df.loc[10, "open_mark"] = np.nan
+    index = FundingFeeIndex(df)
+    for open_date, close_date in periods:
+        expected = exchange.calculate_funding_fees(
+            df, amount=30, is_short=True, open_date=open_date, close_date=close_date
+        )
+        result = exchange.calculate_funding_fees(
+            index, amount=30, is_short=True, open_date=open_date, close_date=close_date
+        )
+        assert pytest.approx(result, abs=1e-15) == expected
+    assert np.isnan(index.funding_between(start, start + timedelta(days=4)))
+
+
+def test_funding_fee_index_empty():
+    index = FundingFeeIndex(pd.DataFrame(columns=["date", "open_fund", "open_mark"]))
+    assert len(index) == 0
+    now = datetime.now(timezone.utc)
+    assert index.funding_between(now - timedelta(days=1), now) == 0.0
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from freqtrade.enums import CandleType
+from freqtrade.exchange.kline_cache import KlineCache, OHLCVBuffer
+from tests.conftest import generate_test_data
+
+
+KEY = ("ETH/USDT", "5m", CandleType.SPOT)
+
+
+def test_ohlcv_buffer_append():
+    data = generate_test_data("5m", 150)
+    buffer = OHLCVBuffer(data.iloc[:100], capacity=100)
+    assert len(buffer) == 100
+    df1 = buffer.to_dataframe()
+    assert_frame_equal(df1, data.iloc[:100].reset_index(drop=True))
+
+    # Overlapping, unchanged candles are skipped
+    assert buffer.append(data.iloc[95:110], "5m")
+    assert len(buffer) == 100
+    df2 = buffer.to_dataframe()
+    assert_frame_equal(df2, data.iloc[10:110].reset_index(drop=True))
+    # Previous result did not change
+    assert_frame_equal(df1, data.iloc[:100].reset_index(drop=True))
+
+    # Fill up headroom several times
+    for i in range(110, 150, 5):
+        assert buffer.append(data.iloc[i : i + 5], "5m")
+    assert_frame_equal(buffer.to_dataframe(), data.iloc[50:150].reset_index(drop=True))
+    assert len(buffer._dates) <= 100 + buffer._headroom + 5
+    assert_frame_equal(df2, data.iloc[10:110].reset_index(drop=True))
+
+
+def test_ohlcv_buffer_append_changed_candle():
+    data = generate_test_data("5m", 110)
+    buffer = OHLCVBuffer(data.iloc[:100], capacity=100)
+    df1 = buffer.to_dataframe()
+    new = data.iloc[99:101].copy()
+    new.loc[99, "close"] = 55.0
+
+    assert buffer.append(new, "5m")
+    df2 = buffer.to_dataframe()
+    assert len(df2) == 100
+    assert df2.iloc[-2]["close"] == 55.0
+    assert df2.iloc[-1]["date"] == data.iloc[100]["date"]
+    # Previous result did not change
+    assert df1.iloc[-1]["close"] == data.iloc[99]["close"]
+
+
+def test_ohlcv_buffer_append_invalid():
+    data = generate_test_data("5m", 200)
+    buffer = OHLCVBuffer(data.iloc[50:100], capacity=100)
+    assert buffer.append(data.iloc[:0], "5m")
+    # Hole in the data
+    assert not buffer.append(data.iloc[101:110], "5m")
+    # Data before buffer start
+    assert not buffer.append(data.iloc[40:120], "5m")
+    # Older data
+    assert not buffer.append(data.iloc[60:70], "5m")
+    assert len(buffer) == 50
+
+
+def test_kline_cache():
+    data = generate_test_data("5m", 200)
+    cache = KlineCache()
+    assert not cache
+
+    df = data.iloc[:100]
+    cache[KEY] = df
+    assert cache[KEY] is df
+    assert KEY in cache
+    assert list(cache.keys()) == [KEY]
+
+    res = cache.update_candles(KEY, data.iloc[98:120].reset_index(drop=True), capacity=100)
+    assert res is cache[KEY]
+    assert len(res) == 100
+    assert res.iloc[-1]["date"] == data.iloc[119]["date"]
+    assert np.shares_memory(res["close"].to_numpy(), cache._buffers[KEY]._values)
+
+    # Hole in the data - filled up
+    res = cache.update_candles(KEY, data.iloc[125:130].reset_index(drop=True), capacity=100)
+    assert len(res) == 100
+    assert res.iloc[-1]["date"] == data.iloc[129]["date"]
+    assert (res["date"].diff().iloc[1:] == pd.Timedelta(minutes=5)).all()
+    assert res.iloc[-7]["volume"] == 0
+
+    # New key
+    key2 = ("XRP/USDT", "5m", CandleType.SPOT)
+    df2 = data.iloc[:10]
+    assert cache.update_candles(key2, df2, capacity=100) is df2
+    assert len(cache) == 2
+
+    del cache[KEY]
+    assert KEY not in cache
+    assert KEY not in cache._buffers
@@ -0,0 +1,66 @@
+import pytest
+
+from freqtrade.exchange.leverage_tiers import LeverageTierIndex
+
+
+def _linear_max_leverage(tiers, stake_amount):
+    if stake_amount == 0:
+        return tiers[0]["maxLeverage"]
+    prior_max_lev = None
+    for tier in tiers:
+        min_stake = tier["minNotional"] / (prior_max_lev or tier["maxLeverage"])
+        max_stake = tier["maxNotional"] / tier["maxLeverage"]
+        prior_max_lev = tier["maxLeverage"]
+        if min_stake <= stake_amount <= max_stake:
+            return tier["maxLeverage"]
+    return None
+
+
+def _linear_max_notional(tiers, leverage):
+    for tier in reversed(tiers):
+        if leverage <= tier["maxLeverage"]:
+            return tier["maxNotional"]
+    return None
+
+
+def _linear_maintenance_tier(tiers, notional_value):
+    for tier in reversed(tiers):
+        if notional_value >= tier["minNotional"]:
+            return tier
+    return None
+
+
+@pytest.mark.parametrize("pair", ["BTC/USDT:USDT", "XRP/USDT:USDT", "BNB/USDT:USDT"])
+def test_leverage_tier_index(leverage_tiers, pair):
+    tiers = leverage_tiers[pair]
+    index = LeverageTierIndex(tiers)
+    assert index.tiers is tiers
+    assert index.max_stake() == tiers[-1]["maxNotional"] / tiers[-1]["maxLeverage"]
+
+    boundaries = [0.0, 0.5, 1.0, 99999.9, 1500, 170.3, 300000000, 600000000, 1000000000.01]
+    for tier in tiers:
+        boundaries.extend([tier["minNotional"], tier["maxNotional"]])
+        boundaries.extend([tier["maxNotional"] / tier["maxLeverage"], tier["maxLeverage"]])
+
+    for value in boundaries:
+        for candidate in (value - 0.01, value, value + 0.01):
+            if candidate < 0:
+                continue
+            assert index.max_leverage(candidate) == _linear_max_leverage(tiers, candidate)
+            assert index.max_notional(candidate) == _linear_max_notional(tiers, candidate)
+            assert index.maintenance_tier(candidate) == _linear_maintenance_tier(tiers, candidate)
+
+    assert index.maintenance_tier(-1) is None
+
+
+def test_leverage_tier_index_unsorted():
+    tiers = [
+        {"minNotional": 0, "maxNotional": 1000, "maxLeverage": 10},
+        {"minNotional": 500, "maxNotional": 500, "maxLeverage": 20},
+        {"minNotional": 200, "maxNotional": 5000, "maxLeverage": 5},
+    ]
+    index = LeverageTierIndex(tiers)
+    for value in (0, 10, 25, 50, 100, 200, 500, 600, 1000, 2000, 5000, 6000):
+        assert index.max_leverage(value) == _linear_max_leverage(tiers, value)
+        assert index.max_notional(value) == _linear_max_notional(tiers, value)
+        assert index.maintenance_tier(value) == _linear_maintenance_tier(tiers, value)
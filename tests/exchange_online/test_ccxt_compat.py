@@ -279,7 +279,7 @@ class TestCCXTExchange:
             since = now - timedelta(days=offset)
             since_ms = int(since.timestamp() * 1000)
 
-            res = exchange.loop.run_until_complete(
+            res = exchange.run_async(
                 exchange._async_get_candle_history(
                     pair=pair, timeframe=timeframe, since_ms=since_ms, candle_type=candle_type
                 )
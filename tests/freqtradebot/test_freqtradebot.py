@@ -132,6 +132,25 @@ def test_bot_cleanup_db_errors(mocker, default_conf_usdt, caplog) -> None:
     assert freqtrade.emc.shutdown.call_count == 1
 
 
+def test_wakeup_on_candle_close(mocker, default_conf_usdt, caplog) -> None:
+    default_conf_usdt["internals"] = {"wakeup_on_candle_close": True}
+    set_cb = mocker.patch(f"{EXMS}.set_candle_close_callback", return_value=False)
+    freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
+    assert set_cb.call_count == 1
+    assert log_has_re(r"`internals.wakeup_on_candle_close` requires websocket.*", caplog)
+
+    pair = freqtrade.active_pair_whitelist[0]
+    timeframe = freqtrade.strategy.timeframe
+    assert not freqtrade.wakeup_event.is_set()
+    # Other timeframe or pair - no wakeup
+    freqtrade._candle_closed(pair, "1d", CandleType.SPOT)
+    freqtrade._candle_closed("NOPE/USDT", timeframe, CandleType.SPOT)
+    assert not freqtrade.wakeup_event.is_set()
+
+    freqtrade._candle_closed(pair, timeframe, CandleType.SPOT)
+    assert freqtrade.wakeup_event.is_set()
+
+
 @pytest.mark.parametrize("runmode", [RunMode.DRY_RUN, RunMode.LIVE])
 def test_order_dict(default_conf_usdt, mocker, runmode, caplog) -> None:
     patch_RPCManager(mocker)
@@ -200,6 +200,19 @@ def test_throttle_sleep_time(mocker, default_conf, caplog) -> None:
         assert 11.1 < sleep_mock.call_args[0][0] < 13.2
 
 
+def test_throttle_wakeup(mocker, default_conf) -> None:
+    def throttled_func():
+        worker.freqtrade.wakeup_event.set()
+        return 42
+
+    worker = get_patched_worker(mocker, default_conf)
+
+    start = time.time()
+    assert worker._throttle(throttled_func, throttle_secs=5) == 42
+    assert time.time() - start < 1
+    assert not worker.freqtrade.wakeup_event.is_set()
+
+
 def test_throttle_with_assets(mocker, default_conf) -> None:
     def throttled_func(nb_assets=-1):
         return nb_assets
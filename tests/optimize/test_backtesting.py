@@ -2,6 +2,7 @@
 
 import random
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -23,8 +24,10 @@ from freqtrade.enums import CandleType, ExitType, RunMode
 from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import timeframe_to_next_date, timeframe_to_prev_date
 from freqtrade.exchange.exchange_utils import DECIMAL_PLACES, TICK_SIZE
+from freqtrade.optimize import strategy_workers
 from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename, get_strategy_run_id
 from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.exit_candidates import exit_candidates_supported
 from freqtrade.persistence import LocalTrade, Trade
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.util.datetime_helpers import dt_utc
@@ -372,6 +375,29 @@ def test_get_pair_precision_bt(default_conf, mocker) -> None:
     assert ex_mock.call_count == 2
 
 
+def test_load_bt_data_preloaded(default_conf, mocker) -> None:
+    patch_exchange(mocker)
+    default_conf["timeframe"] = "5m"
+    default_conf["timerange"] = "20180110-20180112"
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    data, _ = backtesting.load_bt_data()
+
+    default_conf["timerange"] = "20180110-20180111"
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    data_disk, _ = backtesting.load_bt_data()
+    data_sliced, _ = backtesting.load_bt_data(data)
+
+    assert data_sliced.keys() == data_disk.keys()
+    for pair, df in data_disk.items():
+        assert len(df) < len(data[pair])
+        assert df.equals(data_sliced[pair])
+
+    with pytest.raises(OperationalException, match=r"No data found. Terminating\."):
+        backtesting.load_bt_data({})
+
+
 def test_backtest_abort(default_conf, mocker, testdatadir) -> None:
     patch_exchange(mocker)
     backtesting = Backtesting(default_conf)
@@ -1478,6 +1504,28 @@ def test_backtest_alternate_buy_sell(default_conf, fee, mocker, testdatadir):
     assert len(results.loc[results["is_open"]]) == 0
 
 
+def test_get_ohlcv_as_lists_analyze_workers(default_conf, mocker, testdatadir):
+    default_conf["timeframe"] = "5m"
+    patch_exchange(mocker)
+    pairs = ["ADA/BTC", "DASH/BTC", "ETH/BTC", "LTC/BTC", "NXT/BTC"]
+    data = trim_dictlist(history.load_data(datadir=testdatadir, timeframe="5m", pairs=pairs), -500)
+
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    with backtesting.analyze_executor() as executor:
+        assert executor is None
+    processed = backtesting.strategy.advise_all_indicators(data)
+    expected = backtesting._get_ohlcv_as_lists(deepcopy(processed))
+
+    backtesting.analyze_workers = 3
+    with backtesting.analyze_executor() as executor:
+        assert executor is not None
+        processed_threaded = backtesting.strategy.advise_all_indicators(data, executor=executor)
+    result = backtesting._get_ohlcv_as_lists(processed_threaded)
+    assert list(result.keys()) == pairs
+    assert result == expected
+
+
 @pytest.mark.parametrize("pair", ["ADA/BTC", "LTC/BTC"])
 @pytest.mark.parametrize("tres", [0, 20, 30])
 def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir):
@@ -2668,6 +2716,104 @@ def test_backtest_start_multi_strat_caching(
         assert log_has(line, caplog)
 
 
+def test_backtest_start_multi_strat_workers(default_conf, mocker, caplog, testdatadir):
+    patch_exchange(mocker)
+    mocker.patch("freqtrade.optimize.backtesting.show_backtest_results", MagicMock())
+    # Worker processes can't use the mocked exchange - run workers in this process.
+    mocker.patch(
+        "freqtrade.optimize.strategy_workers.ProcessPoolExecutor",
+        lambda max_workers, mp_context, initializer: ThreadPoolExecutor(max_workers=1),
+    )
+    default_conf.update(
+        {
+            "datadir": testdatadir,
+            "timeframe": "5m",
+            "timerange": "20180110-20180112",
+            "export": "none",
+            "backtest_cache": "none",
+            "tradable_balance_ratio": 1.0,
+            "amend_last_stake_amount": False,
+            "strategy_list": [CURRENT_TEST_STRATEGY, "StrategyTestV2"],
+        }
+    )
+    sequential = Backtesting(deepcopy(default_conf))
+    sequential.start()
+
+    default_conf["strategy_workers"] = 2
+    backtesting = Backtesting(deepcopy(default_conf))
+    backtesting.start()
+    assert log_has("Backtesting 2 strategies in 2 processes.", caplog)
+
+    assert list(backtesting.results["strategy"]) == [CURRENT_TEST_STRATEGY, "StrategyTestV2"]
+    for strategy_name in default_conf["strategy_list"]:
+        pd.testing.assert_frame_equal(
+            backtesting.all_bt_content[strategy_name]["results"],
+            sequential.all_bt_content[strategy_name]["results"],
+        )
+        assert (
+            backtesting.all_bt_content[strategy_name]["run_id"]
+            == sequential.all_bt_content[strategy_name]["run_id"]
+        )
+    assert backtesting.results["strategy_comparison"] == sequential.results["strategy_comparison"]
+    Backtesting.cleanup()
+
+
+def _init_offline_worker() -> None:
+    """
+    Worker process initializer - mocks of the test process are not available in worker
+    processes, so the exchange is patched again.
+    """
+    from unittest import mock
+
+    from freqtrade.optimize.strategy_workers import _init_worker
+
+    class _Patcher:
+        @staticmethod
+        def patch(target, *args, **kwargs):
+            return mock.patch(target, *args, **kwargs).start()
+
+    _init_worker()
+    patch_exchange(_Patcher)
+
+
+def test_backtest_start_multi_strat_processes(default_conf, mocker, caplog, testdatadir):
+    patch_exchange(mocker)
+    mocker.patch("freqtrade.optimize.backtesting.show_backtest_results", MagicMock())
+    mocker.patch("freqtrade.optimize.strategy_workers._init_worker", _init_offline_worker)
+    load_mock = mocker.spy(strategy_workers, "load")
+    default_conf.update(
+        {
+            "datadir": testdatadir,
+            "timeframe": "5m",
+            "timerange": "20180110-20180111",
+            "export": "none",
+            "backtest_cache": "none",
+            "tradable_balance_ratio": 1.0,
+            "amend_last_stake_amount": False,
+            "strategy_list": [CURRENT_TEST_STRATEGY, "StrategyTestV2"],
+        }
+    )
+    sequential = Backtesting(deepcopy(default_conf))
+    sequential.start()
+    assert sequential.all_bt_content[CURRENT_TEST_STRATEGY]["results"].shape[0] > 0
+
+    default_conf["strategy_workers"] = 2
+    backtesting = Backtesting(deepcopy(default_conf))
+    backtesting.start()
+    assert log_has("Backtesting 2 strategies in 2 processes.", caplog)
+    # Candles are loaded in the worker processes only
+    assert load_mock.call_count == 0
+
+    assert list(backtesting.results["strategy"]) == [CURRENT_TEST_STRATEGY, "StrategyTestV2"]
+    for strategy_name in default_conf["strategy_list"]:
+        pd.testing.assert_frame_equal(
+            backtesting.all_bt_content[strategy_name]["results"],
+            sequential.all_bt_content[strategy_name]["results"],
+        )
+    assert backtesting.results["strategy_comparison"] == sequential.results["strategy_comparison"]
+    Backtesting.cleanup()
+
+
 def test_get_strategy_run_id(default_conf_usdt):
     default_conf_usdt.update({"strategy": "StrategyTestV2", "max_open_trades": float("inf")})
     strategy = StrategyResolver.load_strategy(default_conf_usdt)
@@ -2715,3 +2861,68 @@ def test_get_backtest_metadata_filename():
     filename = "backtest_results_zip.zip"
     expected = Path("backtest_results_zip.meta.json")
     assert get_backtest_metadata_filename(filename) == expected
+
+
+@pytest.mark.parametrize(
+    "use_exit_signal,stoploss,minimal_roi",
+    [
+        (True, -0.10, {"0": 0.04, "20": 0.02, "30": 0.01, "40": 0.0}),
+        (False, -0.01, {"0": 0.04, "20": 0.02, "30": 0.01, "40": 0.0}),
+        (False, -0.99, {"0": 10, "300": 0.005}),
+        (True, -0.05, {"0": -1}),
+    ],
+)
+def test_backtest_exit_candidates(
+    default_conf, fee, mocker, testdatadir, use_exit_signal, stoploss, minimal_roi
+) -> None:
+    default_conf.update(
+        {
+            "use_exit_signal": use_exit_signal,
+            "stoploss": stoploss,
+            "minimal_roi": minimal_roi,
+            "max_open_trades": 3,
+        }
+    )
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert backtesting._exit_candidates_enabled()
+
+    pairs = ["ADA/BTC", "DASH/BTC", "ETH/BTC", "LTC/BTC", "NXT/BTC"]
+    data = history.load_data(datadir=testdatadir, timeframe="5m", pairs=pairs)
+    data = trim_dictlist(data, -1000)
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+    exit_spy = mocker.spy(backtesting, "_check_trade_exit")
+
+    result = backtesting.backtest(deepcopy(processed), min_date, max_date)
+    skipped_calls = exit_spy.call_count
+    assert backtesting._exit_candidates is not None
+
+    # Same results when checking exits on every candle
+    mocker.patch.object(backtesting, "_exit_candidates_enabled", return_value=False)
+    exit_spy.reset_mock()
+    expected = backtesting.backtest(deepcopy(processed), min_date, max_date)
+    assert backtesting._exit_candidates is None
+
+    assert len(result["results"]) > 0
+    pd.testing.assert_frame_equal(result["results"], expected["results"])
+    assert skipped_calls <= exit_spy.call_count
+    if minimal_roi != {"0": -1}:
+        assert skipped_calls < exit_spy.call_count
+
+
+def test_exit_candidates_supported(default_conf) -> None:
+    strategy = StrategyResolver.load_strategy(default_conf)
+    assert exit_candidates_supported(strategy)
+
+    strategy.trailing_stop = True
+    assert not exit_candidates_supported(strategy)
+    strategy.trailing_stop = False
+
+    # Callbacks overridden on the instance
+    strategy.custom_exit = MagicMock(return_value=None)
+    assert not exit_candidates_supported(strategy)
@@ -641,14 +641,37 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
         "params_not_optimized": {"buy": {}, "protection": {}, "sell": {}},
         "results_metrics": ANY,
         "total_profit": 3.1e-08,
+        "backtest_content": backtest_result,
     }
 
     hyperopt = Hyperopt(hyperopt_conf)
     hyperopt.hyperopter.min_date = dt_utc(2017, 12, 10)
     hyperopt.hyperopter.max_date = dt_utc(2017, 12, 13)
     hyperopt.hyperopter.init_spaces()
+    assert not hyperopt.hyperopter.full_stats_per_epoch
     generate_optimizer_value = hyperopt.hyperopter.generate_optimizer(optimizer_param)
     assert generate_optimizer_value == response_expected
+    # Lightweight metrics only
+    assert "results_per_pair" not in generate_optimizer_value["results_metrics"]
+    assert generate_optimizer_value["results_metrics"]["total_trades"] == 4
+
+    # Non-best epochs keep the lightweight metrics
+    non_best = hyperopt.hyperopter.generate_optimizer(optimizer_param)
+    hyperopt.hyperopter.complete_epoch(non_best, full_stats=False)
+    assert "backtest_content" not in non_best
+    assert "trades" not in non_best["results_metrics"]
+    assert non_best["results_metrics"]["strategy_name"] == "HyperoptableStrategy"
+
+    hyperopt.hyperopter.complete_epoch(generate_optimizer_value, full_stats=True)
+    assert "backtest_content" not in generate_optimizer_value
+    assert "results_per_pair" in generate_optimizer_value["results_metrics"]
+    assert generate_optimizer_value["results_metrics"]["total_trades"] == 4
+
+    # Loss functions without declared metrics get full stats for every epoch
+    hyperopt.hyperopter.full_stats_per_epoch = True
+    generate_optimizer_value = hyperopt.hyperopter.generate_optimizer(optimizer_param)
+    assert "backtest_content" not in generate_optimizer_value
+    assert "results_per_pair" in generate_optimizer_value["results_metrics"]
 
 
 def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
@@ -662,7 +685,7 @@ def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
     unlinkmock = mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Path.unlink", MagicMock())
     h = Hyperopt(hyperopt_conf)
 
-    assert unlinkmock.call_count == 2
+    assert unlinkmock.call_count == 3
     assert log_has(f"Removing `{h.data_pickle_file}`.", caplog)
 
 
@@ -40,17 +40,113 @@ def test_save_results_saves_epochs(hyperopt, tmp_path, caplog) -> None:
     assert len(hyperopt_epochs) == 2
     assert hyperopt_epochs[1] == 2
     assert len(hyperopt_epochs[0]) == 2
+    assert hyperopt_epochs[0][0] == epochs[0]
 
-    result_gen = HyperoptTools._read_results(hyperopt.results_file, 1)
-    epoch = next(result_gen)
-    assert len(epoch) == 1
-    assert epoch[0] == epochs[0]
-    epoch = next(result_gen)
-    assert len(epoch) == 1
-    epoch = next(result_gen)
-    assert len(epoch) == 0
-    with pytest.raises(StopIteration):
-        next(result_gen)
+
+def test_results_index(hyperopt, tmp_path, caplog) -> None:
+    hyperopt.results_file = tmp_path / "ut_results.fthypt"
+    index_file = HyperoptTools.get_index_filename(hyperopt.results_file)
+    assert index_file == tmp_path / "ut_results.fthypt.idx"
+
+    epochs = [
+        {
+            "loss": 10 - i,
+            "current_epoch": i + 1,
+            "is_best": i % 2 == 0,
+            "params_dict": {"buy_rsi": i},
+            "results_metrics": {"total_trades": i, "profit_total": 0.01 * i, "wins": 1},
+        }
+        for i in range(5)
+    ]
+    for epoch in epochs:
+        hyperopt._save_result(epoch)
+    assert index_file.is_file()
+
+    index = HyperoptTools._read_results_index(hyperopt.results_file)
+    assert len(index) == 5
+    assert index[0]["offset"] == 0
+    assert index[1]["offset"] == index[0]["length"]
+    assert index[2]["results_metrics"] == {"total_trades": 2, "profit_total": 0.02, "wins": 1}
+    assert "params_dict" not in index[2]
+
+    loaded = HyperoptTools.load_epochs(hyperopt.results_file, [index[3], index[1]])
+    assert loaded[0]["params_dict"] == {"buy_rsi": 3}
+    assert loaded[1]["params_dict"] == {"buy_rsi": 1}
+
+    res, total = HyperoptTools.load_filtered_results(
+        hyperopt.results_file, {"hyperopt_list_best": True}, metrics_only=True
+    )
+    assert total == 5
+    assert [e["current_epoch"] for e in res] == [1, 3, 5]
+    assert "params_dict" not in res[0]
+    res, _ = HyperoptTools.load_filtered_results(
+        hyperopt.results_file, {"hyperopt_list_min_trades": 2}
+    )
+    assert [e["params_dict"] for e in res] == [{"buy_rsi": 3}, {"buy_rsi": 4}]
+
+    # Missing index is rebuilt from the results file
+    index_file.unlink()
+    assert HyperoptTools._read_results_index(hyperopt.results_file) == index
+    assert index_file.is_file()
+
+    # Index lagging behind (e.g. interrupted write) is caught up
+    lines = index_file.read_bytes().splitlines(keepends=True)
+    index_file.write_bytes(b"".join(lines[:3]) + lines[3][:10])
+    assert HyperoptTools._read_results_index(hyperopt.results_file) == index
+    assert index_file.read_bytes().splitlines(keepends=True) == lines
+
+    # Incomplete trailing epoch is ignored
+    with hyperopt.results_file.open("ab") as f:
+        f.write(b'{"loss": 1')
+    assert len(HyperoptTools._read_results_index(hyperopt.results_file)) == 5
+
+    # Results file replaced - index no longer matches
+    hyperopt.results_file.write_bytes(hyperopt.results_file.read_bytes()[index[1]["offset"] :])
+    index2 = HyperoptTools._read_results_index(hyperopt.results_file)
+    assert log_has_re(r"Index for .* does not match results file, rebuilding\.", caplog)
+    assert [e["current_epoch"] for e in index2] == [2, 3, 4, 5]
+
+    hyperopt.clean_hyperopt()
+    assert not hyperopt.results_file.is_file()
+    assert not index_file.is_file()
+
+
+def test_results_index_concurrent_reader(hyperopt, tmp_path, mocker) -> None:
+    hyperopt.results_file = tmp_path / "ut_results.fthypt"
+    index_file = HyperoptTools.get_index_filename(hyperopt.results_file)
+    epochs = [
+        {"loss": 10 - i, "current_epoch": i + 1, "is_best": False, "results_metrics": {}}
+        for i in range(3)
+    ]
+    hyperopt._save_result(epochs[0])
+
+    append_index_entry = HyperoptTools.append_index_entry
+    read_index = []
+
+    def append_after_read(results_file, entry):
+        # Reader catches up between result write and index append
+        read_index.append(HyperoptTools._read_results_index(results_file))
+        append_index_entry(results_file, entry)
+
+    mocker.patch.object(HyperoptTools, "append_index_entry", side_effect=append_after_read)
+    hyperopt._save_result(epochs[1])
+    hyperopt._save_result(epochs[2])
+
+    assert [len(i) for i in read_index] == [2, 3]
+    index = HyperoptTools._read_results_index(hyperopt.results_file)
+    assert [e["current_epoch"] for e in index] == [1, 2, 3]
+    assert len(index_file.read_bytes().splitlines()) == 3
+
+    # Duplicate entries are dropped
+    lines = index_file.read_bytes().splitlines(keepends=True)
+    index_file.write_bytes(b"".join(lines + lines[2:]))
+    assert HyperoptTools._read_results_index(hyperopt.results_file) == index
+    assert index_file.read_bytes().splitlines(keepends=True) == lines
+
+    # Missing entries are rebuilt
+    index_file.write_bytes(lines[0] + lines[2])
+    assert HyperoptTools._read_results_index(hyperopt.results_file) == index
+    assert index_file.read_bytes().splitlines(keepends=True) == lines
 
 
 def test_load_previous_results2(mocker, testdatadir, caplog) -> None:
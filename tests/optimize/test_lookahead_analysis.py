@@ -1,15 +1,21 @@
 # pragma pylint: disable=missing-docstring, W0212, line-too-long, C0103, unused-argument
+import pickle
 from copy import deepcopy
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, PropertyMock
 
+import numpy as np
 import pytest
+from pandas import DataFrame
 
 from freqtrade.commands.optimize_commands import start_lookahead_analysis
+from freqtrade.data import history
 from freqtrade.data.history import get_timerange
 from freqtrade.exceptions import OperationalException
 from freqtrade.optimize.analysis.lookahead import Analysis, LookaheadAnalysis
 from freqtrade.optimize.analysis.lookahead_helpers import LookaheadAnalysisSubFunctions
+from freqtrade.optimize.base_analysis import BaseAnalysis, VarHolder
 from tests.conftest import EXMS, get_args, log_has_re, patch_exchange
 
 
@@ -483,6 +489,92 @@ def test_biased_strategy(lookahead_conf, mocker, caplog, scenario) -> None:
         assert instance.current_analysis.has_bias
 
 
+def test_lookahead_reuses_loaded_data(lookahead_conf, mocker) -> None:
+    patch_exchange(mocker)
+    mocker.patch("freqtrade.data.history.get_timerange", get_timerange)
+    mocker.patch(f"{EXMS}.get_fee", return_value=0.0)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(
+        "freqtrade.plugins.pairlistmanager.PairListManager.whitelist",
+        PropertyMock(return_value=["UNITTEST/BTC"]),
+    )
+    mocker.patch(
+        "freqtrade.strategy.hyper.HyperStrategyMixin.load_params_from_file",
+        return_value={"params": {"buy": {"scenario": "bias1"}}},
+    )
+    load_mock = mocker.spy(history, "load_data")
+    lookahead_conf["timeframe"] = "5m"
+    lookahead_conf["timerange"] = "20180119-20180122"
+
+    instance = LookaheadAnalysis(lookahead_conf, {"name": "strategy_test_v3_with_lookahead_bias"})
+    instance.start()
+
+    assert instance.current_analysis.has_bias
+    assert instance.current_analysis.total_signals > 0
+    # Partial backtests slice the data of the full backtest
+    assert load_mock.call_count == 1
+    assert (
+        instance.entry_varHolders[0].data["UNITTEST/BTC"]["date"].iloc[0]
+        == instance.full_varHolder.data["UNITTEST/BTC"]["date"].iloc[0]
+    )
+
+
+class _SliceAnalysis(BaseAnalysis):
+    """
+    Analysis which only slices the preloaded data - usable in worker processes,
+    which don't share the mocks of the test.
+    """
+
+    def prepare_data(self, varholder: VarHolder, pairs_to_load: list[str]) -> None:
+        preloaded = self.get_preloaded_data(varholder)
+        varholder.data = {
+            pair: preloaded[pair].iloc[: varholder.startup_candle].copy() for pair in pairs_to_load
+        }
+        varholder.timeframe = str(self.exchange is None)
+        varholder.compared = self._data_file
+
+
+def test_prepare_data_parallel(lookahead_conf) -> None:
+    lookahead_conf["analysis_jobs"] = 2
+    instance = _SliceAnalysis(lookahead_conf, {"name": "strat", "class": MagicMock()})
+    instance.exchange = MagicMock()
+    instance.full_varHolder.from_dt = datetime(2022, 1, 1, tzinfo=timezone.utc)
+    instance.full_varHolder.to_dt = datetime(2022, 2, 1, tzinfo=timezone.utc)
+    instance._raw_data = {
+        "UNITTEST/USDT": DataFrame({"close": np.arange(100, dtype=np.float64)}),
+        "ETH/USDT": DataFrame({"close": np.arange(100, 200, dtype=np.float64)}),
+    }
+
+    # Only configuration is pickled for the workers
+    state = pickle.loads(pickle.dumps(instance))  # noqa: S301
+    assert state.exchange is None
+    assert state._raw_data is None
+    assert state.strategy_obj == {"name": "strat"}
+    assert state.full_varHolder.from_dt == instance.full_varHolder.from_dt
+
+    jobs = []
+    for pair, rows in [("UNITTEST/USDT", 10), ("ETH/USDT", 20), ("UNITTEST/USDT", 30)]:
+        varholder = VarHolder()
+        varholder.from_dt = instance.full_varHolder.from_dt
+        varholder.to_dt = instance.full_varHolder.to_dt
+        varholder.startup_candle = rows
+        jobs.append((varholder, [pair]))
+    result = instance.prepare_data_parallel(jobs)
+
+    assert [list(v.data) for v in result] == [["UNITTEST/USDT"], ["ETH/USDT"], ["UNITTEST/USDT"]]
+    assert result[1].data["ETH/USDT"]["close"].tolist() == list(range(100, 120))
+    assert len(result[2].data["UNITTEST/USDT"]) == 30
+    # Workers start without exchange, and load the raw data from the temporary dump
+    assert all(v.timeframe == "True" for v in result)
+    data_file = result[0].compared
+    assert data_file.name == "analysis_tickerdata.pkl"
+    assert data_file.parent.name.startswith("ft_analysis_")
+    assert not data_file.parent.exists()
+    assert instance._data_file is None
+    assert instance.exchange is not None
+
+
 def test_config_overrides(lookahead_conf):
     lookahead_conf["max_open_trades"] = 0
     lookahead_conf["dry_run_wallet"] = 1
@@ -0,0 +1,71 @@
+import pandas as pd
+
+from freqtrade.configuration import TimeRange
+from freqtrade.rpc.analyzed_history import AnalyzedHistory, AnalyzedHistoryCache
+from freqtrade.util import dt_now
+
+
+def _history(timerange: str, startup_candles: int = 10) -> AnalyzedHistory:
+    tr = TimeRange.parse_timerange(timerange)
+    start = pd.Timestamp(tr.startdt or pd.Timestamp("2018-01-01", tz="UTC"))
+    start -= pd.Timedelta(minutes=5 * startup_candles)
+    end = pd.Timestamp(tr.stopdt or pd.Timestamp("2018-02-01", tz="UTC"))
+    df = pd.DataFrame({"date": pd.date_range(start, end, freq="5min")})
+    df["close"] = 1.0
+    return AnalyzedHistory(df, tr, startup_candles, dt_now())
+
+
+def test_analyzed_history_covers():
+    entry = _history("20180110-20180120")
+    assert entry.covers(TimeRange.parse_timerange("20180110-20180120"))
+    assert entry.covers(TimeRange.parse_timerange("20180112-20180115"))
+    assert not entry.covers(TimeRange.parse_timerange("20180109-20180115"))
+    assert not entry.covers(TimeRange.parse_timerange("20180112-20180121"))
+    assert not entry.covers(TimeRange.parse_timerange("20180112-"))
+    assert not entry.covers(TimeRange.parse_timerange("-20180115"))
+
+    open_entry = _history("20180110-")
+    assert open_entry.covers(TimeRange.parse_timerange("20180112-"))
+    assert open_entry.covers(TimeRange.parse_timerange("20180112-20180115"))
+    assert not open_entry.covers(TimeRange.parse_timerange("-20180115"))
+
+
+def test_analyzed_history_slice():
+    entry = _history("20180110-20180120")
+    df = entry.slice(TimeRange.parse_timerange("20180110-20180120"))
+    # Startup candles are removed
+    assert df.iloc[0]["date"] == pd.Timestamp("2018-01-10", tz="UTC")
+    assert df.iloc[-1]["date"] == pd.Timestamp("2018-01-20", tz="UTC")
+
+    df = entry.slice(TimeRange.parse_timerange("20180112-20180115"))
+    assert df.iloc[0]["date"] == pd.Timestamp("2018-01-12", tz="UTC")
+    assert df.iloc[-1]["date"] == pd.Timestamp("2018-01-15", tz="UTC")
+    assert len(df) == 3 * 288 + 1
+
+    # Not enough candles for the startup period
+    short = AnalyzedHistory(entry.dataframe.iloc[:5], entry.timerange, 10, dt_now())
+    assert short.slice(TimeRange.parse_timerange("20180110-20180120")).empty
+
+
+def test_analyzed_history_cache():
+    entry = _history("20180110-20180120")
+    cache = AnalyzedHistoryCache(max_bytes=entry.nbytes * 2)
+    key = ("strategy_hash", "ETH/BTC", "5m", "spot")
+    cache.put(key, entry)
+    assert len(cache) == 1
+    assert cache.get(key, TimeRange.parse_timerange("20180112-20180115")) is entry
+    assert cache.get(key, TimeRange.parse_timerange("20180109-20180115")) is None
+    assert cache.get(("other", "ETH/BTC", "5m", "spot"), entry.timerange) is None
+
+    # Too large for the cache
+    cache.put(key, _history("20170110-20180120"))
+    assert len(cache) == 1
+
+    # Evicted by size
+    cache.put(key, _history("20180111-20180121"))
+    cache.put(key, _history("20180112-20180122"))
+    assert len(cache) == 2
+    assert cache.get(key, TimeRange.parse_timerange("20180110-20180120")) is None
+
+    cache.clear()
+    assert len(cache) == 0
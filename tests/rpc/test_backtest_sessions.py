@@ -0,0 +1,117 @@
+from copy import deepcopy
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from freqtrade.exchange.funding_fees import FundingFeeIndex
+from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.resolvers import StrategyResolver
+from freqtrade.rpc.api_server import backtest_sessions
+from freqtrade.rpc.api_server.backtest_sessions import (
+    BacktestSession,
+    BacktestSessionCache,
+    _publish_progress,
+    get_session_key,
+    run_backtest_job,
+)
+from tests.conftest import CURRENT_TEST_STRATEGY, EXMS, log_has_re, patch_exchange
+
+
+def _session(rows: int) -> BacktestSession:
+    df = pd.DataFrame({"close": np.ones(rows)})
+    return BacktestSession(MagicMock(detail_data={}, futures_data={}), {"ETH/BTC": df}, None)
+
+
+def test_backtest_session_cache(caplog):
+    size = _session(1000).nbytes
+    sessions = BacktestSessionCache(max_bytes=size * 2)
+    sessions.put("a", _session(1000))
+    sessions.put("b", _session(1000))
+    assert len(sessions) == 2
+    assert sessions.nbytes == size * 2
+
+    # Access moves "a" to the end - so "b" is released first.
+    assert sessions.get("a") is not None
+    sessions.put("c", _session(1000))
+    assert "b" not in sessions
+    assert "a" in sessions
+    assert "c" in sessions
+    assert log_has_re(r"Releasing backtest data for b\.", caplog)
+    assert sessions.get("b") is None
+
+    # The latest session is kept, even if it exceeds the limit on its own.
+    sessions.put("d", _session(5000))
+    assert len(sessions) == 1
+    assert "d" in sessions
+
+    sessions.clear()
+    assert len(sessions) == 0
+
+
+def test_backtest_session_futures_data():
+    df = pd.DataFrame({"close": np.ones(1000)})
+    funding = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=500, freq="8h", tz="UTC"),
+            "open_fund": np.full(500, 0.0001),
+            "open_mark": np.full(500, 100.0),
+        }
+    )
+    futures_data = {"ETH/USDT:USDT": FundingFeeIndex(funding)}
+    assert futures_data["ETH/USDT:USDT"].nbytes == 500 * 8 + 501 * 8 * 2
+
+    session = BacktestSession(
+        MagicMock(detail_data={}, futures_data=futures_data), {"ETH/USDT:USDT": df}, None
+    )
+    assert session.nbytes == _session(1000).nbytes + futures_data["ETH/USDT:USDT"].nbytes
+
+
+def test_run_backtest_job(default_conf, mocker, testdatadir, fee, tmp_path):
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    default_conf.update(
+        {
+            "datadir": testdatadir,
+            "user_data_dir": tmp_path,
+            "timeframe": "5m",
+            "timerange": "20180110-20180111",
+            "export": "none",
+            "backtest_cache": "none",
+        }
+    )
+    state: dict = {}
+    sessions = BacktestSessionCache(max_bytes=1024**3)
+    mocker.patch.object(backtest_sessions, "_worker_state", state)
+    mocker.patch.object(backtest_sessions, "_worker_sessions", sessions)
+    load_mock = mocker.spy(Backtesting, "load_bt_data")
+    try:
+        res = run_backtest_job("job1", deepcopy(default_conf))
+        assert CURRENT_TEST_STRATEGY in res["strategy"]
+        assert state["job1"]["step"] == "backtest"
+        assert 0 < state["job1"]["progress"] <= 1
+        assert len(sessions) == 1
+        assert load_mock.call_count == 1
+
+        # Different stake - data is reused.
+        default_conf["stake_amount"] = 0.002
+        res2 = run_backtest_job("job2", deepcopy(default_conf))
+        assert CURRENT_TEST_STRATEGY in res2["strategy"]
+        assert len(sessions) == 1
+        assert load_mock.call_count == 1
+
+        # Different timerange - new session.
+        default_conf["timerange"] = "20180110-20180112"
+        run_backtest_job("job3", deepcopy(default_conf))
+        assert len(sessions) == 2
+        assert load_mock.call_count == 2
+
+        # Abort requests are passed on to the running backtest
+        strategy = StrategyResolver.load_strategy(deepcopy(default_conf))
+        session = sessions.get(get_session_key(default_conf, strategy))
+        assert session is not None
+        state[("abort", "job4")] = True
+        _publish_progress("job4", session.bt)
+        assert session.bt.abort is True
+    finally:
+        Backtesting.cleanup()
@@ -4,7 +4,9 @@ Unit test file for rpc/api_server.py
 
 import asyncio
 import logging
+import shutil
 import time
+from concurrent.futures import Future
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import ANY, MagicMock, PropertyMock
@@ -20,6 +22,8 @@ from requests.auth import _basic_auth_str
 from sqlalchemy import select
 
 from freqtrade.__init__ import __version__
+from freqtrade.constants import BT_RESULT_INDEX_FN
+from freqtrade.data.history import load_data
 from freqtrade.enums import CandleType, RunMode, State, TradingMode
 from freqtrade.exceptions import DependencyException, ExchangeError, OperationalException
 from freqtrade.loggers import setup_logging, setup_logging_pre
@@ -30,6 +34,7 @@ from freqtrade.rpc.api_server import ApiServer
 from freqtrade.rpc.api_server.api_auth import create_token, get_user_from_token
 from freqtrade.rpc.api_server.uvicorn_threaded import UvicornServer
 from freqtrade.rpc.api_server.webserver_bgwork import ApiBG
+from freqtrade.strategy import IStrategy
 from freqtrade.util.datetime_helpers import format_date
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
@@ -2137,6 +2142,7 @@ def test_api_pair_candles(botclient, ohlcv_history):
 def test_api_pair_history(botclient, tmp_path, mocker):
     _ftbot, client = botclient
     _ftbot.config["user_data_dir"] = tmp_path
+    RPC._analyzed_history.clear()
 
     timeframe = "5m"
     lfm = mocker.patch("freqtrade.strategy.interface.IStrategy.load_freqAI_model")
@@ -2284,6 +2290,64 @@ def test_api_pair_history(botclient, tmp_path, mocker):
     assert result["columns"] == ["date", "open", "high", "low", "close", "volume", "__date_ts"]
 
 
+def test_api_pair_history_cached(botclient, tmp_path, mocker):
+    _ftbot, client = botclient
+    _ftbot.config["user_data_dir"] = tmp_path
+    _ftbot.config["runmode"] = RunMode.WEBSERVER
+    mocker.patch("freqtrade.strategy.interface.IStrategy.load_freqAI_model")
+    RPC._analyzed_history.clear()
+    load_mock = mocker.patch("freqtrade.rpc.rpc.load_data", wraps=load_data)
+    analyze_mock = mocker.spy(IStrategy, "analyze_ticker")
+
+    def get_history(timerange: str, columnar: bool = False):
+        rc = client_post(
+            client,
+            f"{BASE_URI}/pair_history",
+            data={
+                "pair": "UNITTEST/BTC",
+                "timeframe": "5m",
+                "timerange": timerange,
+                "strategy": CURRENT_TEST_STRATEGY,
+                "columns": ["rsi"],
+                "columnar": columnar,
+            },
+        )
+        assert_response(rc, 200)
+        return rc.json()
+
+    result = get_history("20180111-20180113")
+    assert result["length"] == 577
+    assert result["columnar"] is False
+    assert load_mock.call_count == 1
+    assert analyze_mock.call_count == 1
+    assert len(RPC._analyzed_history) == 1
+
+    # Narrower timerange is served from the analyzed dataframe
+    cached = get_history("20180111-20180112", columnar=True)
+    assert load_mock.call_count == 1
+    assert analyze_mock.call_count == 1
+    assert cached["columnar"] is True
+    assert cached["length"] == 289
+    assert len(cached["data"]) == len(cached["columns"])
+    assert all(len(col) == 289 for col in cached["data"])
+    assert cached["data_start"] == "2018-01-11 00:00:00+00:00"
+    assert cached["data_stop"] == "2018-01-12 00:00:00+00:00"
+
+    # Identical to the freshly analyzed result
+    RPC._analyzed_history.clear()
+    fresh = get_history("20180111-20180112")
+    assert load_mock.call_count == 2
+    assert analyze_mock.call_count == 2
+    assert fresh["columns"] == cached["columns"]
+    assert fresh["data"] == [list(row) for row in zip(*cached["data"], strict=True)]
+
+    # Wider timerange is analyzed again
+    get_history("20180110-20180112")
+    assert load_mock.call_count == 3
+    assert len(RPC._analyzed_history) == 2
+    RPC._analyzed_history.clear()
+
+
 def test_api_pair_history_live_mode(botclient, tmp_path, mocker):
     _ftbot, client = botclient
     _ftbot.config["user_data_dir"] = tmp_path
@@ -2790,6 +2854,8 @@ def test_api_backtesting(botclient, mocker, fee, caplog, tmp_path):
         assert result["status_msg"] == "Backtest ended"
         assert result["progress"] == 1
         assert result["backtest_result"]
+        # Loaded data is kept for following backtests
+        assert len(ApiBG.bt_sessions) == 1
 
         rc = client_get(client, f"{BASE_URI}/backtest/abort")
         assert_response(rc)
@@ -2859,6 +2925,7 @@ def test_api_backtesting(botclient, mocker, fee, caplog, tmp_path):
         assert result["status"] == "reset"
         assert not result["running"]
         assert result["status_msg"] == "Backtest reset"
+        assert len(ApiBG.bt_sessions) == 0
 
         # Disallow base64 strategies
         data["strategy"] = "xx:cHJpbnQoImhlbGxvIHdvcmxkIik="
@@ -2868,13 +2935,102 @@ def test_api_backtesting(botclient, mocker, fee, caplog, tmp_path):
         Backtesting.cleanup()
 
 
-def test_api_backtest_history(botclient, mocker, testdatadir):
+def test_api_backtest_jobs(botclient, mocker):
+    ftbot, client = botclient
+    ftbot.config["runmode"] = RunMode.WEBSERVER
+    futures: list[Future] = []
+
+    def submit(job_id, btconfig):
+        assert btconfig["dry_run"] is True
+        assert btconfig["timerange"] == "20180110-20180111"
+        futures.append(Future())
+        return futures[-1]
+
+    pool = MagicMock(
+        submit=MagicMock(side_effect=submit),
+        progress=MagicMock(return_value={"step": "backtest", "progress": 0.5, "trade_count": 2}),
+    )
+    mocker.patch("freqtrade.rpc.api_server.api_backtest.BacktestWorkerPool", return_value=pool)
+    data = {
+        "strategy": CURRENT_TEST_STRATEGY,
+        "timeframe": "5m",
+        "timerange": "20180110-20180111",
+        "max_open_trades": 3,
+        "stake_amount": 100,
+        "dry_run_wallet": 1000,
+        "enable_protections": False,
+    }
+    try:
+        job_ids = []
+        for _ in range(2):
+            rc = client_post(client, f"{BASE_URI}/backtest/jobs", data=data)
+            assert_response(rc)
+            job_ids.append(rc.json()["job_id"])
+        # Both jobs run concurrently
+        assert pool.submit.call_count == 2
+
+        rc = client_get(client, f"{BASE_URI}/backtest/jobs/{job_ids[0]}")
+        assert_response(rc)
+        result = rc.json()
+        assert result["status"] == "running"
+        assert result["running"]
+        assert result["step"] == "backtest"
+        assert result["progress"] == 0.5
+        assert result["trade_count"] == 2
+
+        rc = client_get(client, f"{BASE_URI}/background/{job_ids[0]}")
+        assert_response(rc)
+        assert rc.json()["job_category"] == "backtest"
+        assert rc.json()["progress"] == 0.5
+
+        rc = client_delete(client, f"{BASE_URI}/backtest/jobs/{job_ids[0]}")
+        assert rc.json()["status"] == "running"
+
+        rc = client_get(client, f"{BASE_URI}/backtest/jobs/{job_ids[1]}/abort")
+        assert_response(rc)
+        assert rc.json()["status"] == "stopping"
+        pool.abort.assert_called_once_with(job_ids[1])
+
+        futures[0].set_result({"strategy": {CURRENT_TEST_STRATEGY: {}}})
+        futures[1].set_exception(DependencyException("Stop requested"))
+
+        rc = client_get(client, f"{BASE_URI}/backtest/jobs/{job_ids[0]}")
+        result = rc.json()
+        assert result["status"] == "ended"
+        assert not result["running"]
+        assert result["progress"] == 1
+        assert result["backtest_result"] == {"strategy": {CURRENT_TEST_STRATEGY: {}}}
+
+        rc = client_get(client, f"{BASE_URI}/backtest/jobs/{job_ids[1]}")
+        result = rc.json()
+        assert result["status"] == "error"
+        assert result["status_msg"] == "Backtest failed with Stop requested"
+
+        rc = client_get(client, f"{BASE_URI}/backtest/jobs/{job_ids[1]}/abort")
+        assert rc.json()["status"] == "not_running"
+
+        rc = client_delete(client, f"{BASE_URI}/backtest/jobs/{job_ids[0]}")
+        assert_response(rc)
+        assert rc.json()["status"] == "reset"
+        pool.release.assert_called_once_with(job_ids[0])
+
+        rc = client_get(client, f"{BASE_URI}/backtest/jobs/{job_ids[0]}")
+        assert_response(rc, 404)
+    finally:
+        ApiBG.bt_pool = None
+
+
+def test_api_backtest_history(botclient, mocker, testdatadir, tmp_path: Path):
     ftbot, client = botclient
+    bt_results_base = tmp_path / "backtest_results"
+    bt_results_base.mkdir()
+    for fn in testdatadir.glob("backtest_results/backtest-result*.json"):
+        shutil.copy(fn, bt_results_base / fn.name)
     mocker.patch(
         "freqtrade.data.btanalysis.bt_fileutils._get_backtest_files",
         return_value=[
-            testdatadir / "backtest_results/backtest-result_multistrat.json",
-            testdatadir / "backtest_results/backtest-result.json",
+            bt_results_base / "backtest-result_multistrat.json",
+            bt_results_base / "backtest-result.json",
         ],
     )
 
@@ -2882,13 +3038,14 @@ def test_api_backtest_history(botclient, mocker, testdatadir):
     assert_response(rc, 503)
     assert rc.json()["detail"] == "Bot is not in the correct state."
 
-    ftbot.config["user_data_dir"] = testdatadir
+    ftbot.config["user_data_dir"] = tmp_path
     ftbot.config["runmode"] = RunMode.WEBSERVER
 
     rc = client_get(client, f"{BASE_URI}/backtest/history")
     assert_response(rc)
     result = rc.json()
     assert len(result) == 3
+    assert (bt_results_base / BT_RESULT_INDEX_FN).is_file()
     fn = result[0]["filename"]
     assert fn == "backtest-result_multistrat"
     assert result[0]["notes"] == ""
@@ -155,9 +155,34 @@ def test_send_msg_webhook_CustomMessagetype(mocker, default_conf, caplog) -> Non
 
     assert "webhook" in [mod.name for mod in rpc_manager.registered_modules]
     rpc_manager.send_msg({"type": RPCMessageType.STARTUP, "status": "TestMessage"})
+    # Webhooks are sent from a background queue - wait for it
+    rpc_manager.cleanup()
     assert log_has("Message type 'startup' not implemented by handler webhook.", caplog)
 
 
+def test_forward_batch_webhook(mocker, default_conf, caplog) -> None:
+    default_conf["telegram"]["enabled"] = False
+    default_conf["webhook"] = {"enabled": True, "url": "https://DEADBEEF.com"}
+    send_mock = mocker.patch(
+        "freqtrade.rpc.webhook.Webhook.send_msg", MagicMock(side_effect=[ValueError, None])
+    )
+    batch_mock = mocker.patch("freqtrade.rpc.webhook.Webhook.send_batch")
+    rpc_manager = RPCManager(get_patched_freqtradebot(mocker, default_conf))
+    webhook = rpc_manager.registered_modules[0]
+
+    msgs = [
+        {"type": RPCMessageType.WARNING, "status": "Notifications dropped: 1"},
+        {"type": RPCMessageType.STATUS, "status": "TestMessage"},
+    ]
+    rpc_manager._forward_batch(webhook, msgs)
+    # Messages are forwarded one by one - a failing message doesn't drop the others
+    assert batch_mock.call_count == 0
+    assert send_mock.call_count == 2
+    assert send_mock.call_args[0][0] == msgs[1]
+    assert log_has("Exception occurred within RPC module webhook", caplog)
+    rpc_manager.cleanup()
+
+
 def test_startupmessages_telegram_enabled(mocker, default_conf) -> None:
     default_conf["telegram"]["enabled"] = True
     telegram_mock = mocker.patch("freqtrade.rpc.telegram.Telegram.send_msg", MagicMock())
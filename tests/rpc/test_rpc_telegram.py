@@ -6,6 +6,7 @@ import asyncio
 import logging
 import re
 import threading
+from collections import deque
 from datetime import timedelta
 from functools import reduce
 from random import choice, randint
@@ -17,7 +18,7 @@ import time_machine
 from pandas import DataFrame
 from sqlalchemy import select
 from telegram import Chat, Message, ReplyKeyboardMarkup, Update, User
-from telegram.error import BadRequest, NetworkError, TelegramError
+from telegram.error import BadRequest, NetworkError, RetryAfter, TelegramError
 
 from freqtrade import __version__
 from freqtrade.constants import CANCEL_REASON
@@ -36,7 +37,7 @@ from freqtrade.persistence import PairLocks, Trade
 from freqtrade.persistence.models import Order
 from freqtrade.rpc import RPC
 from freqtrade.rpc.rpc import RPCException
-from freqtrade.rpc.telegram import Telegram, authorized_only
+from freqtrade.rpc.telegram import TELEGRAM_MAX_PENDING, Telegram, authorized_only
 from freqtrade.util.datetime_helpers import dt_now
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
@@ -54,7 +55,7 @@ from tests.conftest import (
 
 @pytest.fixture(autouse=True)
 def mock_exchange_loop(mocker):
-    mocker.patch("freqtrade.exchange.exchange.Exchange._init_async_loop")
+    mocker.patch("freqtrade.exchange.exchange.Exchange.run_async")
 
 
 @pytest.fixture
@@ -2770,6 +2771,58 @@ async def test__send_msg_network_error(default_conf, mocker, caplog) -> None:
     assert log_has("Telegram NetworkError: Oh snap! Trying one more time.", caplog)
 
 
+async def test__send_msg_retry_after(default_conf, mocker, caplog) -> None:
+    mocker.patch("freqtrade.rpc.telegram.Telegram._init", MagicMock())
+    sleep_mock = mocker.patch("freqtrade.rpc.telegram.asyncio.sleep", AsyncMock())
+    bot = MagicMock()
+    bot.send_message = AsyncMock(side_effect=[RetryAfter(2), None])
+    telegram, _, _ = get_telegram_testobject(mocker, default_conf, mock=False)
+    telegram._app = MagicMock()
+    telegram._app.bot = bot
+
+    await telegram._send_msg("test")
+
+    assert bot.send_message.call_count == 2
+    sleep_mock.assert_called_once_with(2.0)
+    assert log_has("Telegram flood control! Retrying in 2.0 seconds.", caplog)
+
+
+def test_send_msg_burst(default_conf, mocker, caplog) -> None:
+    telegram, _, _ = get_telegram_testobject(mocker, default_conf)
+    schedule_mock = mocker.patch.object(telegram, "_schedule_send")
+    telegram._pending_sends = TELEGRAM_MAX_PENDING
+
+    for i in range(3):
+        telegram.send_msg({"type": RPCMessageType.STATUS, "status": f"msg {i}"})
+    telegram.send_msg({"type": RPCMessageType.WARNING, "status": "warning"})
+    assert schedule_mock.call_count == 0
+    assert len(telegram._outbox) == 4
+
+    # Waiting messages are joined once a send finished
+    telegram._message_sent(None)
+    schedule_mock.assert_called_once_with(
+        "*Status:* `msg 0`\n\n*Status:* `msg 1`\n\n*Status:* `msg 2`"
+        "\n\n\N{WARNING SIGN} *Warning:* `warning`",
+        False,
+    )
+    assert telegram._pending_sends == TELEGRAM_MAX_PENDING
+
+    telegram._message_sent(None)
+    assert schedule_mock.call_count == 1
+    assert telegram._pending_sends == TELEGRAM_MAX_PENDING - 1
+
+    # Dropped messages are reported
+    telegram._outbox = deque(maxlen=2)
+    telegram._pending_sends = TELEGRAM_MAX_PENDING
+    for i in range(3):
+        telegram.send_msg({"type": RPCMessageType.STATUS, "status": f"msg {i}"})
+    telegram._message_sent(None)
+    assert schedule_mock.call_args[0][0] == (
+        "Notifications dropped: 1\n\n*Status:* `msg 1`\n\n*Status:* `msg 2`"
+    )
+    assert log_has("Telegram outbox full - dropped 1 messages.", caplog)
+
+
 @pytest.mark.filterwarnings("ignore:.*ChatPermissions")
 async def test__send_msg_keyboard(default_conf, mocker, caplog) -> None:
     mocker.patch("freqtrade.rpc.telegram.Telegram._init", MagicMock())
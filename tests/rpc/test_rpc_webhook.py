@@ -477,3 +477,51 @@ def test_send_msg_discord(default_conf, mocker):
     assert "title" in msg_mock.call_args_list[0][0][0]["embeds"][0]
     assert "color" in msg_mock.call_args_list[0][0][0]["embeds"][0]
     assert "fields" in msg_mock.call_args_list[0][0][0]["embeds"][0]
+
+
+def test__send_msg_retry_after(default_conf, mocker, caplog):
+    default_conf["webhook"] = get_webhook_dict()
+    default_conf["webhook"]["retries"] = 1
+    webhook = Webhook(RPC(get_patched_freqtradebot(mocker, default_conf)), default_conf)
+    rate_limited = MagicMock(status_code=429, headers={"Retry-After": "2"})
+    rate_limited.raise_for_status.side_effect = RequestException("Too Many Requests")
+    post = MagicMock(side_effect=[rate_limited, MagicMock(status_code=200)])
+    mocker.patch("freqtrade.rpc.webhook.post", post)
+    sleep = mocker.patch("freqtrade.rpc.webhook.time.sleep")
+
+    webhook._send_msg({"text": "Hello"})
+    assert post.call_count == 2
+    sleep.assert_called_once_with(2.0)
+
+    # Invalid / too long delays
+    rate_limited.headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    assert webhook._get_retry_after(rate_limited) == webhook._retry_delay
+    rate_limited.headers = {"Retry-After": "3600"}
+    assert webhook._get_retry_after(rate_limited) == 60
+
+
+def test_send_batch_discord(default_conf, mocker, caplog):
+    default_conf["discord"] = {
+        "enabled": True,
+        "webhook_url": "https://webhookurl...",
+        "status": [{"Status": "{status}"}],
+        "warning": [{"Warning": "{missing_key}"}],
+    }
+    msg_mock = MagicMock()
+    mocker.patch("freqtrade.rpc.webhook.Webhook._send_msg", msg_mock)
+    discord = Discord(RPC(get_patched_freqtradebot(mocker, default_conf)), default_conf)
+    assert discord.blocking_send
+    assert discord.max_batch_size == 10
+
+    msgs = [{"type": RPCMessageType.STATUS, "status": f"status {i}"} for i in range(12)]
+    # Not configured, and failing messages are skipped
+    msgs.append({"type": RPCMessageType.STARTUP, "status": "startup"})
+    msgs.append({"type": RPCMessageType.WARNING, "status": "warning"})
+    discord.send_batch(msgs)
+
+    assert msg_mock.call_count == 2
+    embeds = msg_mock.call_args_list[0][0][0]["embeds"]
+    assert len(embeds) == 10
+    assert embeds[0]["fields"] == [{"name": "Status", "value": "status 0", "inline": True}]
+    assert len(msg_mock.call_args_list[1][0][0]["embeds"]) == 2
+    assert log_has("Could not create discord message for warning", caplog)
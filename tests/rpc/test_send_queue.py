@@ -0,0 +1,72 @@
+import threading
+
+from freqtrade.rpc.send_queue import SendQueue
+from tests.conftest import log_has
+
+
+def test_send_queue_batches():
+    sent = []
+    release = threading.Event()
+    started = threading.Event()
+
+    def send(batch):
+        started.set()
+        release.wait(5)
+        sent.append(batch)
+
+    queue = SendQueue("test", send, max_batch=3)
+    queue.put(1)
+    assert started.wait(5)
+    # Messages queued while the first one is sent are batched
+    for i in range(2, 7):
+        queue.put(i)
+    release.set()
+    assert queue.flush(5)
+    assert sent[0] == [1]
+    assert [msg for batch in sent for msg in batch] == [1, 2, 3, 4, 5, 6]
+    assert all(len(batch) <= 3 for batch in sent)
+    queue.close()
+    assert len(queue) == 0
+
+
+def test_send_queue_drops_oldest(caplog):
+    sent = []
+    release = threading.Event()
+    started = threading.Event()
+
+    def send(batch):
+        started.set()
+        release.wait(5)
+        sent.append(batch)
+
+    queue = SendQueue("test", send, maxsize=2, max_batch=5, summarize=lambda n: f"dropped {n}")
+    queue.put("a")
+    assert started.wait(5)
+    for msg in ("b", "c", "d"):
+        queue.put(msg)
+    release.set()
+    queue.close()
+
+    assert sent == [["a"], ["dropped 1", "c", "d"]]
+    assert log_has("Send queue test full - dropped 1 messages.", caplog)
+
+
+def test_send_queue_exception(caplog):
+    sent = []
+
+    def send(batch):
+        if batch == ["fail"]:
+            raise ValueError("boom")
+        sent.append(batch)
+
+    queue = SendQueue("test", send)
+    queue.put("fail")
+    queue.put("ok")
+    queue.close()
+    assert sent == [["ok"]]
+    assert log_has("Exception while sending messages from queue test", caplog)
+
+    # Closed queues don't accept messages anymore
+    queue.put("late")
+    assert len(queue) == 0
+    assert log_has("Send queue test closed - message not sent.", caplog)
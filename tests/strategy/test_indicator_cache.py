@@ -0,0 +1,134 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from freqtrade.resolvers import StrategyResolver
+from freqtrade.strategy import IntParameter
+from freqtrade.strategy.indicator_cache import (
+    IndicatorCache,
+    disable_indicator_cache,
+    enable_indicator_cache,
+    get_indicator_cache,
+)
+from freqtrade.strategy.parameters import trace_parameters
+
+
+def _strategy(default_conf):
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.ft_load_hyper_params()
+    return strategy
+
+
+def test_trace_parameters(default_conf):
+    strategy = _strategy(default_conf)
+    with trace_parameters() as outer:
+        _ = strategy.buy_rsi.value
+        with trace_parameters() as inner:
+            _ = strategy.sell_rsi.value
+    assert inner == {"sell_rsi": strategy.sell_rsi.value}
+    assert outer == {"buy_rsi": strategy.buy_rsi.value, "sell_rsi": strategy.sell_rsi.value}
+
+    # Reads outside of tracing are not recorded
+    _ = strategy.buy_plusdi.value
+    assert "buy_plusdi" not in outer
+
+
+def test_indicator_cache_traced(default_conf):
+    strategy = _strategy(default_conf)
+    cache = IndicatorCache()
+    func = MagicMock(side_effect=lambda: pd.Series(np.arange(10)) * strategy.buy_rsi.value)
+    buy_rsi = strategy.buy_rsi.value
+    try:
+        res = cache.get_or_calculate(("ETH/BTC", "ind"), strategy, func)
+        assert func.call_count == 1
+        assert res.iloc[-1] == 9 * buy_rsi
+
+        # Unrelated parameter changed - memoized
+        strategy.sell_rsi.value += 1
+        res2 = cache.get_or_calculate(("ETH/BTC", "ind"), strategy, func)
+        assert func.call_count == 1
+        pd.testing.assert_series_equal(res, res2)
+        # Results are copies
+        res2.iloc[-1] = -1
+        assert cache.get_or_calculate(("ETH/BTC", "ind"), strategy, func).iloc[-1] == 9 * buy_rsi
+
+        # Dependency changed - recalculated
+        strategy.buy_rsi.value = buy_rsi + 1
+        res = cache.get_or_calculate(("ETH/BTC", "ind"), strategy, func)
+        assert func.call_count == 2
+        assert res.iloc[-1] == 9 * (buy_rsi + 1)
+
+        # Both values are memoized
+        strategy.buy_rsi.value = buy_rsi
+        cache.get_or_calculate(("ETH/BTC", "ind"), strategy, func)
+        assert func.call_count == 2
+        assert cache.hits == 3
+        assert cache.misses == 2
+
+        # Other pair
+        cache.get_or_calculate(("XRP/BTC", "ind"), strategy, func)
+        assert func.call_count == 3
+        assert len(cache) == 3
+    finally:
+        strategy.buy_rsi.value = buy_rsi
+        strategy.sell_rsi.value -= 1
+
+
+def test_indicator_cache_declared(default_conf):
+    strategy = _strategy(default_conf)
+    cache = IndicatorCache()
+    func = MagicMock(return_value=pd.Series(np.ones(10)))
+
+    cache.get_or_calculate(("ETH/BTC", "ind"), strategy, func, depends_on=[strategy.buy_rsi])
+    cache.get_or_calculate(("ETH/BTC", "ind"), strategy, func, depends_on=[strategy.buy_rsi])
+    assert func.call_count == 1
+
+    # Parameters which are not part of the strategy are not memoized when traced
+    param = IntParameter(1, 10, default=5)
+    func = MagicMock(side_effect=lambda: pd.Series(np.ones(10)) * param.value)
+    cache.get_or_calculate(("ETH/BTC", "ind2"), strategy, func)
+    cache.get_or_calculate(("ETH/BTC", "ind2"), strategy, func)
+    assert func.call_count == 2
+
+
+def test_indicator_cache_size(default_conf):
+    strategy = _strategy(default_conf)
+    series = pd.Series(np.ones(1000))
+    cache = IndicatorCache(max_bytes=int(series.memory_usage(index=True)) * 2)
+    for pair in ("ETH/BTC", "XRP/BTC", "LTC/BTC"):
+        cache.get_or_calculate((pair, "ind"), strategy, lambda: series)
+    assert len(cache) == 2
+
+    # Too large for the cache
+    cache.get_or_calculate(("ETH/BTC", "large"), strategy, lambda: pd.Series(np.ones(5000)))
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_cached_indicator(default_conf, ohlcv_history):
+    strategy = _strategy(default_conf)
+    metadata = {"pair": "ETH/BTC"}
+    func = MagicMock(side_effect=lambda df: df["close"].rolling(strategy.buy_rsi.value).mean())
+
+    # Not memoized outside of hyperopt
+    disable_indicator_cache()
+    assert get_indicator_cache() is None
+    strategy.cached_indicator(ohlcv_history, metadata, "sma", func)
+    strategy.cached_indicator(ohlcv_history, metadata, "sma", func)
+    assert func.call_count == 2
+
+    enable_indicator_cache()
+    try:
+        res = strategy.cached_indicator(ohlcv_history, metadata, "sma", func)
+        res2 = strategy.cached_indicator(ohlcv_history, metadata, "sma", func)
+        assert func.call_count == 3
+        pd.testing.assert_series_equal(res, res2)
+
+        # Different candles
+        strategy.cached_indicator(ohlcv_history.iloc[:-1], metadata, "sma", func)
+        assert func.call_count == 4
+    finally:
+        disable_indicator_cache()
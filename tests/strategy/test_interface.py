@@ -1,12 +1,14 @@
 # pragma pylint: disable=missing-docstring, C0103
 import logging
 import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 from pandas import DataFrame, concat
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH
@@ -316,6 +318,27 @@ def test_advise_all_indicators_copy(mocker, default_conf, testdatadir) -> None:
     assert aimock.call_args_list[0][0][0] is not data
 
 
+def test_advise_all_indicators_executor(mocker, default_conf, testdatadir) -> None:
+    strategy = StrategyResolver.load_strategy(default_conf)
+    pairs = ["UNITTEST/BTC", "ETH/BTC", "LTC/BTC", "ADA/BTC"]
+    data = load_data(testdatadir, "5m", pairs, fill_up_missing=True)
+    expected = strategy.advise_all_indicators(data)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        processed = strategy.advise_all_indicators(data, executor=executor)
+    assert list(processed.keys()) == list(data.keys())
+    for pair in data:
+        assert_frame_equal(processed[pair], expected[pair])
+
+    aimock = mocker.patch(
+        "freqtrade.strategy.interface.IStrategy.advise_indicators", side_effect=lambda df, _: df
+    )
+    strategy.advise_all_indicators(data, copy=False)
+    assert aimock.call_count == 4
+    # Input dataframes are passed on as they are
+    assert aimock.call_args_list[0][0][0] is data[pairs[0]]
+
+
 def test_min_roi_reached(default_conf, fee) -> None:
     # Use list to confirm sequence does not matter
     min_roi_list = [{20: 0.05, 55: 0.01, 0: 0.1}, {0: 0.1, 20: 0.05, 55: 0.01}]
@@ -690,6 +713,27 @@ def test_custom_exit(default_conf, fee, caplog) -> None:
     assert log_has_re("Custom exit reason returned from custom_exit is too long.*", caplog)
 
 
+def test_ft_has_callback(default_conf) -> None:
+    strategy = StrategyResolver.load_strategy(default_conf)
+    # Implemented by the strategy class
+    assert strategy.ft_has_callback("leverage")
+    assert not strategy.ft_has_callback("custom_exit")
+    assert not strategy.ft_has_callback("confirm_trade_entry")
+    assert not strategy.ft_has_callback("check_entry_timeout")
+
+    # Replaced on the instance
+    strategy.confirm_trade_entry = MagicMock(return_value=False)
+    assert strategy.ft_has_callback("confirm_trade_entry")
+    assert not strategy.ft_has_callback("custom_exit")
+
+    # Legacy callback
+    strategy.custom_sell = MagicMock(return_value="legacy")
+    assert strategy.ft_has_callback("custom_exit")
+    strategy.check_buy_timeout = MagicMock(return_value=True)
+    assert strategy.ft_has_callback("check_entry_timeout")
+    assert not strategy.ft_has_callback("check_exit_timeout")
+
+
 def test_should_sell(default_conf, fee) -> None:
     strategy = StrategyResolver.load_strategy(default_conf)
     trade = Trade(
@@ -217,6 +217,39 @@ def test_merge_informative_pair_suffix_append_timeframe():
         merge_informative_pair(data, informative, "15m", "1h", suffix="suf")
 
 
+@pytest.mark.parametrize("ffill", [True, False])
+@pytest.mark.parametrize(
+    "timeframe,timeframe_inf,start_inf",
+    [("15m", "1h", "2020-01-01"), ("5m", "4h", "2019-12-31"), ("1h", "1h", "2020-01-02")],
+)
+def test_merge_informative_pair_matches_merge(ffill, timeframe, timeframe_inf, start_inf):
+    data = generate_test_data(timeframe, 500, "2020-01-01")
+    # Gaps in the base data
+    data = data.drop(index=[20, 21, 22, 100]).reset_index(drop=True)
+    data["bool_col"] = data["close"] > data["open"]
+    informative = generate_test_data(timeframe_inf, 100, start_inf)
+    informative["rsi"] = np.where(informative.index % 7 == 0, np.nan, informative["close"])
+    informative["int_col"] = np.arange(len(informative))
+
+    result = merge_informative_pair(data, informative, timeframe, timeframe_inf, ffill=ffill)
+
+    # Reference: the plain pandas merge
+    expected_inf = informative.copy()
+    shift = pd.Timedelta(timeframe_inf) - pd.Timedelta(timeframe)
+    expected_inf["date_merge"] = expected_inf["date"] + shift
+    expected_inf.columns = [f"{col}_{timeframe_inf}" for col in expected_inf.columns]
+    merge_col = f"date_merge_{timeframe_inf}"
+    if ffill:
+        expected = pd.merge_ordered(
+            data, expected_inf, fill_method="ffill", left_on="date", right_on=merge_col, how="left"
+        )
+    else:
+        expected = pd.merge(data, expected_inf, left_on="date", right_on=merge_col, how="left")
+    expected = expected.drop(merge_col, axis=1)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
 @pytest.mark.parametrize(
     "side,profitrange",
     [
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pytest
 
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 
@@ -17,3 +18,93 @@ def test_crossed_numpy_types():
     assert qtpylib.crossed_above(series, np.int32(60)).equals(expected_result)
     assert qtpylib.crossed_above(series, np.int64(60)).equals(expected_result)
     assert qtpylib.crossed_above(series, np.float64(60.0)).equals(expected_result)
+
+
+def _heikinashi_loop(bars):
+    # Loop based implementation, as in the original qtpylib source
+    bars = bars.copy()
+    bars["ha_close"] = (bars["open"] + bars["high"] + bars["low"] + bars["close"]) / 4
+    bars.at[0, "ha_open"] = (bars.at[0, "open"] + bars.at[0, "close"]) / 2
+    for i in range(1, len(bars)):
+        bars.at[i, "ha_open"] = (bars.at[i - 1, "ha_open"] + bars.at[i - 1, "ha_close"]) / 2
+    return bars["ha_open"], bars["ha_close"]
+
+
+def _rsi_loop(series, window=14):
+    # Loop based implementation, as in the original qtpylib source
+    deltas = np.diff(series)
+    seed = deltas[: window + 1]
+    ups = seed[seed > 0].sum() / window
+    downs = -seed[seed < 0].sum() / window
+    rsival = np.zeros_like(series)
+    rsival[:window] = 100.0 - 100.0 / (1.0 + ups / downs)
+    for i in range(window, len(series)):
+        delta = deltas[i - 1]
+        if delta > 0:
+            upval = delta
+            downval = 0
+        else:
+            upval = 0
+            downval = -delta
+        ups = (ups * (window - 1) + upval) / window
+        downs = (downs * (window - 1.0) + downval) / window
+        rsival[i] = 100.0 - 100.0 / (1.0 + ups / downs)
+    return rsival
+
+
+def _random_bars(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    close = 100 + np.cumsum(rng.normal(0, 1, rows))
+    open_ = close + rng.normal(0, 0.5, rows)
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + rng.uniform(0, 1, rows),
+            "low": np.minimum(open_, close) - rng.uniform(0, 1, rows),
+            "close": close,
+        }
+    )
+
+
+def test_heikinashi_matches_loop():
+    bars = _random_bars(2000)
+    ha = qtpylib.heikinashi(bars)
+    ha_open, ha_close = _heikinashi_loop(bars)
+    np.testing.assert_array_equal(ha["open"].to_numpy(), ha_open.to_numpy())
+    np.testing.assert_array_equal(ha["close"].to_numpy(), ha_close.to_numpy())
+    assert (ha["high"] >= ha[["open", "close"]].max(axis=1)).all()
+    assert (ha["low"] <= ha[["open", "close"]].min(axis=1)).all()
+
+    # Missing candles propagate, as in the loop
+    bars.loc[1500, "close"] = np.nan
+    ha = qtpylib.heikinashi(bars)
+    ha_open, _ = _heikinashi_loop(bars)
+    np.testing.assert_array_equal(ha["open"].to_numpy(), ha_open.to_numpy())
+    assert ha["open"].iloc[1501:].isna().all()
+
+    assert qtpylib.heikinashi(bars.iloc[:0]).empty
+
+
+@pytest.mark.parametrize("window", [2, 14, 30])
+def test_rsi_matches_loop(window):
+    series = _random_bars(2000)["close"]
+    np.testing.assert_allclose(qtpylib.rsi(series, window), _rsi_loop(series, window), rtol=1e-10)
+    np.testing.assert_allclose(
+        qtpylib.rsi(series.iloc[:window], window), _rsi_loop(series.iloc[:window], window)
+    )
+
+    series.iloc[1000] = np.nan
+    np.testing.assert_allclose(qtpylib.rsi(series, window), _rsi_loop(series, window), rtol=1e-10)
+
+
+def test_numpy_rolling_chunked(mocker):
+    series = _random_bars(5000)["close"]
+    expected_std = qtpylib.rolling_std(series, 20)
+    expected_mean = qtpylib.rolling_mean(series, 20)
+    np.testing.assert_allclose(expected_std, series.rolling(20).std(), rtol=1e-8)
+    np.testing.assert_allclose(expected_mean, series.rolling(20).mean(), rtol=1e-8)
+
+    # Identical results, independent of the chunk size
+    mocker.patch.object(qtpylib, "ROLLING_CHUNK_ELEMENTS", 100)
+    np.testing.assert_array_equal(qtpylib.rolling_std(series, 20), expected_std)
+    np.testing.assert_array_equal(qtpylib.rolling_mean(series, 20), expected_mean)